@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# File: backup_engine.py
+# Path: ProjectHimalaya/backup_engine.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: Parallel, resumable, content-addressed backups for the repository reset
+
+"""
+Project Himalaya Backup Engine
+
+This module backs up files into a content-addressed store shared by all backups.
+Each file is stored once under objects/ by its SHA-256 digest. A backup is its
+manifest.json, which records the digest, size, mode and modification time of every
+file, so content unchanged since an earlier backup costs no bytes. Restore puts
+the files back from the store using the manifest.
+
+Where the filesystem supports reflinks (FICLONE), the files are also cloned into
+the backup directory, with the mode and modification time from the manifest, so
+the backup can be browsed. A clone shares no inode with the store and costs no
+bytes until it is changed. Elsewhere nothing is copied into the backup directory.
+
+The store remembers the size, modification time and digest of every file it has
+backed up, so an unchanged file is not stored again. Its object is hashed before
+it is trusted, and an object that no longer matches its digest is stored again
+from the source. Objects are read-only and the store is private to its owner.
+
+Files are backed up by a thread pool. Each finished file is appended to a journal
+in the backup directory; a backup interrupted part way is resumed from it, and
+manifest.json replaces the journal once the backup is complete. A file that cannot
+be read is listed as skipped in the manifest rather than failing the backup.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl request number for FICLONE on Linux (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+class BackupEngine:
+    """Backs up files in parallel into a deduplicating object store."""
+
+    Version = 1
+    ManifestName = "manifest.json"
+    JournalName = "manifest.partial.jsonl"
+    ChunkSize = 1024 * 1024
+
+    def __init__(self, StoreDir: Path, Jobs: int = 8):
+        """Initialize the backup engine.
+
+        Args:
+            StoreDir: Directory holding the objects shared by all backups
+            Jobs: Number of files backed up or restored at once
+        """
+        self.StoreDir = Path(StoreDir)
+        self.ObjectDir = self.StoreDir / "objects"
+        self.FilesPath = self.StoreDir / "files.json"
+        self.Jobs = max(1, Jobs)
+        self.Lock = threading.Lock()
+        self.Known = {}     # Absolute path -> [size, mtime_ns, digest]
+        self.Journal = None
+        self.Cloning = True   # Cleared once the backup directory turns out not to support reflinks
+        self.Counts = {"stored": 0, "deduplicated": 0, "resumed": 0, "repaired": 0, "skipped": 0, "reflink": 0}
+        self.BytesStored = 0
+        self.BytesDeduplicated = 0
+        self.BytesRead = 0
+        self.BytesWritten = 0
+        self.TotalFiles = 0
+        self.TotalBytes = 0
+        self.Elapsed = 0.0
+        self.StoreDir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.ObjectDir.mkdir(exist_ok=True)
+
+        try:
+            with open(self.FilesPath, 'r', encoding='utf-8') as f:
+                Index = json.load(f)
+        except (OSError, ValueError):
+            Index = {}
+        if Index.get("version") == self.Version:
+            self.Known = Index.get("files", {})
+
+    def ObjectPath(self, Digest: str) -> Path:
+        """Path of the object holding some content."""
+        return self.ObjectDir / Digest[:2] / Digest
+
+    def IsComplete(self, BackupDir: Path) -> bool:
+        """Check whether a backup directory holds a finished backup."""
+        return (Path(BackupDir) / self.ManifestName).exists()
+
+    def IsResumable(self, BackupDir: Path) -> bool:
+        """Check whether a backup directory holds an interrupted backup."""
+        return (Path(BackupDir) / self.JournalName).exists() and not self.IsComplete(BackupDir)
+
+    def ListFiles(self, SourceRoot: Path, Paths: list) -> list:
+        """Expand files and directories below SourceRoot to the relative paths of the files in them."""
+        Files = []
+        for RelativePath in Paths:
+            SourcePath = SourceRoot / RelativePath
+            if SourcePath.is_file():
+                Files.append(Path(RelativePath).as_posix())
+            elif SourcePath.is_dir():
+                for DirPath, DirNames, FileNames in os.walk(SourcePath):
+                    DirNames.sort()
+                    for Name in sorted(FileNames):
+                        FilePath = Path(DirPath) / Name
+                        if FilePath.is_file():
+                            Files.append(FilePath.relative_to(SourceRoot).as_posix())
+        return Files
+
+    #
+    # Objects
+    #
+
+    def FileDigest(self, FilePath: Path) -> str:
+        """Return the SHA-256 digest of a file."""
+        Digest = hashlib.sha256()
+        with open(FilePath, 'rb') as f:
+            for Chunk in iter(lambda: f.read(self.ChunkSize), b""):
+                Digest.update(Chunk)
+        return Digest.hexdigest()
+
+    def CopyFile(self, Source: Path, Target: Path) -> str:
+        """Copy a file while hashing it and return the digest of what was copied."""
+        Digest = hashlib.sha256()
+        try:
+            with open(Source, 'rb') as Src, open(Target, 'wb') as Dst:
+                for Chunk in iter(lambda: Src.read(self.ChunkSize), b""):
+                    Digest.update(Chunk)
+                    Dst.write(Chunk)
+        except BaseException:
+            try:
+                Target.unlink()
+            except OSError:
+                pass
+            raise
+        return Digest.hexdigest()
+
+    def TryReflink(self, Source: Path, Target: Path) -> bool:
+        """Clone the source into the target with FICLONE if the filesystem supports it."""
+        if fcntl is None:
+            return False
+
+        try:
+            with open(Source, 'rb') as Src, open(Target, 'wb') as Dst:
+                fcntl.ioctl(Dst.fileno(), FICLONE, Src.fileno())
+            return True
+        except OSError:
+            try:
+                Target.unlink()
+            except OSError:
+                pass
+            return False
+
+    def StoreObject(self, SourcePath: Path) -> tuple:
+        """Copy a file into the store while hashing it; return (digest, whether it was new)."""
+        Temporary = self.ObjectDir / f".{os.getpid()}.{threading.get_ident()}"
+        Digest = self.CopyFile(SourcePath, Temporary)
+
+        ObjectPath = self.ObjectPath(Digest)
+        if ObjectPath.exists():
+            Temporary.unlink()
+            return Digest, False
+        ObjectPath.parent.mkdir(exist_ok=True)
+        os.chmod(Temporary, 0o444)
+        os.replace(Temporary, ObjectPath)
+        return Digest, True
+
+    def IsObjectIntact(self, Digest: str) -> bool:
+        """Check that an object exists and still has its digest."""
+        try:
+            return self.FileDigest(self.ObjectPath(Digest)) == Digest
+        except FileNotFoundError:
+            return False
+
+    def RemoveObject(self, Digest: str) -> None:
+        """Remove an object whose content no longer matches its digest."""
+        try:
+            self.ObjectPath(Digest).unlink()
+        except FileNotFoundError:
+            pass
+
+    def ApplyMetadata(self, FilePath: Path, Entry: dict) -> None:
+        """Give a file the mode and modification time recorded in its manifest entry."""
+        os.chmod(FilePath, Entry["mode"])
+        os.utime(FilePath, ns=(Entry["mtime_ns"], Entry["mtime_ns"]))
+
+    #
+    # Backup
+    #
+
+    def BackupFile(self, SourceRoot: Path, RelativePath: str, BackupDir: Path) -> dict:
+        """Back up one file and return its manifest entry."""
+        SourcePath = SourceRoot / RelativePath
+        AbsolutePath = str(SourcePath.resolve())
+        Stat = SourcePath.stat()
+        Read = Written = 0
+
+        # A remembered object is trusted only while it still has its digest
+        Known = self.Known.get(AbsolutePath)
+        Unchanged = bool(Known) and Known[:2] == [Stat.st_size, Stat.st_mtime_ns]
+        Repaired = False
+        if Unchanged:
+            Read += Stat.st_size
+            Repaired = not self.IsObjectIntact(Known[2])
+        if Unchanged and not Repaired:
+            Digest, IsNew = Known[2], False
+        else:
+            if Repaired:
+                self.RemoveObject(Known[2])
+            Digest, IsNew = self.StoreObject(SourcePath)
+            Read += Stat.st_size
+            Written += Stat.st_size
+
+        Entry = {"digest": Digest, "size": Stat.st_size, "mode": Stat.st_mode & 0o7777, "mtime_ns": Stat.st_mtime_ns}
+
+        # Browsable copies are only made where they cost no bytes
+        Cloned = False
+        if self.Cloning:
+            Destination = BackupDir / RelativePath
+            Destination.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                Destination.unlink()
+            except FileNotFoundError:
+                pass
+            Cloned = self.TryReflink(self.ObjectPath(Digest), Destination)
+            if Cloned:
+                self.ApplyMetadata(Destination, Entry)
+            else:
+                self.Cloning = False
+
+        with self.Lock:
+            self.BytesRead += Read
+            self.BytesWritten += Written
+            self.Known[AbsolutePath] = [Stat.st_size, Stat.st_mtime_ns, Digest]
+            if Repaired:
+                self.Counts["repaired"] += 1
+            if Cloned:
+                self.Counts["reflink"] += 1
+            if IsNew:
+                self.Counts["stored"] += 1
+                self.BytesStored += Stat.st_size
+            else:
+                self.Counts["deduplicated"] += 1
+                self.BytesDeduplicated += Stat.st_size
+            self.Journal.write(json.dumps([RelativePath, Entry]) + "\n")
+            self.Journal.flush()
+        return Entry
+
+    def TryBackupFile(self, SourceRoot: Path, RelativePath: str, BackupDir: Path) -> tuple:
+        """Back up one file; return (entry, None), or (None, error) if it could not be backed up."""
+        try:
+            return self.BackupFile(SourceRoot, RelativePath, BackupDir), None
+        except OSError as Ex:
+            return None, str(Ex)
+
+    def LoadJournal(self, BackupDir: Path) -> dict:
+        """Read the entries of the files an interrupted backup already finished."""
+        Entries = {}
+        try:
+            with open(BackupDir / self.JournalName, 'r', encoding='utf-8') as f:
+                for Line in f:
+                    try:
+                        RelativePath, Entry = json.loads(Line)
+                    except ValueError:
+                        continue    # A line cut short by the interruption
+                    Entries[RelativePath] = Entry
+        except OSError:
+            pass
+        return Entries
+
+    def Backup(self, SourceRoot: Path, Paths: list, BackupDir: Path) -> dict:
+        """Back up files and directories below SourceRoot into BackupDir.
+
+        If BackupDir holds an interrupted backup, the files it finished are kept
+        as long as they have not changed since. Files that cannot be read, such as
+        ones deleted while the backup runs, are listed under "skipped".
+
+        Args:
+            SourceRoot: Directory the paths are relative to
+            Paths: Files and directories to back up
+            BackupDir: Directory for this backup
+
+        Returns:
+            The manifest, which is also written to BackupDir/manifest.json
+        """
+        SourceRoot = Path(SourceRoot)
+        BackupDir = Path(BackupDir)
+        BackupDir.mkdir(parents=True, exist_ok=True)
+        Start = time.perf_counter()
+        self.Cloning = True
+
+        Files = {}
+        for RelativePath, Entry in self.LoadJournal(BackupDir).items():
+            try:
+                Stat = (SourceRoot / RelativePath).stat()
+            except OSError:
+                continue
+            if [Stat.st_size, Stat.st_mtime_ns] == [Entry["size"], Entry["mtime_ns"]] \
+                    and self.ObjectPath(Entry["digest"]).exists():
+                Files[RelativePath] = Entry
+        self.Counts["resumed"] = len(Files)
+        Pending = [RelativePath for RelativePath in self.ListFiles(SourceRoot, Paths) if RelativePath not in Files]
+
+        Skipped = {}
+        with open(BackupDir / self.JournalName, 'a', encoding='utf-8') as self.Journal:
+            with ThreadPoolExecutor(max_workers=self.Jobs) as Pool:
+                for RelativePath, (Entry, Error) in zip(Pending, Pool.map(
+                        lambda RelativePath: self.TryBackupFile(SourceRoot, RelativePath, BackupDir), Pending)):
+                    if Entry is None:
+                        Skipped[RelativePath] = Error
+                    else:
+                        Files[RelativePath] = Entry
+        self.Journal = None
+        self.Counts["skipped"] = len(Skipped)
+        self.RemoveEmptyDirectories(BackupDir)
+
+        self.Elapsed = time.perf_counter() - Start
+        Manifest = {
+            "version": self.Version,
+            "source": str(SourceRoot.resolve()),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": dict(sorted(Files.items())),
+            "skipped": dict(sorted(Skipped.items())),
+        }
+        self.WriteJson(BackupDir / self.ManifestName, Manifest, Indent=1)
+        (BackupDir / self.JournalName).unlink()
+        self.WriteJson(self.FilesPath, {"version": self.Version, "files": self.Known})
+        self.TotalFiles = len(Files)
+        self.TotalBytes = sum(Entry["size"] for Entry in Files.values())
+        return Manifest
+
+    def RemoveEmptyDirectories(self, BackupDir: Path) -> None:
+        """Remove the directories left empty below BackupDir where files were not cloned."""
+        for DirPath, DirNames, FileNames in os.walk(BackupDir, topdown=False):
+            if Path(DirPath) != BackupDir:
+                try:
+                    os.rmdir(DirPath)
+                except OSError:
+                    pass    # Not empty
+
+    #
+    # Restore
+    #
+
+    def RestoreFile(self, RelativePath: str, Entry: dict, TargetDir: Path) -> None:
+        """Put one file back from the store, checking its content against the manifest."""
+        Destination = TargetDir / RelativePath
+        Destination.parent.mkdir(parents=True, exist_ok=True)
+        Temporary = Destination.with_name(f".{Destination.name}.{os.getpid()}.{threading.get_ident()}")
+        ObjectPath = self.ObjectPath(Entry["digest"])
+        try:
+            if self.TryReflink(ObjectPath, Temporary):
+                Digest = self.FileDigest(Temporary)
+            else:
+                Digest = self.CopyFile(ObjectPath, Temporary)
+            if Digest != Entry["digest"]:
+                raise OSError(f"Stored content of {RelativePath} does not match its digest")
+            self.ApplyMetadata(Temporary, Entry)
+            os.replace(Temporary, Destination)
+        except BaseException:
+            try:
+                Temporary.unlink()
+            except OSError:
+                pass
+            raise
+
+    def Restore(self, BackupDir: Path, TargetDir: Path) -> dict:
+        """Restore every file in a finished backup below TargetDir.
+
+        Args:
+            BackupDir: Directory holding the backup's manifest.json
+            TargetDir: Directory the files are restored into
+
+        Returns:
+            Relative path -> error for the files that could not be restored
+
+        Raises:
+            OSError, ValueError: The manifest is missing or unreadable
+        """
+        with open(Path(BackupDir) / self.ManifestName, 'r', encoding='utf-8') as f:
+            Files = json.load(f)["files"]
+        TargetDir = Path(TargetDir)
+
+        def TryRestoreFile(Item):
+            try:
+                self.RestoreFile(*Item, TargetDir)
+                return None
+            except OSError as Ex:
+                return str(Ex)
+
+        with ThreadPoolExecutor(max_workers=self.Jobs) as Pool:
+            Errors = list(Pool.map(TryRestoreFile, Files.items()))
+        return {RelativePath: Error for RelativePath, Error in zip(Files, Errors) if Error is not None}
+
+    def WriteJson(self, FilePath: Path, Data: dict, Indent: Optional[int] = None) -> None:
+        """Write a JSON file atomically."""
+        Temporary = FilePath.with_name(f".{FilePath.name}.{os.getpid()}")
+        with open(Temporary, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(Data, indent=Indent))
+        os.replace(Temporary, FilePath)
+
+    def Summary(self) -> str:
+        """Describe what the last backup did and how fast."""
+        Rate = self.TotalBytes / 1048576 / self.Elapsed if self.Elapsed > 0 else 0.0
+        return (f"{self.TotalFiles} files, {self.TotalBytes} bytes in {self.Elapsed:.2f}s ({Rate:.1f} MB/s): "
+                f"{self.Counts['stored']} stored, {self.Counts['deduplicated']} deduplicated, "
+                f"{self.Counts['resumed']} resumed, {self.Counts['repaired']} repaired, "
+                f"{self.Counts['skipped']} skipped, {self.Counts['reflink']} reflinked into the backup; "
+                f"{self.BytesStored} bytes stored, {self.BytesDeduplicated} bytes deduplicated, "
+                f"{self.BytesRead} bytes read, {self.BytesWritten} bytes written")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# File: batch_generate.py
+# Path: ProjectHimalaya/batch_generate.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: Generates many Project Himalaya sites from a single config catalog
+
+"""
+Project Himalaya Batch Site Generator
+
+This script generates one documentation site per catalog entry, for example one site
+per component (DocumentManager, StateManager, TaskManager, ...). The catalog is either
+a JSONL file with one site config per line or a YAML file containing a list of site
+configs. Each entry may be a site name, a flat site config or an object of the form:
+
+    {"name": "DocumentManager", "output": "sites/document-manager", "config": {...}}
+
+The catalog is checked before anything is generated: every entry must resolve to
+its own output directory, so names that slugify alike (e.g. "My Site" and
+"my-site") are reported rather than written over each other.
+
+Configuration-independent templates are rendered once and shared by every worker,
+sites are streamed from the catalog into a process pool, and each site is written
+into its own output directory.
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import yaml
+import argparse
+import contextlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from generate_config import ConfigGenerator
+
+# Pre-rendered static artifacts, set once per worker process
+SharedContent = {}
+
+def InitWorker(Content: dict) -> None:
+    """Store the shared static artifacts in the worker process."""
+    global SharedContent
+    SharedContent = Content
+
+def Slugify(Name: str) -> str:
+    """Convert a site name to a directory name."""
+    Slug = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '-', Name)
+    Slug = re.sub(r'[^A-Za-z0-9]+', '-', Slug).strip('-').lower()
+    return Slug or "site"
+
+def ReadCatalog(CatalogPath: str):
+    """Yield site entries from a JSONL or YAML catalog."""
+    CatalogFile = Path(CatalogPath)
+
+    if CatalogFile.suffix.lower() in (".yml", ".yaml"):
+        with open(CatalogFile, 'r') as f:
+            Entries = yaml.safe_load(f) or []
+        if not isinstance(Entries, list):
+            raise ValueError(f"Catalog {CatalogPath} must contain a list of site configs")
+        yield from Entries
+        return
+
+    with open(CatalogFile, 'r') as f:
+        for LineNumber, Line in enumerate(f, 1):
+            Line = Line.strip()
+            if not Line or Line.startswith("#"):
+                continue
+            try:
+                yield json.loads(Line)
+            except ValueError as Ex:
+                raise ValueError(f"{CatalogPath}:{LineNumber}: invalid JSON: {Ex}")
+
+def ResolveSite(Entry: dict, OutputRoot: Path) -> tuple:
+    """Resolve a catalog entry to (name, output directory, site config)."""
+    if isinstance(Entry, str):
+        Entry = {"name": Entry}
+    if not isinstance(Entry, dict):
+        raise ValueError(f"expected a site name or config, not {type(Entry).__name__}")
+
+    if "config" in Entry:
+        SiteConfig = Entry["config"]
+        if not isinstance(SiteConfig, dict):
+            raise ValueError(f"config must be a mapping, not {type(SiteConfig).__name__}")
+        Name = Entry.get("name") or SiteConfig.get("title", "site")
+        Output = Entry.get("output")
+    else:
+        SiteConfig = Entry
+        Name = Entry.get("name") or Entry.get("title", "site")
+        Output = Entry.get("output")
+
+    Config = {**ConfigGenerator.DefaultConfig, **SiteConfig}
+    Config.pop("name", None)
+    Config.pop("output", None)
+
+    OutputDir = Path(Output) if Output else OutputRoot / Slugify(Name)
+    return Name, str(OutputDir), Config
+
+def GenerateSite(Name: str, OutputDir: str, Config: dict) -> dict:
+    """Generate a single site inside a worker process."""
+    Start = time.perf_counter()
+
+    # Per-site progress output would interleave across workers
+    with contextlib.redirect_stdout(io.StringIO()):
+        Generator = ConfigGenerator(OutputDir, Config, SharedContent)
+        Written = Generator.GenerateAll(Jobs=1)
+
+    Bytes = sum((Path(OutputDir) / FileName).stat().st_size for FileName in Written)
+    return {
+        "name": Name,
+        "output": OutputDir,
+        "files": len(Written),
+        "bytes": Bytes,
+        "seconds": time.perf_counter() - Start
+    }
+
+class BatchGenerator:
+    """Generates every site in a catalog on a worker pool."""
+
+    def __init__(self, CatalogPath: str, OutputRoot: str = "sites", Jobs: int = None):
+        """Initialize the batch generator."""
+        self.CatalogPath = CatalogPath
+        self.OutputRoot = Path(OutputRoot)
+        self.Jobs = max(1, Jobs or os.cpu_count() or 1)
+
+    def CheckCatalog(self) -> int:
+        """Check every catalog entry and its output directory; return the number of sites.
+
+        Raises:
+            ValueError: An entry is malformed, or two entries share an output directory
+        """
+        Owners = {}
+        Count = 0
+        for Count, Entry in enumerate(ReadCatalog(self.CatalogPath), 1):
+            try:
+                Name, OutputDir, _ = ResolveSite(Entry, self.OutputRoot)
+            except ValueError as Ex:
+                raise ValueError(f"{self.CatalogPath}: entry {Count}: {Ex}")
+
+            Key = os.path.normcase(os.path.abspath(OutputDir))
+            if Key in Owners:
+                raise ValueError(f"{self.CatalogPath}: entries {Owners[Key]!r} and {Name!r} "
+                                 f"both write to {OutputDir}")
+            Owners[Key] = Name
+        return Count
+
+    def Run(self) -> bool:
+        """Generate all sites and print per-site timing and a throughput summary."""
+        print(f"Generating sites from catalog: {self.CatalogPath}")
+        print(f"Output root: {self.OutputRoot}")
+        print(f"Workers: {self.Jobs}")
+        print(f"Sites: {self.CheckCatalog()}")
+        print("")
+
+        # Render configuration-independent templates once for all sites
+        with contextlib.redirect_stdout(io.StringIO()):
+            Shared = ConfigGenerator(self.OutputRoot).RenderStaticArtifacts()
+
+        Start = time.perf_counter()
+        Results = []
+        Failures = []
+
+        with ProcessPoolExecutor(max_workers=self.Jobs, initializer=InitWorker, initargs=(Shared,)) as Pool:
+            Running = {}
+            Catalog = iter(ReadCatalog(self.CatalogPath))
+            Exhausted = False
+
+            while Running or not Exhausted:
+                # Keep a bounded window of sites in flight
+                while not Exhausted and len(Running) < self.Jobs * 2:
+                    try:
+                        Entry = next(Catalog)
+                    except StopIteration:
+                        Exhausted = True
+                        break
+                    Name, OutputDir, Config = ResolveSite(Entry, self.OutputRoot)
+                    Running[Pool.submit(GenerateSite, Name, OutputDir, Config)] = Name
+
+                if not Running:
+                    break
+
+                Done, _ = wait(Running, return_when=FIRST_COMPLETED)
+                for Future in Done:
+                    Name = Running.pop(Future)
+                    try:
+                        Result = Future.result()
+                    except Exception as Ex:
+                        Failures.append(Name)
+                        print(f"  FAILED  {Name}: {str(Ex)}")
+                        continue
+
+                    Results.append(Result)
+                    print(f"  {Result['seconds'] * 1000:8.1f} ms  {Result['name']} -> {Result['output']} ({Result['files']} files)")
+
+        Elapsed = time.perf_counter() - Start
+        TotalFiles = sum(Result["files"] for Result in Results)
+        TotalBytes = sum(Result["bytes"] for Result in Results)
+        Rate = len(Results) / Elapsed if Elapsed > 0 else 0.0
+
+        print("")
+        print(f"Generated {len(Results)} sites ({TotalFiles} files, {TotalBytes / 1024:.1f} KiB) in {Elapsed:.2f}s")
+        print(f"Throughput: {Rate:.1f} sites/s, {TotalFiles / Elapsed if Elapsed > 0 else 0.0:.1f} files/s")
+        if Failures:
+            print(f"Failed: {len(Failures)} sites ({', '.join(Failures)})")
+
+        return not Failures
+
+def Main():
+    """Main entry point for the script."""
+    Parser = argparse.ArgumentParser(description="Generate many Project Himalaya sites from a config catalog")
+    Parser.add_argument("CatalogPath", metavar="CATALOG", help="Path to a JSONL or YAML catalog of site configs")
+    Parser.add_argument("--output-root", dest="OutputRoot", default="sites", help="Directory for per-site output when an entry has no output")
+    Parser.add_argument("--jobs", dest="Jobs", type=int, default=None, help="Number of worker processes (default: CPU count)")
+
+    Args = Parser.parse_args()
+
+    try:
+        Batch = BatchGenerator(Args.CatalogPath, Args.OutputRoot, Args.Jobs)
+        Success = Batch.Run()
+        sys.exit(0 if Success else 1)
+
+    except Exception as Ex:
+        print(f"Error: {str(Ex)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    Main()
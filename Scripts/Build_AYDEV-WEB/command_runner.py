@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# File: command_runner.py
+# Path: ProjectHimalaya/command_runner.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:30PM
+# Description: Shared, timed command execution layer for the website scripts
+
+"""
+Project Himalaya Command Runner
+
+This module is the single place where the website scripts spawn external commands.
+CommandRunner runs commands, records the wall time of each one, and runs independent
+read-only queries concurrently.
+"""
+
+import time
+import threading
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+class CommandRunner:
+    """Runs commands and records how long each one took."""
+
+    def __init__(self, Cwd: Path, Jobs: int = 4):
+        """Initialize the command runner.
+
+        Args:
+            Cwd: Default working directory for commands
+            Jobs: Maximum number of commands RunMany runs at once
+        """
+        self.Cwd = Path(Cwd)
+        self.Jobs = max(1, Jobs)
+        self.Timings = []
+        self.Lock = threading.Lock()
+
+    def Run(self, Command: List[str], Cwd: Optional[Path] = None) -> Tuple[int, str, str]:
+        """Run a command and return (return code, stdout, stderr)."""
+        Start = time.perf_counter()
+        try:
+            Process = subprocess.Popen(
+                Command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=str(Cwd or self.Cwd)
+            )
+            Stdout, Stderr = Process.communicate()
+            Result = (Process.returncode, Stdout.decode('utf-8'), Stderr.decode('utf-8'))
+        except Exception as Ex:
+            Result = (1, "", str(Ex))
+
+        self.RecordTiming(Command, Result[0], time.perf_counter() - Start)
+        return Result
+
+    def RunMany(self, Commands: List[List[str]], Cwd: Optional[Path] = None) -> List[Tuple[int, str, str]]:
+        """Run independent commands concurrently and return their results in order."""
+        if len(Commands) <= 1:
+            return [self.Run(Command, Cwd) for Command in Commands]
+
+        with ThreadPoolExecutor(max_workers=min(self.Jobs, len(Commands))) as Pool:
+            return list(Pool.map(lambda Command: self.Run(Command, Cwd), Commands))
+
+    def RecordTiming(self, Command: List[str], ReturnCode: int, Seconds: float) -> None:
+        """Record the wall time of a finished command."""
+        with self.Lock:
+            self.Timings.append((" ".join(str(Part) for Part in Command), ReturnCode, Seconds))
+
+    def TimingReport(self) -> str:
+        """Format the recorded command timings."""
+        Lines = []
+        for Command, ReturnCode, Seconds in self.Timings:
+            Lines.append(f"  {Seconds * 1000:8.1f} ms  [{ReturnCode}] {Command}")
+
+        Total = sum(Seconds for _, _, Seconds in self.Timings)
+        Lines.append(f"  {Total * 1000:8.1f} ms  total across {len(self.Timings)} commands")
+        return "\n".join(Lines)
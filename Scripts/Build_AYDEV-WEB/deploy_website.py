@@ -3,7 +3,7 @@
 # Path: ProjectHimalaya/deploy_website.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-28
-# Last Modified: 2025-03-28  3:45PM
+# Last Modified: 2026-10-17  11:45PM
 # Description: Deploys the Project Himalaya website to GitHub Pages
 
 """
@@ -14,12 +14,18 @@ It commits the website files to GitHub and triggers the GitHub Actions workflow.
 """
 
 import os
+import re
 import sys
-import subprocess
+import time
+import codecs
+import asyncio
 import argparse
 from pathlib import Path
 import json
 from datetime import datetime
+from contextlib import contextmanager
+
+from command_runner import CommandRunner
 
 class WebsiteDeployer:
     """Handles the deployment of the Project Himalaya website."""
@@ -27,6 +33,9 @@ class WebsiteDeployer:
     def __init__(self, RepoDir: str, CommitMessage: str = None):
         """Initialize the website deployer."""
         self.RepoDir = Path(RepoDir)
+        self.Runner = CommandRunner(self.RepoDir)
+        self.QueryCache = {}
+        self.PhaseTimings = []
         self.DocsDir = self.RepoDir / "docs"
         self.CommitMessage = CommitMessage or f"Update website: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         
@@ -40,21 +49,21 @@ class WebsiteDeployer:
     
     def RunCommand(self, Command: list, Cwd: Path = None) -> tuple:
         """Run a shell command and return the output."""
-        try:
-            Process = subprocess.Popen(
-                Command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(Cwd or self.RepoDir)
-            )
-            Stdout, Stderr = Process.communicate()
-            return Process.returncode, Stdout.decode('utf-8'), Stderr.decode('utf-8')
-        except Exception as Ex:
-            return 1, "", str(Ex)
+        return self.Runner.Run(Command, Cwd)
+    
+    def PrefetchQueries(self, Commands: list) -> None:
+        """Run independent read-only git queries concurrently and cache their results."""
+        for Command, Result in zip(Commands, self.Runner.RunMany(Commands)):
+            self.QueryCache[tuple(Command)] = Result
+    
+    def RunQuery(self, Command: list) -> tuple:
+        """Return a prefetched query result once, or run the query now."""
+        Result = self.QueryCache.pop(tuple(Command), None)
+        return Result if Result is not None else self.RunCommand(Command)
     
     def CheckGitStatus(self) -> tuple:
         """Check if there are uncommitted changes."""
-        ReturnCode, Stdout, Stderr = self.RunCommand(["git", "status", "--porcelain"])
+        ReturnCode, Stdout, Stderr = self.RunQuery(["git", "status", "--porcelain"])
         
         if ReturnCode != 0:
             return False, f"Failed to check Git status: {Stderr}"
@@ -122,6 +131,7 @@ class WebsiteDeployer:
             return False
         
         print("  Changes committed successfully")
+        self.ReportCommit(Stdout)
         return True
     
     def PushChanges(self) -> bool:
@@ -139,7 +149,7 @@ class WebsiteDeployer:
     
     def GetCurrentBranch(self) -> str:
         """Get the name of the current Git branch."""
-        ReturnCode, Stdout, Stderr = self.RunCommand(["git", "branch", "--show-current"])
+        ReturnCode, Stdout, Stderr = self.RunQuery(["git", "branch", "--show-current"])
         
         if ReturnCode != 0:
             print(f"Error getting current branch: {Stderr}")
@@ -152,12 +162,15 @@ class WebsiteDeployer:
         WorkflowPath = self.RepoDir / ".github" / "workflows" / "gh-pages.yml"
         return WorkflowPath.exists()
     
-    def Deploy(self) -> bool:
-        """Deploy the website by committing and pushing changes."""
-        print(f"Deploying Project Himalaya website from {self.RepoDir}")
-        
-        # Check current branch
-        CurrentBranch = self.GetCurrentBranch()
+    #
+    # Deployment Decisions
+    #
+    
+    # Deploy and DeployAsync gather their inputs differently but share these
+    # prompts and decisions, so the two paths behave the same
+    
+    def ConfirmPreflight(self, CurrentBranch: str, HasWorkflow: bool) -> bool:
+        """Report the branch and workflow checks and ask whether to proceed past any warning."""
         print(f"Current branch: {CurrentBranch}")
         
         if CurrentBranch != "main":
@@ -166,8 +179,7 @@ class WebsiteDeployer:
                 print("Deployment cancelled")
                 return False
         
-        # Check for GitHub Actions workflow
-        if not self.CheckGitHubActionsWorkflow():
+        if not HasWorkflow:
             print("Warning: GitHub Actions workflow file not found")
             print("Deployment may not automatically build the website")
             Proceed = input("Proceed with deployment anyway? (y/n): ")
@@ -175,15 +187,58 @@ class WebsiteDeployer:
                 print("Deployment cancelled")
                 return False
         
-        # Check for uncommitted changes
-        HasChanges, StatusOutput = self.CheckGitStatus()
+        return True
+    
+    def ReviewChanges(self, StatusResult: tuple):
+        """Report what `git status --porcelain` found.
         
-        if not HasChanges:
+        Returns:
+            None to go on deploying, or the result Deploy should return now
+        """
+        ReturnCode, StatusOutput, Stderr = StatusResult
+        if ReturnCode != 0:
+            print(f"Failed to check Git status: {Stderr}")
+            return False
+        
+        if not StatusOutput.strip():
             print("No changes to deploy")
             return True
         
         print("Changes to be deployed:")
         print(StatusOutput)
+        return None
+    
+    def ReportCommit(self, CommitOutput: str) -> None:
+        """Print the id of the new commit from the output of git commit."""
+        # git commit reports the new commit as "[branch abc1234] message"
+        Match = re.match(r"\[.*? ([0-9a-f]{7,})\]", CommitOutput)
+        if Match:
+            print(f"  Commit: {Match.group(1)}")
+    
+    def ReportSuccess(self) -> None:
+        """Print the closing message of a successful deployment."""
+        print("\nDeployment successful!")
+        print("\nGitHub Actions should now build and deploy the website.")
+        print("You can check the status of the deployment in the Actions tab of your GitHub repository.")
+        print("After deployment completes, the website will be available at your configured domain.")
+    
+    def Deploy(self) -> bool:
+        """Deploy the website by committing and pushing changes."""
+        print(f"Deploying Project Himalaya website from {self.RepoDir}")
+        
+        # Branch and status queries are independent, so run them together
+        self.PrefetchQueries([
+            ["git", "branch", "--show-current"],
+            ["git", "status", "--porcelain"]
+        ])
+        
+        if not self.ConfirmPreflight(self.GetCurrentBranch(), self.CheckGitHubActionsWorkflow()):
+            return False
+        
+        # Check for uncommitted changes
+        Result = self.ReviewChanges(self.RunQuery(["git", "status", "--porcelain"]))
+        if Result is not None:
+            return Result
         
         # Stage changes
         if not self.StageChanges():
@@ -202,11 +257,134 @@ class WebsiteDeployer:
         if not self.PushChanges():
             return False
         
-        print("\nDeployment successful!")
-        print("\nGitHub Actions should now build and deploy the website.")
-        print("You can check the status of the deployment in the Actions tab of your GitHub repository.")
-        print("After deployment completes, the website will be available at your configured domain.")
+        self.ReportSuccess()
+        return True
+
+    #
+    # Async Deployment
+    #
+    
+    async def RunCommandAsync(self, Command: list, Stream: bool = False) -> tuple:
+        """Run a command without blocking the event loop, optionally echoing output live."""
+        Start = time.perf_counter()
+        
+        try:
+            Process = await asyncio.create_subprocess_exec(
+                *Command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.RepoDir)
+            )
+        except Exception as Ex:
+            self.Runner.RecordTiming(Command, 1, time.perf_counter() - Start)
+            return 1, "", str(Ex)
         
+        async def ReadStream(Reader) -> str:
+            # Progress meters such as git push --progress redraw a line with a bare
+            # carriage return, so output is read in chunks and split on \r as well
+            Decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            Chunks = []
+            Pending = ""
+            while True:
+                Chunk = await Reader.read(4096)
+                Text = Decoder.decode(Chunk, final=not Chunk)
+                Chunks.append(Text)
+                if Stream:
+                    *Lines, Pending = re.split(r"\r\n|\r|\n", Pending + Text)
+                    for Line in Lines:
+                        if Line:
+                            print(f"  | {Line}", flush=True)
+                if not Chunk:
+                    break
+            if Stream and Pending:
+                print(f"  | {Pending}", flush=True)
+            return "".join(Chunks)
+        
+        Stdout, Stderr = await asyncio.gather(ReadStream(Process.stdout), ReadStream(Process.stderr))
+        ReturnCode = await Process.wait()
+        
+        self.Runner.RecordTiming(Command, ReturnCode, time.perf_counter() - Start)
+        return ReturnCode, Stdout, Stderr
+    
+    @contextmanager
+    def TimePhase(self, Name: str):
+        """Record the wall time of a deployment phase."""
+        Start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.PhaseTimings.append((Name, time.perf_counter() - Start))
+    
+    def PhaseReport(self) -> str:
+        """Format the per-phase timing breakdown."""
+        Lines = [f"  {Seconds * 1000:8.1f} ms  {Name}" for Name, Seconds in self.PhaseTimings]
+        Total = sum(Seconds for _, Seconds in self.PhaseTimings)
+        Lines.append(f"  {Total * 1000:8.1f} ms  total")
+        return "\n".join(Lines)
+    
+    async def DeployAsync(self) -> bool:
+        """Deploy the website with concurrent pre-flight checks and a single staging call."""
+        print(f"Deploying Project Himalaya website from {self.RepoDir} (async)")
+        self.PhaseTimings = []
+        
+        # Pre-flight checks are read-only and independent
+        with self.TimePhase("pre-flight checks"):
+            BranchResult, StatusResult, HasWorkflow = await asyncio.gather(
+                self.RunCommandAsync(["git", "branch", "--show-current"]),
+                self.RunCommandAsync(["git", "status", "--porcelain"]),
+                asyncio.to_thread(self.CheckGitHubActionsWorkflow)
+            )
+        
+        ReturnCode, Stdout, Stderr = BranchResult
+        if ReturnCode != 0:
+            print(f"Error getting current branch: {Stderr}")
+        CurrentBranch = Stdout.strip() if ReturnCode == 0 else "unknown"
+        
+        if not self.ConfirmPreflight(CurrentBranch, HasWorkflow):
+            return False
+        
+        Result = self.ReviewChanges(StatusResult)
+        if Result is not None:
+            return Result
+        
+        # Stage docs, workflow and README with one git add
+        with self.TimePhase("stage"):
+            Pathspecs = ["docs"]
+            if (self.RepoDir / ".github" / "workflows").exists():
+                Pathspecs.append(".github/workflows")
+            else:
+                print("  Warning: Workflow directory does not exist")
+            if (self.RepoDir / "README.md").exists():
+                Pathspecs.append("README.md")
+            else:
+                print("  Warning: README.md does not exist")
+            
+            print(f"Staging changes: {' '.join(Pathspecs)}")
+            ReturnCode, Stdout, Stderr = await self.RunCommandAsync(["git", "add", "--"] + Pathspecs, Stream=True)
+        
+        # Streamed commands have already echoed their error output
+        if ReturnCode != 0:
+            print("Error staging changes")
+            return False
+        
+        with self.TimePhase("commit"):
+            print(f"Committing changes with message: {self.CommitMessage}")
+            ReturnCode, Stdout, Stderr = await self.RunCommandAsync(["git", "commit", "-m", self.CommitMessage], Stream=True)
+        
+        if ReturnCode != 0:
+            print("Error committing changes")
+            return False
+        self.ReportCommit(Stdout)
+        
+        with self.TimePhase("push"):
+            print("Pushing changes to GitHub...")
+            ReturnCode, Stdout, Stderr = await self.RunCommandAsync(["git", "push", "--progress"], Stream=True)
+        
+        if ReturnCode != 0:
+            print("Error pushing changes")
+            return False
+        
+        self.ReportSuccess()
         return True
 
 def Main():
@@ -214,6 +392,7 @@ def Main():
     Parser = argparse.ArgumentParser(description="Deploy Project Himalaya website to GitHub Pages")
     Parser.add_argument("--repo", dest="RepoDir", default=".", help="Path to repository directory")
     Parser.add_argument("--message", dest="CommitMessage", help="Git commit message")
+    Parser.add_argument("--async", dest="Async", action="store_true", help="Run pre-flight checks concurrently and stream git output")
     
     Args = Parser.parse_args()
     
@@ -223,7 +402,18 @@ def Main():
             CommitMessage=Args.CommitMessage
         )
         
-        Success = Deployer.Deploy()
+        try:
+            if Args.Async:
+                Success = asyncio.run(Deployer.DeployAsync())
+            else:
+                Success = Deployer.Deploy()
+        finally:
+            if Deployer.PhaseTimings:
+                print("\nPhase timings:")
+                print(Deployer.PhaseReport())
+            print("\nCommand timings:")
+            print(Deployer.Runner.TimingReport())
+        
         sys.exit(0 if Success else 1)
     
     except Exception as Ex:
@@ -3,7 +3,7 @@
 # Path: ProjectHimalaya/generate_config.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-28
-# Last Modified: 2025-03-28  3:45PM
+# Last Modified: 2026-10-17  11:00PM
 # Description: Generates configuration files for Project Himalaya website
 
 """
@@ -11,41 +11,65 @@ Project Himalaya Configuration Generator
 
 This script generates all the necessary configuration files for the Project Himalaya website.
 It creates Jekyll configuration, GitHub Actions workflow, and essential content files.
+Independent artifacts are rendered in parallel and written in batches.
 """
 
 import os
 import json
 import yaml
+import hashlib
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+from render_engine import RenderEngine, RenderTask
+
 class ConfigGenerator:
     """Generates configuration files for Project Himalaya website."""
     
-    def __init__(self, OutputDir: str, ConfigData: dict = None):
-        """Initialize the configuration generator."""
+    # Files listed in the manifest, in install order
+    ArtifactFiles = [
+        "_config.yml",
+        "Gemfile",
+        "github-workflow.yml",
+        "index.md",
+        "404.md",
+        "docs-overview.md",
+        "components-overview.md",
+        "docs-readme.md",
+        "repo-readme.md"
+    ]
+    
+    # Default configuration if none provided
+    DefaultConfig = {
+        "title": "Project Himalaya",
+        "description": "A comprehensive framework for AI-human collaborative development",
+        "url": "https://projecthimalaya.com",
+        "repository": "CallMeChewy/ProjectHimalaya",
+        "author": "Herbert J. Bowers",
+        "theme": "just-the-docs",
+        "primary_color": "#4575b4"
+    }
+    
+    def __init__(self, OutputDir: str, ConfigData: dict = None, SharedContent: dict = None):
+        """Initialize the configuration generator.
+        
+        Args:
+            OutputDir: Directory to write the generated files to
+            ConfigData: Site configuration (default: DefaultConfig)
+            SharedContent: Pre-rendered static artifacts to reuse instead of rendering
+        """
         self.OutputDir = Path(OutputDir)
         self.OutputDir.mkdir(parents=True, exist_ok=True)
         
-        # Default configuration if none provided
-        self.Config = ConfigData if ConfigData else {
-            "title": "Project Himalaya",
-            "description": "A comprehensive framework for AI-human collaborative development",
-            "url": "https://projecthimalaya.com",
-            "repository": "CallMeChewy/ProjectHimalaya",
-            "author": "Herbert J. Bowers",
-            "theme": "just-the-docs",
-            "primary_color": "#4575b4"
-        }
+        self.Config = ConfigData if ConfigData else dict(self.DefaultConfig)
+        self.SharedContent = SharedContent or {}
         
         self.Timestamp = datetime.now().strftime("%B %d, %Y  %I:%M%p")
         self.Date = datetime.now().strftime("%Y-%m-%d")
     
-    def GenerateJekyllConfig(self) -> None:
-        """Generate Jekyll _config.yml file."""
-        print("Generating Jekyll configuration...")
-        
+    def RenderJekyllConfig(self) -> str:
+        """Render Jekyll _config.yml file."""
         ConfigData = {
             "title": self.Config["title"],
             "description": self.Config["description"],
@@ -140,19 +164,14 @@ class ConfigGenerator:
             "ga_tracking_anonymize_ip": True
         }
         
-        OutputPath = self.OutputDir / "_config.yml"
-        with open(OutputPath, 'w') as f:
-            f.write("# _config.yml\n")
-            f.write("# Jekyll configuration for Project Himalaya website\n\n")
-            f.write("# Site settings\n")
-            yaml.dump(ConfigData, f, sort_keys=False, default_flow_style=False)
-        
-        print(f"  Created: {OutputPath}")
+        Content = "# _config.yml\n"
+        Content += "# Jekyll configuration for Project Himalaya website\n\n"
+        Content += "# Site settings\n"
+        Content += yaml.dump(ConfigData, sort_keys=False, default_flow_style=False)
+        return Content
     
-    def GenerateGemfile(self) -> None:
-        """Generate Gemfile for Ruby dependencies."""
-        print("Generating Gemfile...")
-        
+    def RenderGemfile(self) -> str:
+        """Render Gemfile for Ruby dependencies."""
         GemfileContent = """source "https://rubygems.org"
 
 # Jekyll and plugins
@@ -183,16 +202,10 @@ gem "wdm", "~> 0.1.1", :platforms => [:mingw, :x64_mingw, :mswin]
 gem "http_parser.rb", "~> 0.6.0", :platforms => [:jruby]
 """
         
-        OutputPath = self.OutputDir / "Gemfile"
-        with open(OutputPath, 'w') as f:
-            f.write(GemfileContent)
-        
-        print(f"  Created: {OutputPath}")
+        return GemfileContent
     
-    def GenerateGitHubWorkflow(self) -> None:
-        """Generate GitHub Actions workflow file."""
-        print("Generating GitHub Actions workflow...")
-        
+    def RenderGitHubWorkflow(self) -> str:
+        """Render GitHub Actions workflow file."""
         WorkflowContent = """name: Build and deploy Jekyll site to GitHub Pages
 
 on:
@@ -254,16 +267,10 @@ jobs:
         uses: actions/deploy-pages@v2
 """
         
-        OutputPath = self.OutputDir / "github-workflow.yml"
-        with open(OutputPath, 'w') as f:
-            f.write(WorkflowContent)
-        
-        print(f"  Created: {OutputPath}")
+        return WorkflowContent
     
-    def GenerateHomepage(self) -> None:
-        """Generate homepage content."""
-        print("Generating homepage...")
-        
+    def RenderHomepage(self) -> str:
+        """Render homepage content."""
         HomepageContent = """---
 layout: home
 title: Project Himalaya
@@ -273,13 +280,13 @@ permalink: /
 ---
 
 # Project Himalaya
-{: .fs-9 }
+{{: .fs-9 }}
 
 A comprehensive framework demonstrating optimal AI-human collaboration, manifested through the development of practical applications that themselves leverage AI capabilities.
-{: .fs-6 .fw-300 }
+{{: .fs-6 .fw-300 }}
 
-[Get Started](#getting-started){: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 }
-[View on GitHub](https://github.com/{repository}){: .btn .fs-5 .mb-4 .mb-md-0 }
+[Get Started](#getting-started){{: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 }}
+[View on GitHub](https://github.com/{repository}){{: .btn .fs-5 .mb-4 .mb-md-0 }}
 
 ---
 
@@ -335,9 +342,9 @@ This website provides comprehensive documentation for Project Himalaya, includin
 
 ## Recent Updates
 
-{% for post in site.posts limit:3 %}
-- **{{ post.date | date: "%b %d, %Y" }}** - [{{ post.title }}]({{ post.url }})
-{% endfor %}
+{{% for post in site.posts limit:3 %}}
+- **{{{{ post.date | date: "%b %d, %Y" }}}}** - [{{{{ post.title }}}}]({{{{ post.url }}}})
+{{% endfor %}}
 
 ---
 
@@ -346,16 +353,10 @@ This website provides comprehensive documentation for Project Himalaya, includin
 — {author}
 """.format(repository=self.Config["repository"], author=self.Config["author"])
         
-        OutputPath = self.OutputDir / "index.md"
-        with open(OutputPath, 'w') as f:
-            f.write(HomepageContent)
-        
-        print(f"  Created: {OutputPath}")
+        return HomepageContent
     
-    def Generate404Page(self) -> None:
-        """Generate 404 error page."""
-        print("Generating 404 page...")
-        
+    def Render404Page(self) -> str:
+        """Render 404 error page."""
         PageContent = """---
 layout: default
 title: 404
@@ -365,12 +366,12 @@ search_exclude: true
 ---
 
 # 404 - Page Not Found
-{: .text-center .fs-9 }
+{{: .text-center .fs-9 }}
 
 The requested page could not be found.
-{: .text-center .fs-6 .fw-300 }
+{{: .text-center .fs-6 .fw-300 }}
 
-[Return to Home]({{ site.baseurl }}){: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 .text-center}
+[Return to Home]({{{{ site.baseurl }}}}){{: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 .text-center}}
 
 ---
 
@@ -378,24 +379,18 @@ The requested page could not be found.
 
 Here are some helpful links to get you back on track:
 
-- [Project Overview]({{ site.baseurl }}/)
-- [Documentation]({{ site.baseurl }}/docs/)
-- [Components]({{ site.baseurl }}/components/)
+- [Project Overview]({{{{ site.baseurl }}}}/)
+- [Documentation]({{{{ site.baseurl }}}}/docs/)
+- [Components]({{{{ site.baseurl }}}}/components/)
 - [Project on GitHub](https://github.com/{repository})
 
 If you believe this is a broken link, please [create an issue](https://github.com/{repository}/issues/new) on our GitHub repository.
 """.format(repository=self.Config["repository"])
         
-        OutputPath = self.OutputDir / "404.md"
-        with open(OutputPath, 'w') as f:
-            f.write(PageContent)
-        
-        print(f"  Created: {OutputPath}")
+        return PageContent
     
-    def GenerateDocsOverview(self) -> None:
-        """Generate documentation overview page."""
-        print("Generating docs overview page...")
-        
+    def RenderDocsOverview(self) -> str:
+        """Render documentation overview page."""
         DocsContent = """---
 layout: default
 title: Documentation
@@ -492,16 +487,10 @@ All documents use the following cross-referencing approaches:
 4. **Component References**: Use component name with layer, e.g., [Layer1_DocumentManager]
 """
         
-        OutputPath = self.OutputDir / "docs-overview.md"
-        with open(OutputPath, 'w') as f:
-            f.write(DocsContent)
-        
-        print(f"  Created: {OutputPath}")
+        return DocsContent
     
-    def GenerateComponentsOverview(self) -> None:
-        """Generate components overview page."""
-        print("Generating components overview page...")
-        
+    def RenderComponentsOverview(self) -> str:
+        """Render components overview page."""
         ComponentsContent = """---
 layout: default
 title: Components
@@ -590,16 +579,10 @@ The current development focus is on Layer 1 (Core Infrastructure) components, fo
 | Maintenance | Component in maintenance mode with ongoing updates |
 """
         
-        OutputPath = self.OutputDir / "components-overview.md"
-        with open(OutputPath, 'w') as f:
-            f.write(ComponentsContent)
-        
-        print(f"  Created: {OutputPath}")
+        return ComponentsContent
     
-    def GenerateDocsReadme(self) -> None:
-        """Generate README for docs directory."""
-        print("Generating docs README...")
-        
+    def RenderDocsReadme(self) -> str:
+        """Render README for docs directory."""
         ReadmeContent = """# Project Himalaya Website
 
 This directory contains the source files for the Project Himalaya website, which is built using Jekyll and deployed via GitHub Pages.
@@ -729,16 +712,10 @@ description: Page description for SEO
 - [GitHub Pages Documentation](https://docs.github.com/en/pages)
 """.format(repository=self.Config["repository"])
         
-        OutputPath = self.OutputDir / "docs-readme.md"
-        with open(OutputPath, 'w') as f:
-            f.write(ReadmeContent)
-        
-        print(f"  Created: {OutputPath}")
+        return ReadmeContent
     
-    def GenerateRepoReadme(self) -> None:
-        """Generate README for repository root."""
-        print("Generating repository README...")
-        
+    def RenderRepoReadme(self) -> str:
+        """Render README for repository root."""
         ReadmeContent = """# Project Himalaya
 
 ![Project Himalaya Logo](docs/assets/images/logo.png)
@@ -860,16 +837,10 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
 — {author}
 """.format(repository=self.Config["repository"], domain=self.Config["url"].replace("https://", ""), url=self.Config["url"], author=self.Config["author"])
         
-        OutputPath = self.OutputDir / "repo-readme.md"
-        with open(OutputPath, 'w') as f:
-            f.write(ReadmeContent)
-        
-        print(f"  Created: {OutputPath}")
+        return ReadmeContent
     
-    def GenerateCustomCSSVariables(self) -> None:
-        """Generate custom CSS variables."""
-        print("Generating custom CSS variables...")
-        
+    def RenderCustomCSSVariables(self) -> None:
+        """Render custom CSS variables."""
         CSSContent = """$himalaya-blue: {primary_color};
 $himalaya-dark: #27374D;
 $himalaya-light: #F7F7F7;
@@ -883,56 +854,82 @@ $body-heading-color: $himalaya-dark;
         
         # Skip creating this file in the initial generation
         # This will be created by the setup script
-        print("  Note: Custom CSS will be created during setup")
+        return None
+    
+    def RenderManifest(self, Contents: dict) -> str:
+        """Render the manifest describing the generated files for the setup script."""
+        FileManifest = {
+            "timestamp": self.Timestamp,
+            "date": self.Date,
+            "files": list(self.ArtifactFiles),
+            "content": {
+                Name: hashlib.sha256(Contents[Name].encode('utf-8')).hexdigest()
+                for Name in self.ArtifactFiles
+            }
+        }
+        
+        return json.dumps(FileManifest, indent=2)
+    
+    def RenderStaticArtifacts(self) -> dict:
+        """Render the artifacts that do not depend on the site configuration."""
+        return {
+            "Gemfile": self.RenderGemfile(),
+            "github-workflow.yml": self.RenderGitHubWorkflow(),
+            "docs-overview.md": self.RenderDocsOverview(),
+            "components-overview.md": self.RenderComponentsOverview()
+        }
+    
+    def BuildRenderEngine(self, Jobs: int = None) -> RenderEngine:
+        """Build the render task graph for all configuration and content files."""
+        Engine = RenderEngine(self.OutputDir, Jobs)
+        
+        Renderers = {
+            "_config.yml": self.RenderJekyllConfig,
+            "Gemfile": self.RenderGemfile,
+            "github-workflow.yml": self.RenderGitHubWorkflow,
+            "index.md": self.RenderHomepage,
+            "404.md": self.Render404Page,
+            "docs-overview.md": self.RenderDocsOverview,
+            "components-overview.md": self.RenderComponentsOverview,
+            "docs-readme.md": self.RenderDocsReadme,
+            "repo-readme.md": self.RenderRepoReadme
+        }
+        
+        for Name in self.ArtifactFiles:
+            if Name in self.SharedContent:
+                Engine.AddTask(RenderTask(Name, lambda Content=self.SharedContent[Name]: Content))
+            else:
+                Engine.AddTask(RenderTask(Name, Renderers[Name]))
+        
+        Engine.AddTask(RenderTask("custom-css-variables", self.RenderCustomCSSVariables))
+        Engine.AddTask(RenderTask("manifest.json", self.RenderManifest, DependsOn=self.ArtifactFiles))
+        
+        return Engine
     
-    def GenerateAll(self) -> None:
+    def GenerateAll(self, Jobs: int = None) -> list:
         """Generate all configuration and content files."""
         print(f"Generating configuration files for Project Himalaya website...")
         print(f"Timestamp: {self.Timestamp}")
         print(f"Output directory: {self.OutputDir}")
         print("")
         
-        self.GenerateJekyllConfig()
-        self.GenerateGemfile()
-        self.GenerateGitHubWorkflow()
-        self.GenerateHomepage()
-        self.Generate404Page()
-        self.GenerateDocsOverview()
-        self.GenerateComponentsOverview()
-        self.GenerateDocsReadme()
-        self.GenerateRepoReadme()
-        self.GenerateCustomCSSVariables()
-        
-        # Generate metadata about files for setup script
-        FileManifest = {
-            "timestamp": self.Timestamp,
-            "date": self.Date,
-            "files": [
-                "_config.yml",
-                "Gemfile",
-                "github-workflow.yml",
-                "index.md",
-                "404.md",
-                "docs-overview.md",
-                "components-overview.md",
-                "docs-readme.md",
-                "repo-readme.md"
-            ]
-        }
-        
-        ManifestPath = self.OutputDir / "manifest.json"
-        with open(ManifestPath, 'w') as f:
-            json.dump(FileManifest, f, indent=2)
+        Engine = self.BuildRenderEngine(Jobs)
+        print(f"Rendering {len(Engine.Tasks)} artifacts with {Engine.Jobs} jobs...")
+        Written = Engine.Run()
+        print("  Note: Custom CSS will be created during setup")
         
-        print(f"\nGenerated {len(FileManifest['files'])} files.")
-        print(f"Manifest saved to: {ManifestPath}")
+        print(f"\nGenerated {len(self.ArtifactFiles)} files.")
+        print(f"Manifest saved to: {self.OutputDir / 'manifest.json'}")
         print("\nTo use these files, run the setup_website.py script.")
+        
+        return Written
 
 def Main():
     """Main entry point for the script."""
     Parser = argparse.ArgumentParser(description="Generate configuration files for Project Himalaya website")
     Parser.add_argument("--output", dest="OutputDir", default="artifacts", help="Output directory for generated files")
     Parser.add_argument("--config", dest="ConfigPath", help="Path to configuration JSON file")
+    Parser.add_argument("--jobs", dest="Jobs", type=int, default=None, help="Number of parallel render jobs (default: CPU count)")
     
     Args = Parser.parse_args()
     
@@ -943,7 +940,7 @@ def Main():
             ConfigData = json.load(f)
     
     Generator = ConfigGenerator(Args.OutputDir, ConfigData)
-    Generator.GenerateAll()
+    Generator.GenerateAll(Args.Jobs)
 
 if __name__ == "__main__":
     Main()
@@ -3,7 +3,7 @@
 # Path: ProjectHimalaya/himalaya_website.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-28
-# Last Modified: 2025-03-28  3:45PM
+# Last Modified: 2026-10-17  11:15PM
 # Description: Complete website management script for Project Himalaya
 
 """
@@ -17,23 +17,45 @@ import os
 import sys
 import json
 import yaml
-import shutil
+import hashlib
 import argparse
-import subprocess
 from pathlib import Path
 from datetime import datetime
 import re
 
+from output_writer import OutputWriter
+from install_engine import InstallEngine
+from command_runner import CommandRunner
+
 class HimalayaWebsite:
     """Comprehensive management tool for Project Himalaya website."""
     
-    def __init__(self, RepoDir: str, Config: dict = None):
+    # Bump whenever a generator template changes so cached artifacts are rebuilt
+    TemplateVersion = "1.0"
+    
+    # Config keys read by each generator; these feed the artifact input hash
+    ArtifactInputs = {
+        "_config.yml": ["title", "description", "url", "repository", "author"],
+        "Gemfile": [],
+        "github-workflow.yml": [],
+        "index.md": ["repository", "author"],
+        "404.md": ["repository"],
+        "docs-overview.md": [],
+        "components-overview.md": [],
+        "docs-readme.md": ["repository"],
+        "repo-readme.md": ["repository", "url", "author"]
+    }
+    
+    def __init__(self, RepoDir: str, Config: dict = None, Force: bool = False):
         """Initialize the website management tool."""
         self.RepoDir = Path(RepoDir)
+        self.Runner = CommandRunner(self.RepoDir)
         self.DocsDir = self.RepoDir / "docs"
         self.GithubDir = self.RepoDir / ".github" / "workflows"
         self.ArtifactsDir = self.RepoDir / "artifacts"
         self.ArtifactsDir.mkdir(parents=True, exist_ok=True)
+        self.Writer = OutputWriter(self.RepoDir)
+        self.Installer = InstallEngine(self.Writer)
         
         # Default configuration if none provided
         self.Config = Config or {
@@ -48,20 +70,87 @@ class HimalayaWebsite:
         
         self.Timestamp = datetime.now().strftime("%B %d, %Y  %I:%M%p")
         self.Date = datetime.now().strftime("%Y-%m-%d")
+        
+        # Incremental generation state
+        self.Force = Force
+        self.PreviousHashes = self.LoadArtifactHashes("inputs")
+        self.PreviousContent = self.LoadArtifactHashes("content")
+        self.CurrentHashes = {}
+        self.ContentHashes = {}
+        self.RegeneratedArtifacts = []
+        self.ReusedArtifacts = []
     
     def RunCommand(self, Command: list, Cwd: Path = None) -> tuple:
         """Run a shell command and return the output."""
+        return self.Runner.Run(Command, Cwd)
+    
+    #
+    # Incremental Generation
+    #
+    
+    def LoadArtifactHashes(self, Key: str) -> dict:
+        """Load the artifact input or content hashes recorded by the previous run."""
+        ManifestPath = self.ArtifactsDir / "manifest.json"
+        if not ManifestPath.exists():
+            return {}
+        
         try:
-            Process = subprocess.Popen(
-                Command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(Cwd or self.RepoDir)
-            )
-            Stdout, Stderr = Process.communicate()
-            return Process.returncode, Stdout.decode('utf-8'), Stderr.decode('utf-8')
-        except Exception as Ex:
-            return 1, "", str(Ex)
+            with open(ManifestPath, 'r') as f:
+                Manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        # Hashes from an older template version can never match
+        if Manifest.get("template_version") != self.TemplateVersion:
+            return {}
+        
+        return Manifest.get(Key, {})
+    
+    def ComputeArtifactHash(self, ArtifactName: str) -> str:
+        """Hash the template version and config inputs of an artifact."""
+        Inputs = {
+            "template_version": self.TemplateVersion,
+            "artifact": ArtifactName,
+            "config": {Key: self.Config.get(Key) for Key in self.ArtifactInputs[ArtifactName]}
+        }
+        
+        # The Jekyll footer embeds the current year
+        if ArtifactName == "_config.yml":
+            Inputs["year"] = datetime.now().year
+        
+        Payload = json.dumps(Inputs, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(Payload).hexdigest()
+    
+    def ComputeContentHash(self, FilePath: Path) -> str:
+        """Hash the content of an artifact on disk, or return None if it cannot be read."""
+        try:
+            return self.Installer.FileDigest(FilePath)
+        except OSError:
+            return None
+    
+    def IsArtifactCurrent(self, ArtifactName: str) -> bool:
+        """Check whether an artifact on disk was built from the current inputs and is unmodified."""
+        Hash = self.ComputeArtifactHash(ArtifactName)
+        self.CurrentHashes[ArtifactName] = Hash
+        
+        OutputPath = self.ArtifactsDir / ArtifactName
+        if not self.Force and self.PreviousHashes.get(ArtifactName) == Hash:
+            # An artifact edited since it was generated no longer matches its content hash
+            ContentHash = self.ComputeContentHash(OutputPath)
+            if ContentHash is not None and ContentHash == self.PreviousContent.get(ArtifactName):
+                self.ContentHashes[ArtifactName] = ContentHash
+                self.ReusedArtifacts.append(ArtifactName)
+                print(f"  Reused: {OutputPath}")
+                return True
+        
+        self.RegeneratedArtifacts.append(ArtifactName)
+        return False
+    
+    def WriteArtifact(self, OutputPath: Path, Content: str) -> None:
+        """Write a generated artifact and record its content hash."""
+        Data = Content.encode('utf-8')
+        self.ContentHashes[OutputPath.name] = hashlib.sha256(Data).hexdigest()
+        self.Writer.WriteBytes(OutputPath, Data)
     
     #
     # Configuration Generation
@@ -71,6 +160,10 @@ class HimalayaWebsite:
         """Generate Jekyll _config.yml file."""
         print("Generating Jekyll configuration...")
         
+        OutputPath = self.ArtifactsDir / "_config.yml"
+        if self.IsArtifactCurrent("_config.yml"):
+            return str(OutputPath)
+        
         ConfigData = {
             "title": self.Config["title"],
             "description": self.Config["description"],
@@ -170,9 +263,7 @@ class HimalayaWebsite:
         Content += "# Site settings\n"
         Content += yaml.dump(ConfigData, sort_keys=False, default_flow_style=False)
         
-        OutputPath = self.ArtifactsDir / "_config.yml"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -181,6 +272,10 @@ class HimalayaWebsite:
         """Generate Gemfile for Ruby dependencies."""
         print("Generating Gemfile...")
         
+        OutputPath = self.ArtifactsDir / "Gemfile"
+        if self.IsArtifactCurrent("Gemfile"):
+            return str(OutputPath)
+        
         Content = """source "https://rubygems.org"
 
 # Jekyll and plugins
@@ -211,9 +306,7 @@ gem "wdm", "~> 0.1.1", :platforms => [:mingw, :x64_mingw, :mswin]
 gem "http_parser.rb", "~> 0.6.0", :platforms => [:jruby]
 """
         
-        OutputPath = self.ArtifactsDir / "Gemfile"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -222,6 +315,10 @@ gem "http_parser.rb", "~> 0.6.0", :platforms => [:jruby]
         """Generate GitHub Actions workflow file."""
         print("Generating GitHub Actions workflow...")
         
+        OutputPath = self.ArtifactsDir / "github-workflow.yml"
+        if self.IsArtifactCurrent("github-workflow.yml"):
+            return str(OutputPath)
+        
         Content = """name: Build and deploy Jekyll site to GitHub Pages
 
 on:
@@ -283,9 +380,7 @@ jobs:
         uses: actions/deploy-pages@v2
 """
         
-        OutputPath = self.ArtifactsDir / "github-workflow.yml"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -294,6 +389,10 @@ jobs:
         """Generate homepage content."""
         print("Generating homepage...")
         
+        OutputPath = self.ArtifactsDir / "index.md"
+        if self.IsArtifactCurrent("index.md"):
+            return str(OutputPath)
+        
         Content = """---
 layout: home
 title: Project Himalaya
@@ -303,13 +402,13 @@ permalink: /
 ---
 
 # Project Himalaya
-{: .fs-9 }
+{{: .fs-9 }}
 
 A comprehensive framework demonstrating optimal AI-human collaboration, manifested through the development of practical applications that themselves leverage AI capabilities.
-{: .fs-6 .fw-300 }
+{{: .fs-6 .fw-300 }}
 
-[Get Started](#getting-started){: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 }
-[View on GitHub](https://github.com/{repository}){: .btn .fs-5 .mb-4 .mb-md-0 }
+[Get Started](#getting-started){{: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 }}
+[View on GitHub](https://github.com/{repository}){{: .btn .fs-5 .mb-4 .mb-md-0 }}
 
 ---
 
@@ -365,9 +464,9 @@ This website provides comprehensive documentation for Project Himalaya, includin
 
 ## Recent Updates
 
-{% for post in site.posts limit:3 %}
-- **{{ post.date | date: "%b %d, %Y" }}** - [{{ post.title }}]({{ post.url }})
-{% endfor %}
+{{% for post in site.posts limit:3 %}}
+- **{{{{ post.date | date: "%b %d, %Y" }}}}** - [{{{{ post.title }}}}]({{{{ post.url }}}})
+{{% endfor %}}
 
 ---
 
@@ -376,9 +475,7 @@ This website provides comprehensive documentation for Project Himalaya, includin
 — {author}
 """.format(repository=self.Config["repository"], author=self.Config["author"])
         
-        OutputPath = self.ArtifactsDir / "index.md"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -387,6 +484,10 @@ This website provides comprehensive documentation for Project Himalaya, includin
         """Generate 404 error page."""
         print("Generating 404 page...")
         
+        OutputPath = self.ArtifactsDir / "404.md"
+        if self.IsArtifactCurrent("404.md"):
+            return str(OutputPath)
+        
         Content = """---
 layout: default
 title: 404
@@ -396,12 +497,12 @@ search_exclude: true
 ---
 
 # 404 - Page Not Found
-{: .text-center .fs-9 }
+{{: .text-center .fs-9 }}
 
 The requested page could not be found.
-{: .text-center .fs-6 .fw-300 }
+{{: .text-center .fs-6 .fw-300 }}
 
-[Return to Home]({{ site.baseurl }}){: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 .text-center}
+[Return to Home]({{{{ site.baseurl }}}}){{: .btn .btn-primary .fs-5 .mb-4 .mb-md-0 .mr-2 .text-center}}
 
 ---
 
@@ -409,17 +510,15 @@ The requested page could not be found.
 
 Here are some helpful links to get you back on track:
 
-- [Project Overview]({{ site.baseurl }}/)
-- [Documentation]({{ site.baseurl }}/docs/)
-- [Components]({{ site.baseurl }}/components/)
+- [Project Overview]({{{{ site.baseurl }}}}/)
+- [Documentation]({{{{ site.baseurl }}}}/docs/)
+- [Components]({{{{ site.baseurl }}}}/components/)
 - [Project on GitHub](https://github.com/{repository})
 
 If you believe this is a broken link, please [create an issue](https://github.com/{repository}/issues/new) on our GitHub repository.
 """.format(repository=self.Config["repository"])
         
-        OutputPath = self.ArtifactsDir / "404.md"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -428,6 +527,10 @@ If you believe this is a broken link, please [create an issue](https://github.co
         """Generate documentation overview page."""
         print("Generating docs overview page...")
         
+        OutputPath = self.ArtifactsDir / "docs-overview.md"
+        if self.IsArtifactCurrent("docs-overview.md"):
+            return str(OutputPath)
+        
         Content = """---
 layout: default
 title: Documentation
@@ -524,9 +627,7 @@ All documents use the following cross-referencing approaches:
 4. **Component References**: Use component name with layer, e.g., [Layer1_DocumentManager]
 """
         
-        OutputPath = self.ArtifactsDir / "docs-overview.md"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -535,6 +636,10 @@ All documents use the following cross-referencing approaches:
         """Generate components overview page."""
         print("Generating components overview page...")
         
+        OutputPath = self.ArtifactsDir / "components-overview.md"
+        if self.IsArtifactCurrent("components-overview.md"):
+            return str(OutputPath)
+        
         Content = """---
 layout: default
 title: Components
@@ -623,9 +728,7 @@ The current development focus is on Layer 1 (Core Infrastructure) components, fo
 | Maintenance | Component in maintenance mode with ongoing updates |
 """
         
-        OutputPath = self.ArtifactsDir / "components-overview.md"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -634,6 +737,10 @@ The current development focus is on Layer 1 (Core Infrastructure) components, fo
         """Generate README for docs directory."""
         print("Generating docs README...")
         
+        OutputPath = self.ArtifactsDir / "docs-readme.md"
+        if self.IsArtifactCurrent("docs-readme.md"):
+            return str(OutputPath)
+        
         Content = """# Project Himalaya Website
 
 This directory contains the source files for the Project Himalaya website, which is built using Jekyll and deployed via GitHub Pages.
@@ -763,9 +870,7 @@ description: Page description for SEO
 - [GitHub Pages Documentation](https://docs.github.com/en/pages)
 """.format(repository=self.Config["repository"])
         
-        OutputPath = self.ArtifactsDir / "docs-readme.md"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -774,6 +879,10 @@ description: Page description for SEO
         """Generate README for repository root."""
         print("Generating repository README...")
         
+        OutputPath = self.ArtifactsDir / "repo-readme.md"
+        if self.IsArtifactCurrent("repo-readme.md"):
+            return str(OutputPath)
+        
         Content = """# Project Himalaya
 
 ![Project Himalaya Logo](docs/assets/images/logo.png)
@@ -895,9 +1004,7 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
 — {author}
 """.format(repository=self.Config["repository"], domain=self.Config["url"].replace("https://", ""), url=self.Config["url"], author=self.Config["author"])
         
-        OutputPath = self.ArtifactsDir / "repo-readme.md"
-        with open(OutputPath, 'w') as f:
-            f.write(Content)
+        self.WriteArtifact(OutputPath, Content)
         
         print(f"  Created: {OutputPath}")
         return str(OutputPath)
@@ -909,30 +1016,45 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
         print(f"Output directory: {self.ArtifactsDir}")
         print("")
         
-        Artifacts = {}
-        Artifacts["_config.yml"] = self.GenerateJekyllConfig()
-        Artifacts["Gemfile"] = self.GenerateGemfile()
-        Artifacts["github-workflow.yml"] = self.GenerateGitHubWorkflow()
-        Artifacts["index.md"] = self.GenerateHomepage()
-        Artifacts["404.md"] = self.Generate404Page()
-        Artifacts["docs-overview.md"] = self.GenerateDocsOverview()
-        Artifacts["components-overview.md"] = self.GenerateComponentsOverview()
-        Artifacts["docs-readme.md"] = self.GenerateDocsReadme()
-        Artifacts["repo-readme.md"] = self.GenerateRepoReadme()
-        
-        # Generate metadata about files for setup script
-        FileManifest = {
-            "timestamp": self.Timestamp,
-            "date": self.Date,
-            "files": list(Artifacts.keys())
-        }
+        self.RegeneratedArtifacts = []
+        self.ReusedArtifacts = []
         
-        ManifestPath = self.ArtifactsDir / "manifest.json"
-        with open(ManifestPath, 'w') as f:
-            json.dump(FileManifest, f, indent=2)
+        # Stage every artifact and the manifest, then commit them together
+        with self.Writer.Batch():
+            Artifacts = {}
+            Artifacts["_config.yml"] = self.GenerateJekyllConfig()
+            Artifacts["Gemfile"] = self.GenerateGemfile()
+            Artifacts["github-workflow.yml"] = self.GenerateGitHubWorkflow()
+            Artifacts["index.md"] = self.GenerateHomepage()
+            Artifacts["404.md"] = self.Generate404Page()
+            Artifacts["docs-overview.md"] = self.GenerateDocsOverview()
+            Artifacts["components-overview.md"] = self.GenerateComponentsOverview()
+            Artifacts["docs-readme.md"] = self.GenerateDocsReadme()
+            Artifacts["repo-readme.md"] = self.GenerateRepoReadme()
+        
+            # Generate metadata about files for setup script
+            FileManifest = {
+                "timestamp": self.Timestamp,
+                "date": self.Date,
+                "template_version": self.TemplateVersion,
+                "files": list(Artifacts.keys()),
+                "inputs": {Name: self.CurrentHashes[Name] for Name in Artifacts},
+                "content": {Name: self.ContentHashes[Name] for Name in Artifacts}
+            }
+        
+            # Leave the manifest untouched when nothing was regenerated
+            ManifestPath = self.ArtifactsDir / "manifest.json"
+            if (self.RegeneratedArtifacts or FileManifest["inputs"] != self.PreviousHashes
+                    or FileManifest["content"] != self.PreviousContent or not ManifestPath.exists()):
+                self.Writer.WriteText(ManifestPath, json.dumps(FileManifest, indent=2))
+                self.PreviousHashes = dict(FileManifest["inputs"])
+                self.PreviousContent = dict(FileManifest["content"])
+                print(f"\nManifest saved to: {ManifestPath}")
+            else:
+                print(f"\nManifest unchanged: {ManifestPath}")
         
-        print(f"\nGenerated {len(FileManifest['files'])} files.")
-        print(f"Manifest saved to: {ManifestPath}")
+        print(f"Regenerated {len(self.RegeneratedArtifacts)} files: {', '.join(self.RegeneratedArtifacts) or 'none'}")
+        print(f"Reused {len(self.ReusedArtifacts)} files: {', '.join(self.ReusedArtifacts) or 'none'}")
         
         return Artifacts
     
@@ -997,21 +1119,23 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
             "repo-readme.md": self.RepoDir / "README.md"
         }
         
-        # Copy files to their destinations
-        for ArtifactName, DestinationPath in FileMap.items():
-            if ArtifactName in Artifacts:
-                shutil.copy2(Artifacts[ArtifactName], DestinationPath)
-                print(f"  Installed: {ArtifactName} -> {DestinationPath}")
-            else:
-                print(f"  Warning: Artifact {ArtifactName} not found")
+        # Install files in a single atomic batch, skipping identical content
+        with self.Writer.Batch():
+            for ArtifactName, DestinationPath in FileMap.items():
+                if ArtifactName in Artifacts:
+                    Method = self.Installer.Install(Artifacts[ArtifactName], DestinationPath)
+                    print(f"  Installed ({Method}): {ArtifactName} -> {DestinationPath}")
+                else:
+                    print(f"  Warning: Artifact {ArtifactName} not found")
+        
+        print(f"  Install summary: {self.Installer.Summary()}")
     
     def CreateCNAMEFile(self) -> None:
         """Create the CNAME file for custom domain."""
         print("Creating CNAME file...")
         
         CNAMEPath = self.DocsDir / "CNAME"
-        with open(CNAMEPath, 'w') as f:
-            f.write(self.Config["url"].replace("https://", ""))
+        self.Writer.WriteText(CNAMEPath, self.Config["url"].replace("https://", ""))
         
         print(f"  Created: {CNAMEPath}")
     
@@ -1021,8 +1145,7 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
         
         # Create custom color scheme
         ThemePath = self.DocsDir / "_sass" / "color_schemes" / "himalaya.scss"
-        with open(ThemePath, 'w') as f:
-            f.write(f"""$link-color: {self.Config["primary_color"]};
+        self.Writer.WriteText(ThemePath, f"""$link-color: {self.Config["primary_color"]};
 $btn-primary-color: {self.Config["primary_color"]};
 $body-background-color: #ffffff;
 $sidebar-color: #f7f7f7;
@@ -1039,8 +1162,7 @@ $body-heading-color: #27374D;
         PostsDir.mkdir(parents=True, exist_ok=True)
         
         PostPath = PostsDir / f"{self.Date}-website-launch.md"
-        with open(PostPath, 'w') as f:
-            f.write("""---
+        self.Writer.WriteText(PostPath, """---
 layout: post
 title: "Project Himalaya Website Launch"
 date: {date}
@@ -1082,8 +1204,7 @@ Stay tuned for more updates as the project develops!
         ImagesDir.mkdir(parents=True, exist_ok=True)
         
         DiagramPath = ImagesDir / "component-hierarchy.svg"
-        with open(DiagramPath, 'w') as f:
-           f.write("""<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="800" height="500" viewBox="0 0 800 500">
+        self.Writer.WriteText(DiagramPath, """<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="800" height="500" viewBox="0 0 800 500">
             <style>
                 .layer-box { fill: #f0f0f0; stroke: #333; stroke-width: 2; }
                 .layer-1 { fill: #d4e6f1; }
@@ -1142,4 +1263,31 @@ Stay tuned for more updates as the project develops!
             
             <rect x="400" y="65" width="120" height="60" rx="5" ry="5" class="component" />
             <text x="460" y="100" class="component-text">AIDEV-Deploy</text>
-            </svg>""")
\ No newline at end of file
+            </svg>""")
+
+def Main():
+    """Main entry point for the script."""
+    Parser = argparse.ArgumentParser(description="Generate and install Project Himalaya website files")
+    Parser.add_argument("--repo", dest="RepoDir", default=".", help="Path to repository directory")
+    Parser.add_argument("--config", dest="ConfigPath", help="Path to configuration JSON file")
+    Parser.add_argument("--force", dest="Force", action="store_true",
+                        help="Regenerate every artifact even if its inputs are unchanged")
+    Parser.add_argument("--install", dest="Install", action="store_true",
+                        help="Install the generated files into the website tree")
+    
+    Args = Parser.parse_args()
+    
+    Config = None
+    if Args.ConfigPath:
+        with open(Args.ConfigPath, 'r') as f:
+            Config = json.load(f)
+    
+    Website = HimalayaWebsite(Args.RepoDir, Config, Force=Args.Force)
+    Artifacts = Website.GenerateAllConfigs()
+    
+    if Args.Install:
+        Website.CreateDirectoryStructure()
+        Website.InstallConfigurationFiles(Artifacts)
+
+if __name__ == "__main__":
+    Main()
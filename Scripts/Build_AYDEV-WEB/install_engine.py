@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# File: install_engine.py
+# Path: ProjectHimalaya/install_engine.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: Copy-avoiding installer for generated website artifacts
+
+"""
+Project Himalaya Install Engine
+
+This module installs artifact files into the website tree while moving as few bytes
+as possible. A destination that already holds identical content (same size and
+hash) is left alone. Otherwise the file is staged through the OutputWriter as a
+reflink (FICLONE), or as a full copy where reflinks are unavailable. Hard links are
+never used, because a hard-linked destination shares its inode with the artifact:
+anything that writes the installed file in place would also change the artifact.
+"""
+
+import hashlib
+from pathlib import Path
+
+from output_writer import OutputWriter
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl request number for FICLONE on Linux (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+class InstallEngine:
+    """Installs files by skipping identical content and preferring reflinks over copies."""
+
+    def __init__(self, Writer: OutputWriter):
+        """Initialize the install engine.
+
+        Args:
+            Writer: OutputWriter that stages and commits installed files
+        """
+        self.Writer = Writer
+        self.Counts = {"identical": 0, "reflink": 0, "copy": 0}
+        self.BytesAvoided = 0
+        self.BytesCopied = 0
+
+    def FileDigest(self, FilePath: Path) -> str:
+        """Return the SHA-256 digest of a file."""
+        Digest = hashlib.sha256()
+        with open(FilePath, 'rb') as f:
+            for Chunk in iter(lambda: f.read(1024 * 1024), b""):
+                Digest.update(Chunk)
+        return Digest.hexdigest()
+
+    def IsIdentical(self, Source: Path, Destination: Path) -> bool:
+        """Check whether the destination already holds the source content."""
+        try:
+            DestinationStat = Destination.stat()
+        except OSError:
+            return False
+
+        SourceStat = Source.stat()
+        if SourceStat.st_size != DestinationStat.st_size:
+            return False
+        if (SourceStat.st_dev, SourceStat.st_ino) == (DestinationStat.st_dev, DestinationStat.st_ino):
+            return True
+
+        return self.FileDigest(Source) == self.FileDigest(Destination)
+
+    def TryReflink(self, Source: Path, Target: Path) -> bool:
+        """Clone the source into the target with FICLONE if the filesystem supports it."""
+        if fcntl is None:
+            return False
+
+        try:
+            with open(Source, 'rb') as Src, open(Target, 'wb') as Dst:
+                fcntl.ioctl(Dst.fileno(), FICLONE, Src.fileno())
+            return True
+        except OSError:
+            try:
+                Target.unlink()
+            except OSError:
+                pass
+            return False
+
+    def Install(self, Source, Destination) -> str:
+        """Install one file and return the method used.
+
+        Returns one of "identical", "reflink" or "copy".
+        """
+        Source = Path(Source)
+        Destination = Path(Destination)
+        Size = Source.stat().st_size
+
+        if self.IsIdentical(Source, Destination):
+            Method = "identical"
+        else:
+            StagedPath = self.Writer.StagePath(Destination)
+            if self.TryReflink(Source, StagedPath):
+                Method = "reflink"
+                self.Writer.AddStaged(StagedPath, Destination)
+            else:
+                Method = "copy"
+                self.Writer.CopyFile(Source, Destination)
+
+        self.Counts[Method] += 1
+        if Method == "copy":
+            self.BytesCopied += Size
+        else:
+            self.BytesAvoided += Size
+
+        return Method
+
+    def Summary(self) -> str:
+        """Describe what the installs did."""
+        Total = sum(self.Counts.values())
+        return (f"{Total} files: {self.Counts['identical']} identical, "
+                f"{self.Counts['reflink']} reflinked, "
+                f"{self.Counts['copy']} copied; {self.BytesAvoided} bytes avoided, "
+                f"{self.BytesCopied} bytes copied")
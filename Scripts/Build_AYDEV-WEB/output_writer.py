@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# File: output_writer.py
+# Path: ProjectHimalaya/output_writer.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:20AM
+# Description: Atomic, fsync-batched writer for generated website files
+
+"""
+Project Himalaya Output Writer
+
+This module stages generated files in a temporary directory next to their final
+location and renames them into place on commit. A crash or interruption before the
+commit leaves every destination untouched, and the commit fsyncs each affected
+directory once instead of once per file.
+
+Writes made inside a Batch() block are committed together when the outermost block
+exits; writes made outside a batch are committed immediately.
+"""
+
+import os
+import errno
+import shutil
+import tempfile
+from pathlib import Path
+from contextlib import contextmanager
+
+class OutputWriter:
+    """Stages file writes and commits them atomically with batched directory fsyncs."""
+
+    def __init__(self, RootDir: str, Durable: bool = True):
+        """Initialize the output writer.
+
+        Args:
+            RootDir: Directory under which the staging area is created. Destinations
+                should live on the same filesystem so commits are plain renames.
+            Durable: fsync staged files and their directories on commit
+        """
+        self.RootDir = Path(RootDir)
+        self.Durable = Durable
+        self.StagingDir = None
+        self.Staged = []
+        self.BatchDepth = 0
+        self.FilesCommitted = 0
+        self.DirsSynced = 0
+
+    #
+    # Batching
+    #
+
+    @contextmanager
+    def Batch(self):
+        """Group writes so they are committed together.
+
+        The batch is committed when the outermost block exits normally and discarded
+        if it exits with an exception.
+        """
+        self.BatchDepth += 1
+        try:
+            yield self
+        except BaseException:
+            self.BatchDepth -= 1
+            if self.BatchDepth == 0:
+                self.Abort()
+            raise
+        self.BatchDepth -= 1
+        if self.BatchDepth == 0:
+            self.Commit()
+
+    #
+    # Staging
+    #
+
+    def GetStagingDir(self) -> Path:
+        """Create the staging directory on first use."""
+        if self.StagingDir is None:
+            self.RootDir.mkdir(parents=True, exist_ok=True)
+            self.StagingDir = Path(tempfile.mkdtemp(prefix=".staging-", dir=str(self.RootDir)))
+        return self.StagingDir
+
+    def StagePath(self, Destination: Path) -> Path:
+        """Return a unique staging path for a destination."""
+        return self.GetStagingDir() / f"{len(self.Staged):05d}-{Destination.name}"
+
+    def SyncFile(self, FilePath: Path) -> None:
+        """Flush a staged file's data to disk."""
+        if not self.Durable:
+            return
+        Fd = os.open(str(FilePath), os.O_RDONLY)
+        try:
+            os.fsync(Fd)
+        finally:
+            os.close(Fd)
+
+    def AddStaged(self, StagedPath: Path, Destination: Path) -> None:
+        """Record a staged file and commit immediately when outside a batch."""
+        self.Staged.append((StagedPath, Destination))
+        if self.BatchDepth == 0:
+            self.Commit()
+
+    def WriteBytes(self, Destination, Data: bytes) -> Path:
+        """Stage binary content for a destination path."""
+        Destination = Path(Destination)
+        StagedPath = self.StagePath(Destination)
+
+        with open(StagedPath, 'wb') as f:
+            f.write(Data)
+            if self.Durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+        self.AddStaged(StagedPath, Destination)
+        return Destination
+
+    def WriteText(self, Destination, Content: str, Encoding: str = 'utf-8') -> Path:
+        """Stage text content for a destination path."""
+        return self.WriteBytes(Destination, Content.encode(Encoding))
+
+    def CopyFile(self, Source, Destination) -> Path:
+        """Stage a copy of an existing file, preserving its metadata."""
+        Destination = Path(Destination)
+        StagedPath = self.StagePath(Destination)
+
+        shutil.copy2(str(Source), str(StagedPath))
+        self.SyncFile(StagedPath)
+
+        self.AddStaged(StagedPath, Destination)
+        return Destination
+
+    #
+    # Commit
+    #
+
+    def MoveIntoPlace(self, StagedPath: Path, Destination: Path) -> None:
+        """Atomically replace the destination with the staged file."""
+        try:
+            os.replace(str(StagedPath), str(Destination))
+        except OSError as Ex:
+            if Ex.errno != errno.EXDEV:
+                raise
+            # Destination is on another filesystem: stage again beside it
+            Fd, LocalPath = tempfile.mkstemp(prefix=".staging-", dir=str(Destination.parent))
+            os.close(Fd)
+            shutil.move(str(StagedPath), LocalPath)
+            self.SyncFile(Path(LocalPath))
+            os.replace(LocalPath, str(Destination))
+
+    def SyncDirectory(self, DirPath: Path) -> None:
+        """fsync a directory so renames inside it are durable."""
+        if not self.Durable:
+            return
+        try:
+            Fd = os.open(str(DirPath), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            return  # Directories cannot be opened on this platform
+        try:
+            os.fsync(Fd)
+            self.DirsSynced += 1
+        except OSError:
+            pass
+        finally:
+            os.close(Fd)
+
+    def Commit(self) -> int:
+        """Rename all staged files into place and fsync each touched directory once."""
+        if not self.Staged:
+            self.RemoveStagingDir()
+            return 0
+
+        Dirty = []
+        for StagedPath, Destination in self.Staged:
+            Destination.parent.mkdir(parents=True, exist_ok=True)
+            self.MoveIntoPlace(StagedPath, Destination)
+            if Destination.parent not in Dirty:
+                Dirty.append(Destination.parent)
+
+        Count = len(self.Staged)
+        self.Staged = []
+        self.FilesCommitted += Count
+
+        self.RemoveStagingDir()
+        if self.RootDir not in Dirty:
+            Dirty.append(self.RootDir)
+
+        for DirPath in Dirty:
+            self.SyncDirectory(DirPath)
+
+        return Count
+
+    def Abort(self) -> None:
+        """Discard all staged files, leaving destinations untouched."""
+        self.Staged = []
+        if self.StagingDir is not None:
+            shutil.rmtree(self.StagingDir, ignore_errors=True)
+            self.StagingDir = None
+
+    def RemoveStagingDir(self) -> None:
+        """Remove the (now empty) staging directory."""
+        if self.StagingDir is not None:
+            shutil.rmtree(self.StagingDir, ignore_errors=True)
+            self.StagingDir = None
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# File: render_engine.py
+# Path: ProjectHimalaya/render_engine.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:20AM
+# Description: Dependency-aware parallel renderer for generated website artifacts
+
+"""
+Project Himalaya Render Engine
+
+This module renders generated artifacts concurrently. Each artifact is a task with
+a render callable and an optional list of tasks it depends on. Tasks whose
+dependencies are satisfied are rendered on a thread pool, and finished results are
+staged in batches from the calling thread so output order stays deterministic. All
+staged files are committed atomically once every task has rendered.
+"""
+
+import os
+from pathlib import Path
+from graphlib import TopologicalSorter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from output_writer import OutputWriter
+
+class RenderTask:
+    """A single artifact to render."""
+
+    def __init__(self, Name: str, Render, DependsOn: list = None, OutputName: str = None):
+        """Initialize the render task.
+
+        Args:
+            Name: Unique task name
+            Render: Callable returning the artifact content, or None to skip writing.
+                Tasks with dependencies receive a dict of dependency name to content.
+            DependsOn: Names of tasks that must be rendered first
+            OutputName: File name relative to the output directory (default: Name)
+        """
+        self.Name = Name
+        self.Render = Render
+        self.DependsOn = list(DependsOn or [])
+        self.OutputName = OutputName or Name
+
+class RenderEngine:
+    """Renders a graph of artifact tasks on a worker pool and writes them in batches."""
+
+    def __init__(self, OutputDir: str, Jobs: int = None, BatchSize: int = 8, Writer: OutputWriter = None):
+        """Initialize the render engine."""
+        self.OutputDir = Path(OutputDir)
+        self.Writer = Writer or OutputWriter(self.OutputDir)
+        self.Jobs = max(1, Jobs or os.cpu_count() or 1)
+        self.BatchSize = max(1, BatchSize)
+        self.Tasks = {}
+        self.Results = {}
+
+    def AddTask(self, Task: RenderTask) -> None:
+        """Register a render task."""
+        if Task.Name in self.Tasks:
+            raise ValueError(f"Duplicate render task: {Task.Name}")
+        self.Tasks[Task.Name] = Task
+
+    def RenderOne(self, Task: RenderTask):
+        """Render one task, passing the content of its dependencies."""
+        if Task.DependsOn:
+            return Task.Render({Name: self.Results[Name] for Name in Task.DependsOn})
+        return Task.Render()
+
+    def WriteBatch(self, Batch: list) -> list:
+        """Stage a batch of rendered tasks in registration order."""
+        Order = list(self.Tasks)
+        Written = []
+
+        for Name in sorted(Batch, key=Order.index):
+            Content = self.Results[Name]
+            if Content is None:
+                continue
+
+            OutputPath = self.OutputDir / self.Tasks[Name].OutputName
+            self.Writer.WriteText(OutputPath, Content)
+
+            print(f"  Created: {OutputPath}")
+            Written.append(Name)
+
+        return Written
+
+    def Run(self) -> list:
+        """Render all tasks and return the written artifacts in registration order."""
+        for Task in self.Tasks.values():
+            for Dependency in Task.DependsOn:
+                if Dependency not in self.Tasks:
+                    raise ValueError(f"Task {Task.Name} depends on unknown task {Dependency}")
+
+        Graph = TopologicalSorter({Name: Task.DependsOn for Name, Task in self.Tasks.items()})
+        Graph.prepare()
+
+        self.Results = {}
+        Written = []
+        Pending = []
+
+        with self.Writer.Batch(), ThreadPoolExecutor(max_workers=self.Jobs) as Pool:
+            Running = {}
+
+            while Graph.is_active():
+                for Name in Graph.get_ready():
+                    Running[Pool.submit(self.RenderOne, self.Tasks[Name])] = Name
+
+                Done, _ = wait(Running, return_when=FIRST_COMPLETED)
+                for Future in Done:
+                    Name = Running.pop(Future)
+                    self.Results[Name] = Future.result()
+                    Graph.done(Name)
+                    Pending.append(Name)
+
+                if len(Pending) >= self.BatchSize or not Graph.is_active():
+                    Written.extend(self.WriteBatch(Pending))
+                    Pending = []
+
+        Order = list(self.Tasks)
+        return sorted(Written, key=Order.index)
@@ -3,7 +3,7 @@
 # Path: ProjectHimalaya/reset_repository.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-28
-# Last Modified: 2025-03-28  4:15PM
+# Last Modified: 2026-10-17  11:59PM
 # Description: Reset Project Himalaya repository and create fresh structure
 # Author: Claude (Anthropic), as part of Project Himalaya
 
@@ -15,22 +15,28 @@ structure for Project Himalaya, including proper attribution to Claude.
 """
 
 import os
-import subprocess
 import shutil
 import argparse
 from pathlib import Path
 import json
 from datetime import datetime
 
+from command_runner import CommandRunner
+from backup_engine import BackupEngine
+
 class RepositoryReset:
     """Handles the reset of the Project Himalaya repository."""
     
     def __init__(self, RepoDir: str, Force: bool = False):
         """Initialize the repository reset tool."""
         self.RepoDir = Path(RepoDir).resolve()
+        self.Runner = CommandRunner(self.RepoDir)
         self.Force = Force
         self.Timestamp = datetime.now().strftime("%B %d, %Y  %I:%M%p")
         
+        # Backups share one content-addressed store, so unchanged content is stored once
+        self.BackupStoreDir = self.RepoDir.parent / "ProjectHimalaya_Backups"
+        
         # Path to SSH key
         self.SshKeyPath = Path.home() / ".ssh" / "id_rsa"
         
@@ -40,17 +46,7 @@ class RepositoryReset:
     
     def RunCommand(self, Command: list, Cwd: Path = None) -> tuple:
         """Run a shell command and return the output."""
-        try:
-            Process = subprocess.Popen(
-                Command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(Cwd or self.RepoDir)
-            )
-            Stdout, Stderr = Process.communicate()
-            return Process.returncode, Stdout.decode('utf-8'), Stderr.decode('utf-8')
-        except Exception as Ex:
-            return 1, "", str(Ex)
+        return self.Runner.Run(Command, Cwd)
     
     def IsGitRepository(self) -> bool:
         """Check if the directory is a Git repository."""
@@ -61,31 +57,49 @@ class RepositoryReset:
         """Backup important files before reset."""
         print("Backing up important files...")
         
-        # Create backup directory
-        BackupDir = self.RepoDir.parent / f"ProjectHimalaya_Backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        BackupDir.mkdir(parents=True, exist_ok=True)
+        Engine = BackupEngine(self.BackupStoreDir)
+        
+        # Resume the latest backup if it was interrupted, otherwise create a new one
+        Previous = sorted(self.RepoDir.parent.glob("ProjectHimalaya_Backup_*"))
+        if Previous and Engine.IsResumable(Previous[-1]):
+            BackupDir = Previous[-1]
+            print(f"  Resuming interrupted backup: {BackupDir}")
+        else:
+            BackupDir = self.RepoDir.parent / f"ProjectHimalaya_Backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Files/directories to backup
         BackupPaths = [
             # Add specific files or directories you want to preserve
         ]
         
-        for Path in BackupPaths:
-            SourcePath = self.RepoDir / Path
-            if SourcePath.exists():
-                DestPath = BackupDir / Path
-                DestPath.parent.mkdir(parents=True, exist_ok=True)
-                
-                if SourcePath.is_file():
-                    shutil.copy2(SourcePath, DestPath)
-                else:
-                    shutil.copytree(SourcePath, DestPath)
-                
-                print(f"  Backed up: {Path}")
+        Existing = [Path for Path in BackupPaths if (self.RepoDir / Path).exists()]
+        for Path in Existing:
+            print(f"  Backing up: {Path}")
         
+        Manifest = Engine.Backup(self.RepoDir, Existing, BackupDir)
+        for RelativePath, Error in Manifest["skipped"].items():
+            print(f"  Skipped {RelativePath}: {Error}")
+        print(f"  {Engine.Summary()}")
         print(f"Backup created at: {BackupDir}")
+        print(f"  Restore it with: {os.path.basename(__file__)} --repo {self.RepoDir} --restore {BackupDir}")
         return BackupDir
     
+    def RestoreBackup(self, BackupDir: str) -> bool:
+        """Restore the files of a backup into the repository from the backup store."""
+        BackupDir = Path(BackupDir).resolve()
+        print(f"Restoring backup {BackupDir} into {self.RepoDir}...")
+        
+        Engine = BackupEngine(self.BackupStoreDir)
+        if not Engine.IsComplete(BackupDir):
+            print(f"  Error: {BackupDir} holds no finished backup")
+            return False
+        
+        Failed = Engine.Restore(BackupDir, self.RepoDir)
+        for RelativePath, Error in Failed.items():
+            print(f"  Failed to restore {RelativePath}: {Error}")
+        print("Restore complete." if not Failed else f"Restore finished with {len(Failed)} failures.")
+        return not Failed
+    
     def CleanRepository(self) -> bool:
         """Clean the repository by removing all files except .git."""
         print("Cleaning repository...")
@@ -379,6 +393,7 @@ _site/
 .sass-cache/
 .jekyll-cache/
 .jekyll-metadata
+.site-builder/
 docs/.bundle/
 docs/vendor/
 
@@ -516,6 +531,8 @@ def Main():
     Parser = argparse.ArgumentParser(description="Reset Project Himalaya repository")
     Parser.add_argument("--repo", dest="RepoDir", default=".", help="Path to repository directory")
     Parser.add_argument("--force", dest="Force", action="store_true", help="Skip confirmation prompts")
+    Parser.add_argument("--restore", dest="RestoreDir", metavar="BACKUP_DIR",
+                        help="Restore a backup made by an earlier reset instead of resetting")
     
     Args = Parser.parse_args()
     
@@ -525,7 +542,10 @@ def Main():
             Force=Args.Force
         )
         
-        Success = Resetter.Reset()
+        if Args.RestoreDir:
+            Success = Resetter.RestoreBackup(Args.RestoreDir)
+        else:
+            Success = Resetter.Reset()
         return 0 if Success else 1
     
     except Exception as Ex:
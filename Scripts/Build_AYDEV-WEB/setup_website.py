@@ -3,7 +3,7 @@
 # Path: ProjectHimalaya/setup_website.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-28
-# Last Modified: 2025-03-28  3:45PM
+# Last Modified: 2026-10-17  12:05PM
 # Description: Automates the setup of Project Himalaya website infrastructure
 
 """
@@ -15,13 +15,15 @@ and initializes the basic content structure.
 """
 
 import os
-import shutil
 import argparse
 import json
 import yaml
 from pathlib import Path
 import re
 
+from output_writer import OutputWriter
+from install_engine import InstallEngine
+
 class WebsiteSetup:
     """Handles the setup of the Project Himalaya website infrastructure."""
     
@@ -32,6 +34,8 @@ class WebsiteSetup:
         self.GithubDir = self.BaseDir / ".github" / "workflows"
         self.ArtifactsDir = Path("artifacts") if Artifacts is None else Path(Artifacts)
         self.Config = self.LoadConfig(ConfigPath)
+        self.Writer = OutputWriter(self.BaseDir)
+        self.Installer = InstallEngine(self.Writer)
         
     def LoadConfig(self, ConfigPath: str = None) -> dict:
         """Load configuration from file or use default."""
@@ -82,8 +86,8 @@ class WebsiteSetup:
         ArtifactPath = self.ArtifactsDir / ArtifactName
         
         if ArtifactPath.exists():
-            shutil.copy2(ArtifactPath, DestinationPath)
-            print(f"  Copied: {ArtifactName} -> {DestinationPath}")
+            Method = self.Installer.Install(ArtifactPath, DestinationPath)
+            print(f"  Installed ({Method}): {ArtifactName} -> {DestinationPath}")
         else:
             print(f"  Warning: Artifact {ArtifactName} not found")
     
@@ -104,16 +108,18 @@ class WebsiteSetup:
             "repo-readme.md": self.BaseDir / "README.md"
         }
         
-        for ArtifactName, DestinationPath in FileMap.items():
-            self.CopyArtifactToFile(ArtifactName, DestinationPath)
+        with self.Writer.Batch():
+            for ArtifactName, DestinationPath in FileMap.items():
+                self.CopyArtifactToFile(ArtifactName, DestinationPath)
+        
+        print(f"  Install summary: {self.Installer.Summary()}")
     
     def CreateCNAMEFile(self) -> None:
         """Create the CNAME file for custom domain."""
         print("Creating CNAME file...")
         
         CNAMEPath = self.DocsDir / "CNAME"
-        with open(CNAMEPath, 'w') as f:
-            f.write(self.Config["domain"])
+        self.Writer.WriteText(CNAMEPath, self.Config["domain"])
         
         print(f"  Created: {CNAMEPath}")
     
@@ -123,8 +129,7 @@ class WebsiteSetup:
         
         # Create custom color scheme
         ThemePath = self.DocsDir / "_sass" / "color_schemes" / "himalaya.scss"
-        with open(ThemePath, 'w') as f:
-            f.write(f"""$link-color: {self.Config["primary_color"]};
+        self.Writer.WriteText(ThemePath, f"""$link-color: {self.Config["primary_color"]};
 $btn-primary-color: {self.Config["primary_color"]};
 $body-background-color: #ffffff;
 $sidebar-color: #f7f7f7;
@@ -141,8 +146,7 @@ $body-heading-color: #27374D;
         PostsDir.mkdir(parents=True, exist_ok=True)
         
         PostPath = PostsDir / "2025-03-28-website-launch.md"
-        with open(PostPath, 'w') as f:
-            f.write("""---
+        self.Writer.WriteText(PostPath, """---
 layout: post
 title: "Project Himalaya Website Launch"
 date: 2025-03-28
@@ -181,10 +185,13 @@ Stay tuned for more updates as the project develops!
         print(f"Setting up Project Himalaya website in {self.BaseDir}")
         
         self.CreateDirectoryStructure()
-        self.CreateConfigurationFiles()
-        self.CreateCNAMEFile()
-        self.CreateCustomTheme()
-        self.CreateSampleBlogPost()
+        
+        # Install every file in one atomic commit
+        with self.Writer.Batch():
+            self.CreateConfigurationFiles()
+            self.CreateCNAMEFile()
+            self.CreateCustomTheme()
+            self.CreateSampleBlogPost()
         
         print("\nWebsite setup complete!")
         print("\nNext steps:")
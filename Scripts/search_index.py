@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# File: search_index.py
+# Path: AIDEV-WEB/scripts/search_index.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:58PM
+# Description: Prebuilt, sharded search index for the documentation site
+
+"""
+Search Index
+
+This module is the search stage of the site build. It splits every page of the
+docs, components and standards collections into sections at headings up to the
+configured `search.heading_level`, and tokenizes them with the configured
+`search.tokenizer_separator`. It then writes a prebuilt inverted index, so the
+browser does not have to build one from a full content dump at page load.
+
+The index is written to assets/js/search/:
+
+    manifest.json     separator, section count and the list of shards
+    docs-<n>.json     [page title, section title, url, preview] for a block of sections
+    shard-<c>.json    postings for the terms starting with character <c>
+
+Postings are flat [section, weight, section delta, weight, ...] lists with sorted
+keys, which keeps the files small and compressing well. The weight is the term
+frequency normalized by section length, so the client can score without loading
+any section data. The client fetches only the shards for the characters its query
+terms start with, and only the docs blocks that hold its top results. Per-document
+postings are cached between builds, so pages that were not re-rendered are not
+tokenized again.
+"""
+
+import re
+import json
+import math
+import html
+from pathlib import Path
+from typing import Optional
+
+# Minimal client that queries the prebuilt shards; written next to the index
+SEARCH_CLIENT = """(function () {
+  var root = document.currentScript.src.replace(/search-index\\.js.*$/, "search/");
+  var manifest = null, shards = {}, blocks = {};
+
+  function getJson(name) {
+    return fetch(root + name).then(function (r) { return r.json(); });
+  }
+
+  function ready() {
+    if (manifest) return Promise.resolve();
+    return getJson("manifest.json").then(function (m) { manifest = m; });
+  }
+
+  function section(id) {
+    var block = Math.floor(id / manifest.block_size);
+    if (!blocks[block]) blocks[block] = getJson("docs-" + block + ".json").then(function (b) { return b.docs; });
+    return blocks[block].then(function (docs) { return docs[id % manifest.block_size]; });
+  }
+
+  function tokenize(text) {
+    return text.toLowerCase().split(new RegExp(manifest.separator)).map(function (t) {
+      return t.replace(/^\\W+|\\W+$/g, "");
+    }).filter(Boolean);
+  }
+
+  function shardFor(term) {
+    var key = /[a-z0-9]/.test(term[0]) ? term[0] : "_";
+    if (!(key in manifest.shards)) return Promise.resolve({});
+    if (!shards[key]) shards[key] = getJson("shard-" + key + ".json").then(function (s) { return s.t; });
+    return shards[key];
+  }
+
+  window.SiteSearch = function (query) {
+    return ready().then(function () {
+      var terms = tokenize(query);
+      return Promise.all(terms.map(shardFor)).then(function (loaded) {
+        var scores = {};
+        terms.forEach(function (term, i) {
+          Object.keys(loaded[i]).forEach(function (key) {
+            if (key.indexOf(term) !== 0) return;
+            var postings = loaded[i][key], idf = Math.log(1 + manifest.sections / (postings.length / 2));
+            var boost = key === term ? 1 : 0.5, doc = 0;
+            for (var p = 0; p < postings.length; p += 2) {
+              doc += postings[p];
+              scores[doc] = (scores[doc] || 0) + boost * idf * postings[p + 1];
+            }
+          });
+        });
+        var top = Object.keys(scores).sort(function (a, b) { return scores[b] - scores[a]; }).slice(0, 20);
+        return Promise.all(top.map(function (id) {
+          return section(+id).then(function (d) {
+            return { title: d[0], section: d[1], url: d[2], preview: d[3], score: scores[id] };
+          });
+        }));
+      });
+    });
+  };
+})();
+"""
+
+class SearchIndexBuilder:
+    """Builds the sharded inverted index for the searchable collections."""
+
+    Collections = ("docs", "components", "standards")
+    IndexDir = "assets/js/search"
+    BlockSize = 1000
+    CacheVersion = 2
+
+    def __init__(self, Config: dict, CacheDir: Path):
+        """Initialize the search index builder.
+
+        Args:
+            Config: Site configuration (reads search_enabled and search)
+            CacheDir: Directory for the per-document postings cache
+        """
+        Search = Config.get("search") or {}
+        self.Config = Config.get("search")
+        self.HeadingLevel = int(Search.get("heading_level", 2))
+        self.PreviewWords = int(Search.get("preview_words_before", 5)) + int(Search.get("preview_words_after", 10)) + 1
+        self.Separator = self.ParseSeparator(Search.get("tokenizer_separator", r"/[\s\-/]+/"))
+        self.SeparatorPattern = re.compile(self.Separator)
+        self.CachePath = Path(CacheDir) / "search.json"
+        self.Cache = {}
+        self.Files = []
+        self.Stats = {}
+        self.LoadCache()
+
+    def ParseSeparator(self, Separator: str) -> str:
+        """Convert a JavaScript regex literal such as /[\\s/]+/ to a pattern string."""
+        Match = re.fullmatch(r'/(.*)/[a-z]*', Separator.strip())
+        return Match.group(1) if Match else Separator
+
+    #
+    # Tokenizing
+    #
+
+    def Tokenize(self, Text: str) -> list:
+        """Split text into lowercase terms the way the client tokenizes queries."""
+        Terms = []
+        for Token in self.SeparatorPattern.split(Text.lower()):
+            Token = re.sub(r'^\W+|\W+$', '', Token)
+            if Token:
+                Terms.append(Token)
+        return Terms
+
+    def ExtractSections(self, Document) -> list:
+        """Split a document's rendered HTML into (section title, url, text) at headings."""
+        Title = str(Document.Data.get("title") or "")
+        Pattern = re.compile(rf'<h([1-{self.HeadingLevel}])([^>]*)>(.*?)</h\1>', re.DOTALL | re.IGNORECASE)
+
+        Sections = []
+        Position = 0
+        Heading, Anchor = Title, ""
+        for Match in Pattern.finditer(Document.Content or ""):
+            Sections.append((Heading, Anchor, Document.Content[Position:Match.start()]))
+            IdMatch = re.search(r'\bid="([^"]+)"', Match.group(2))
+            Heading = self.PlainText(Match.group(3))
+            Anchor = f"#{IdMatch.group(1)}" if IdMatch else ""
+            Position = Match.end()
+        Sections.append((Heading, Anchor, (Document.Content or "")[Position:]))
+
+        Result = []
+        for Heading, Anchor, Body in Sections:
+            Text = self.PlainText(Body)
+            if Text or Heading:
+                Result.append((Heading, Document.Url + Anchor, Text))
+        return Result
+
+    def PlainText(self, Html: str) -> str:
+        """Strip tags and collapse whitespace."""
+        Text = re.sub(r'<(script|style)\b.*?</\1>', ' ', Html, flags=re.DOTALL | re.IGNORECASE)
+        Text = html.unescape(re.sub(r'<[^>]+>', ' ', Text))
+        return re.sub(r'\s+', ' ', Text).strip()
+
+    def IndexDocument(self, Document) -> list:
+        """Return [page title, section title, url, preview, term weights] per section."""
+        PageTitle = str(Document.Data.get("title") or "")
+        Entries = []
+        for Heading, Url, Text in self.ExtractSections(Document):
+            Terms = self.Tokenize(f"{Heading} {Text}")
+            Frequencies = {}
+            for Term in Terms:
+                Frequencies[Term] = Frequencies.get(Term, 0) + 1
+
+            # Integer weights (tf / sqrt(length)) keep the postings compact
+            Norm = 1000 / math.sqrt(max(1, len(Terms)))
+            Weights = {Term: max(1, round(Count * Norm)) for Term, Count in Frequencies.items()}
+            Preview = " ".join(Text.split()[:self.PreviewWords])
+            Entries.append([PageTitle, Heading, Url, Preview, Weights])
+        return Entries
+
+    #
+    # Cache
+    #
+
+    def Settings(self) -> list:
+        """Settings that cached postings depend on."""
+        return [self.Separator, self.HeadingLevel, self.PreviewWords]
+
+    def LoadCache(self) -> None:
+        """Load per-document postings and the index file list from the previous build."""
+        try:
+            with open(self.CachePath, 'r') as f:
+                Cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        if Cache.get("version") != self.CacheVersion or Cache.get("settings") != self.Settings():
+            return
+        self.Cache = Cache.get("documents", {})
+        self.Files = Cache.get("files", [])
+
+    def SaveCache(self) -> None:
+        """Persist per-document postings for the next build."""
+        self.CachePath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.CachePath, 'w') as f:
+            f.write(json.dumps({
+                "version": self.CacheVersion,
+                "settings": self.Settings(),
+                "files": self.Files,
+                "documents": self.Cache
+            }, separators=(",", ":")))
+
+    #
+    # Index
+    #
+
+    def IsSearchable(self, Document) -> bool:
+        """Check whether a document belongs in the index."""
+        return Document.Collection in self.Collections and not Document.Data.get("search_exclude") and Document.OutputExtension == ".html"
+
+    def Build(self, Documents: list, Rendered: set) -> Optional[dict]:
+        """Build the index files.
+
+        Args:
+            Documents: All site documents
+            Rendered: Relative paths of documents rendered in this build. Other
+                documents reuse their cached postings.
+
+        Returns:
+            Mapping of output path (relative to the site root) to file content, or
+            None if nothing searchable changed since the previous build. The
+            client and manifest are always written once, even with no sections.
+        """
+        Searchable = [Document for Document in Documents if self.IsSearchable(Document)]
+        Names = [Document.RelativePath for Document in Searchable]
+
+        # The layout loads the client whenever search is enabled, so the first
+        # build writes it and an empty manifest even with nothing to index
+        Changed = not self.Files or set(Names) != set(self.Cache) or any(Name in Rendered for Name in Names)
+        if not Changed:
+            return None
+
+        Cache = {}
+        for Document in Searchable:
+            if Document.RelativePath in Rendered or Document.RelativePath not in self.Cache:
+                Cache[Document.RelativePath] = self.IndexDocument(Document)
+            else:
+                Cache[Document.RelativePath] = self.Cache[Document.RelativePath]
+        self.Cache = Cache
+
+        DocsList = []
+        Postings = {}
+        for Name in sorted(Cache):
+            for PageTitle, Heading, Url, Preview, Weights in Cache[Name]:
+                DocId = len(DocsList)
+                DocsList.append([PageTitle, Heading, Url, Preview])
+                for Term, Weight in Weights.items():
+                    Postings.setdefault(Term, []).append((DocId, Weight))
+
+        Shards = {}
+        for Term in sorted(Postings):
+            Key = Term[0] if re.match(r'[a-z0-9]', Term[0]) else "_"
+            Flat = []
+            Previous = 0
+            for DocId, Weight in Postings[Term]:
+                Flat.extend((DocId - Previous, Weight))
+                Previous = DocId
+            Shards.setdefault(Key, {})[Term] = Flat
+
+        Files = {}
+        Manifest = {
+            "version": 1,
+            "separator": self.Separator,
+            "heading_level": self.HeadingLevel,
+            "sections": len(DocsList),
+            "block_size": self.BlockSize,
+            "shards": {}
+        }
+        for Key, Terms in sorted(Shards.items()):
+            Content = json.dumps({"t": Terms}, separators=(",", ":"), ensure_ascii=False)
+            Files[f"{self.IndexDir}/shard-{Key}.json"] = Content
+            Manifest["shards"][Key] = {"terms": len(Terms), "bytes": len(Content.encode('utf-8'))}
+
+        for Start in range(0, len(DocsList), self.BlockSize):
+            Block = DocsList[Start:Start + self.BlockSize]
+            Files[f"{self.IndexDir}/docs-{Start // self.BlockSize}.json"] = json.dumps({"docs": Block}, separators=(",", ":"), ensure_ascii=False)
+        Files[f"{self.IndexDir}/manifest.json"] = json.dumps(Manifest, separators=(",", ":"))
+        Files["assets/js/search-index.js"] = SEARCH_CLIENT
+
+        self.Files = sorted(Files)
+        self.SaveCache()
+
+        self.Stats = {
+            "sections": len(DocsList),
+            "terms": len(Postings),
+            "shards": len(Shards),
+            "bytes": sum(len(Content.encode('utf-8')) for Content in Files.values())
+        }
+        return Files
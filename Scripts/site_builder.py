@@ -0,0 +1,1632 @@
+#!/usr/bin/env python3
+# File: site_builder.py
+# Path: AIDEV-WEB/scripts/site_builder.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: In-process Markdown-to-HTML build engine for the documentation site
+
+"""
+Site Builder
+
+This module builds the documentation site without Ruby or Jekyll. It understands the
+subset of `_config.yml` that the Project Himalaya scripts generate: the docs,
+components and standards collections, front matter `defaults`, collection
+permalinks such as `/:collection/:path/`, and `_posts`. Pages, collection documents
+and posts are rendered with a small Liquid subset, converted from Markdown and
+wrapped in layouts from `_layouts` (or a built-in fallback layout when the site
+uses a remote theme). Everything else is copied as a static file.
+
+Builds are incremental: a dependency graph from each document to the layouts,
+includes and `site` keys it used is persisted between runs, and only documents
+whose inputs changed are re-rendered. `--watch` rebuilds on every change.
+
+Markdown conversion uses the `markdown` package when it is installed and a built-in
+converter for the common block and inline syntax otherwise.
+"""
+
+import os
+import re
+import posixpath
+import sys
+import html
+import json
+import time
+import shutil
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime, date
+from functools import lru_cache
+from typing import Optional
+
+import yaml
+
+from site_watcher import SiteWatcher
+from search_index import SearchIndexBuilder
+
+try:
+    import markdown as MarkdownLib
+except ImportError:
+    MarkdownLib = None
+
+# The libyaml loader parses front matter several times faster when it is available
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+MARKDOWN_EXTENSIONS = (".md", ".markdown", ".mkd", ".mkdn")
+
+DEFAULT_EXCLUDES = [
+    ".sass-cache", ".jekyll-cache", "gemfiles", "Gemfile", "Gemfile.lock",
+    "node_modules", "vendor"
+]
+
+DEFAULT_PERMALINKS = {
+    "date": "/:categories/:year/:month/:day/:title:output_ext",
+    "pretty": "/:categories/:year/:month/:day/:title/",
+    "ordinal": "/:categories/:year/:y_day/:title:output_ext",
+    "none": "/:categories/:title:output_ext"
+}
+
+# Used when a layout is not present in _layouts (e.g. it comes from a remote theme)
+BUILTIN_LAYOUTS = {
+    "default": """<!DOCTYPE html>
+<html lang="{{ site.lang | default: "en-US" }}">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>{% if page.title %}{{ page.title | escape }} - {% endif %}{{ site.title | escape }}</title>
+  <meta name="description" content="{{ page.description | default: site.description | escape }}">
+  <link rel="stylesheet" href="{{ "/assets/css/style.css" | relative_url }}">
+</head>
+<body>
+  <nav class="site-nav">
+    <a class="site-title" href="{{ "/" | relative_url }}">{{ site.title | escape }}</a>
+    {% if site.search_enabled %}<input type="search" id="search-input" placeholder="Search {{ site.title | escape }}" aria-label="Search">
+    <ul id="search-results"></ul>{% endif %}
+    <ul class="nav-list">
+      {% for item in site.navigation %}<li class="nav-list-item"><a href="{{ item.url | relative_url }}">{{ item.title | escape }}</a></li>
+      {% endfor %}
+    </ul>
+  </nav>
+  <main class="main-content">
+{{ content }}
+  </main>
+  {% if site.footer_content %}<footer class="site-footer">{{ site.footer_content }}</footer>{% endif %}
+  {% if site.search_enabled %}<script src="{{ "/assets/js/search-index.js" | relative_url }}"></script>
+  <script>
+    document.getElementById("search-input").addEventListener("input", function (event) {
+      var list = document.getElementById("search-results");
+      if (!event.target.value.trim()) { list.replaceChildren(); return; }
+      SiteSearch(event.target.value).then(function (results) {
+        list.replaceChildren.apply(list, results.map(function (r) {
+          var item = document.createElement("li"), link = document.createElement("a");
+          link.href = "{{ site.baseurl }}" + r.url;
+          link.textContent = r.title + (r.section && r.section !== r.title ? " \u203a " + r.section : "");
+          item.appendChild(link);
+          return item;
+        }));
+      });
+    });
+  </script>{% endif %}
+</body>
+</html>
+""",
+    "home": """---
+layout: default
+---
+{{ content }}
+""",
+    "page": """---
+layout: default
+---
+{{ content }}
+""",
+    "post": """---
+layout: default
+---
+<article class="post">
+  <h1 class="post-title">{{ page.title | escape }}</h1>
+  <p class="post-meta">{{ page.date | date: "%b %d, %Y" }}{% if page.author %} &middot; {{ page.author | escape }}{% endif %}</p>
+{{ content }}
+</article>
+"""
+}
+
+#
+# Front Matter
+#
+
+FrontMatterPattern = re.compile(r'\A---\s*\n(.*?\n)?(?:---|\.\.\.)\s*(?:\n|\Z)', re.DOTALL)
+
+def SplitFrontMatter(Text: str) -> tuple:
+    """Split a file into (front matter dict or None, body)."""
+    Match = FrontMatterPattern.match(Text)
+    if not Match:
+        return None, Text
+
+    Data = yaml.load(Match.group(1) or "", Loader=YamlLoader) or {}
+    if not isinstance(Data, dict):
+        Data = {}
+    return Data, Text[Match.end():]
+
+def HasFrontMatter(FilePath: Path) -> bool:
+    """Check whether a file starts with a front matter block."""
+    try:
+        with open(FilePath, 'rb') as f:
+            return f.read(4) in (b"---\n", b"---\r")
+    except OSError:
+        return False
+
+def ToDateTime(Value) -> Optional[datetime]:
+    """Convert a front matter date value to a datetime."""
+    if isinstance(Value, datetime):
+        return Value
+    if isinstance(Value, date):
+        return datetime(Value.year, Value.month, Value.day)
+    if isinstance(Value, str):
+        for Format in ("%Y-%m-%d %H:%M:%S %z", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+            try:
+                return datetime.strptime(Value.strip(), Format)
+            except ValueError:
+                continue
+    return None
+
+def Slugify(Text: str) -> str:
+    """Convert text to a URL slug the way kramdown builds header ids."""
+    Slug = re.sub(r'<[^>]+>', '', Text).strip().lower()
+    Slug = re.sub(r'[^\w\- ]', '', Slug)
+    return re.sub(r'\s+', '-', Slug)
+
+#
+# Liquid
+#
+
+class LiquidTemplate:
+    """A compiled template in the Liquid subset used by the site.
+
+    Supports output tags with filters, if/elsif/else/unless, for loops with limit,
+    offset and reversed, assign, capture, include, comment and raw. Unknown tags
+    (plugin tags such as `seo` or `feed_meta`) render as nothing.
+    """
+
+    TokenPattern = re.compile(r'(\{%-?\s*raw\s*-?%\}.*?\{%-?\s*endraw\s*-?%\}|\{%-?.*?-?%\}|\{\{-?.*?-?\}\})', re.DOTALL)
+    RawPattern = re.compile(r'\{%-?\s*raw\s*-?%\}(.*?)\{%-?\s*endraw\s*-?%\}', re.DOTALL)
+
+    def __init__(self, Source: str, Name: str = "template"):
+        """Compile the template source."""
+        self.Name = Name
+        self.Nodes = self.Parse(self.Tokenize(Source))
+
+    def Tokenize(self, Source: str) -> list:
+        """Split source into text, output and tag tokens, honouring whitespace control."""
+        Tokens = []
+        for Part in self.TokenPattern.split(Source):
+            if not Part:
+                continue
+            RawMatch = self.RawPattern.fullmatch(Part)
+            if RawMatch:
+                Tokens.append(("text", RawMatch.group(1)))
+            elif Part.startswith("{{"):
+                Tokens.append(("output", Part[2:-2], Part.startswith("{{-"), Part.endswith("-}}")))
+            elif Part.startswith("{%"):
+                Tokens.append(("tag", Part[2:-2], Part.startswith("{%-"), Part.endswith("-%}")))
+            else:
+                Tokens.append(("text", Part))
+
+        # Apply {%- -%} / {{- -}} whitespace stripping to neighbouring text
+        for Index, Token in enumerate(Tokens):
+            if Token[0] == "text":
+                continue
+            if Token[2] and Index > 0 and Tokens[Index - 1][0] == "text":
+                Tokens[Index - 1] = ("text", Tokens[Index - 1][1].rstrip())
+            if Token[3] and Index + 1 < len(Tokens) and Tokens[Index + 1][0] == "text":
+                Tokens[Index + 1] = ("text", Tokens[Index + 1][1].lstrip())
+
+        return [(Token[0], Token[1].strip("-").strip() if Token[0] != "text" else Token[1]) for Token in Tokens]
+
+    def Parse(self, Tokens: list) -> list:
+        """Build a node tree from the token list."""
+        self.Position = 0
+        Nodes, _ = self.ParseBlock(Tokens, ())
+        return Nodes
+
+    def ParseBlock(self, Tokens: list, Terminators: tuple) -> tuple:
+        """Parse nodes until one of the terminator tags; return (nodes, terminator)."""
+        Nodes = []
+        while self.Position < len(Tokens):
+            Kind, Value = Tokens[self.Position]
+            self.Position += 1
+
+            if Kind == "text":
+                Nodes.append(("text", Value))
+                continue
+            if Kind == "output":
+                Nodes.append(("output", Value))
+                continue
+
+            TagName, _, Markup = Value.partition(" ")
+            Markup = Markup.strip()
+
+            if TagName in Terminators:
+                return Nodes, (TagName, Markup)
+
+            if TagName in ("if", "unless"):
+                Branches = []
+                Condition = Markup
+                ElseNodes = []
+                while True:
+                    Body, (EndTag, EndMarkup) = self.ParseBlock(Tokens, ("elsif", "else", "end" + TagName))
+                    Branches.append((Condition, Body))
+                    if EndTag == "elsif":
+                        Condition = EndMarkup
+                        continue
+                    if EndTag == "else":
+                        ElseNodes, _ = self.ParseBlock(Tokens, ("end" + TagName,))
+                    break
+                Nodes.append((TagName, Branches, ElseNodes))
+            elif TagName == "for":
+                Body, (EndTag, _) = self.ParseBlock(Tokens, ("else", "endfor"))
+                ElseNodes = []
+                if EndTag == "else":
+                    ElseNodes, _ = self.ParseBlock(Tokens, ("endfor",))
+                Nodes.append(("for", Markup, Body, ElseNodes))
+            elif TagName == "capture":
+                Body, _ = self.ParseBlock(Tokens, ("endcapture",))
+                Nodes.append(("capture", Markup, Body))
+            elif TagName == "comment":
+                self.ParseBlock(Tokens, ("endcomment",))
+            elif TagName == "assign":
+                Nodes.append(("assign", Markup))
+            elif TagName == "include":
+                Nodes.append(("include", Markup))
+            # Other tags come from plugins and render as nothing
+
+        if Terminators:
+            raise ValueError(f"{self.Name}: missing {{% {Terminators[-1]} %}}")
+        return Nodes, (None, "")
+
+    def Render(self, Context: dict, Includes=None) -> str:
+        """Render the template with a variable context.
+
+        Args:
+            Context: Variables visible to the template
+            Includes: Callable mapping an include name to a LiquidTemplate
+        """
+        self.Includes = Includes
+        Output = []
+        self.RenderNodes(self.Nodes, dict(Context), Output)
+        return "".join(Output)
+
+    def RenderNodes(self, Nodes: list, Scope: dict, Output: list) -> None:
+        """Render a node list into the output buffer."""
+        for Node in Nodes:
+            Kind = Node[0]
+            if Kind == "text":
+                Output.append(Node[1])
+            elif Kind == "output":
+                Output.append(ToLiquidString(EvaluateExpression(Node[1], Scope)))
+            elif Kind in ("if", "unless"):
+                for Index, (Condition, Body) in enumerate(Node[1]):
+                    Result = EvaluateCondition(Condition, Scope)
+                    if Kind == "unless" and Index == 0:
+                        Result = not Result
+                    if Result:
+                        self.RenderNodes(Body, Scope, Output)
+                        break
+                else:
+                    self.RenderNodes(Node[2], Scope, Output)
+            elif Kind == "for":
+                self.RenderFor(Node, Scope, Output)
+            elif Kind == "assign":
+                Name, _, Expression = Node[1].partition("=")
+                Scope[Name.strip()] = EvaluateExpression(Expression.strip(), Scope)
+            elif Kind == "capture":
+                Captured = []
+                self.RenderNodes(Node[2], Scope, Captured)
+                Scope[Node[1].strip()] = "".join(Captured)
+            elif Kind == "include":
+                self.RenderInclude(Node[1], Scope, Output)
+
+    def RenderFor(self, Node: tuple, Scope: dict, Output: list) -> None:
+        """Render a for loop."""
+        Match = re.match(r'(\w+)\s+in\s+(\S+)(.*)', Node[1])
+        if not Match:
+            return
+
+        Variable, Expression, Options = Match.groups()
+        Items = EvaluateExpression(Expression, Scope)
+        if isinstance(Items, dict):
+            Items = list(Items.items())
+        Items = list(Items or [])
+
+        OffsetMatch = re.search(r'offset:\s*(\S+)', Options)
+        if OffsetMatch:
+            Items = Items[int(EvaluateExpression(OffsetMatch.group(1), Scope) or 0):]
+        LimitMatch = re.search(r'limit:\s*(\S+)', Options)
+        if LimitMatch:
+            Items = Items[:int(EvaluateExpression(LimitMatch.group(1), Scope) or 0)]
+        if re.search(r'\breversed\b', Options):
+            Items.reverse()
+
+        if not Items:
+            self.RenderNodes(Node[3], Scope, Output)
+            return
+
+        LoopScope = dict(Scope)
+        for Index, Item in enumerate(Items):
+            LoopScope[Variable] = Item
+            LoopScope["forloop"] = {
+                "index": Index + 1, "index0": Index, "first": Index == 0,
+                "last": Index == len(Items) - 1, "length": len(Items),
+                "rindex": len(Items) - Index, "rindex0": len(Items) - Index - 1
+            }
+            self.RenderNodes(Node[2], LoopScope, Output)
+
+    def RenderInclude(self, Markup: str, Scope: dict, Output: list) -> None:
+        """Render an include with its parameters."""
+        if self.Includes is None:
+            return
+
+        Name, _, Parameters = Markup.partition(" ")
+        Template = self.Includes(Name.strip())
+        if Template is None:
+            return
+
+        IncludeScope = dict(Scope)
+        IncludeScope["include"] = {
+            Key: EvaluateExpression(Value, Scope)
+            for Key, Value in re.findall(r'(\w+)\s*=\s*("[^"]*"|\'[^\']*\'|\S+)', Parameters)
+        }
+        Output.append(Template.Render(IncludeScope, self.Includes))
+
+def ToLiquidString(Value) -> str:
+    """Convert a value to its Liquid output string."""
+    if Value is None:
+        return ""
+    if isinstance(Value, bool):
+        return "true" if Value else "false"
+    if isinstance(Value, (list, tuple)):
+        return "".join(ToLiquidString(Item) for Item in Value)
+    if isinstance(Value, datetime):
+        return Value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(Value, dict) and "content" in Value:
+        return ToLiquidString(Value.get("content"))
+    return str(Value)
+
+@lru_cache(maxsize=8192)
+def SplitOutside(Text: str, Separator: str) -> tuple:
+    """Split on a separator that is not inside quotes.
+
+    Results are cached because layouts evaluate the same expressions for every page.
+    """
+    Parts = []
+    Current = []
+    Quote = None
+    Index = 0
+    while Index < len(Text):
+        Char = Text[Index]
+        if Quote:
+            if Char == Quote:
+                Quote = None
+        elif Char in ("'", '"'):
+            Quote = Char
+        elif Text.startswith(Separator, Index):
+            Parts.append("".join(Current))
+            Current = []
+            Index += len(Separator)
+            continue
+        Current.append(Char)
+        Index += 1
+    Parts.append("".join(Current))
+    return tuple(Parts)
+
+@lru_cache(maxsize=8192)
+def SplitVariablePath(Path: str) -> tuple:
+    """Split a variable path into its dotted and bracketed parts."""
+    return tuple(re.findall(r'[^.\[\]]+|\[[^\]]+\]', Path))
+
+def LookupVariable(Path: str, Scope: dict):
+    """Resolve a dotted/indexed variable path such as site.data.nav[0].title."""
+    Value = Scope
+    for Part in SplitVariablePath(Path):
+        if Part.startswith("["):
+            Key = EvaluateExpression(Part[1:-1], Scope)
+        else:
+            Key = Part
+
+        if isinstance(Value, dict):
+            Value = Value.get(Key)
+        elif isinstance(Value, (list, tuple, str)):
+            if Key == "size":
+                Value = len(Value)
+            elif Key == "first":
+                Value = Value[0] if Value else None
+            elif Key == "last":
+                Value = Value[-1] if Value else None
+            elif isinstance(Key, int) and -len(Value) <= Key < len(Value):
+                Value = Value[Key]
+            else:
+                Value = None
+        else:
+            return None
+
+        if Value is None:
+            return None
+    return Value
+
+def EvaluateLiteral(Expression: str, Scope: dict):
+    """Evaluate a literal or variable reference."""
+    Expression = Expression.strip()
+    if not Expression:
+        return None
+    if Expression[0] in ("'", '"') and Expression[-1] == Expression[0] and len(Expression) >= 2:
+        return Expression[1:-1]
+    if re.fullmatch(r'-?\d+', Expression):
+        return int(Expression)
+    if re.fullmatch(r'-?\d+\.\d+', Expression):
+        return float(Expression)
+    if Expression in ("true", "false"):
+        return Expression == "true"
+    if Expression in ("nil", "null"):
+        return None
+    if Expression == "empty":
+        return ""
+    return LookupVariable(Expression, Scope)
+
+def EvaluateExpression(Expression: str, Scope: dict):
+    """Evaluate a value followed by an optional chain of filters."""
+    Parts = SplitOutside(Expression, "|")
+    Value = EvaluateLiteral(Parts[0], Scope)
+
+    for FilterMarkup in Parts[1:]:
+        Name, _, Arguments = FilterMarkup.strip().partition(":")
+        Arguments = [EvaluateLiteral(Argument, Scope) for Argument in SplitOutside(Arguments, ",")] if Arguments.strip() else []
+        Filter = LIQUID_FILTERS.get(Name.strip())
+        if Filter is not None:
+            Value = Filter(Value, Scope, *Arguments)
+
+    return Value
+
+def EvaluateCondition(Condition: str, Scope: dict) -> bool:
+    """Evaluate a condition with and/or and comparison operators."""
+    for Operator in (" or ", " and "):
+        Parts = SplitOutside(Condition, Operator)
+        if len(Parts) > 1:
+            if Operator == " or ":
+                return any(EvaluateCondition(Part, Scope) for Part in Parts)
+            return all(EvaluateCondition(Part, Scope) for Part in Parts)
+
+    Match = re.match(r'(.+?)\s*(==|!=|<>|<=|>=|<|>|\bcontains\b)\s*(.+)', Condition.strip())
+    if not Match:
+        Value = EvaluateExpression(Condition, Scope)
+        return Value is not None and Value is not False
+
+    Left = EvaluateLiteral(Match.group(1), Scope)
+    Right = EvaluateLiteral(Match.group(3), Scope)
+    Operator = Match.group(2)
+
+    if Match.group(3).strip() == "empty":
+        return (Left in ("", [], {}, None)) == (Operator == "==")
+
+    try:
+        if Operator == "==":
+            return Left == Right
+        if Operator in ("!=", "<>"):
+            return Left != Right
+        if Operator == "contains":
+            return Left is not None and Right in Left
+        if Operator == "<":
+            return Left < Right
+        if Operator == ">":
+            return Left > Right
+        if Operator == "<=":
+            return Left <= Right
+        if Operator == ">=":
+            return Left >= Right
+    except TypeError:
+        return False
+    return False
+
+def FilterDate(Value, Scope: dict, Format: str = "%Y-%m-%d") -> str:
+    """Liquid date filter."""
+    Moment = datetime.now() if Value in ("now", "today") else ToDateTime(Value)
+    return Moment.strftime(Format) if Moment else ToLiquidString(Value)
+
+def FilterRelativeUrl(Value, Scope: dict) -> str:
+    """Prefix a site path with the base URL."""
+    Path = ToLiquidString(Value)
+    if re.match(r'^[a-z]+:|^//', Path):
+        return Path
+    BaseUrl = (LookupVariable("site.baseurl", Scope) or "").rstrip("/")
+    return BaseUrl + "/" + Path.lstrip("/") if Path else BaseUrl + "/"
+
+def FilterAbsoluteUrl(Value, Scope: dict) -> str:
+    """Prefix a site path with the site URL and base URL."""
+    Relative = FilterRelativeUrl(Value, Scope)
+    if re.match(r'^[a-z]+:|^//', Relative):
+        return Relative
+    return (LookupVariable("site.url", Scope) or "").rstrip("/") + Relative
+
+def FilterWhere(Value, Scope: dict, Key=None, Expected=None) -> list:
+    """Select items whose property equals a value."""
+    return [Item for Item in (Value or []) if isinstance(Item, dict) and str(Item.get(Key)) == str(Expected)]
+
+def FilterSort(Value, Scope: dict, Key=None) -> list:
+    """Sort items, optionally by a property."""
+    Items = list(Value or [])
+    if Key is None:
+        return sorted(Items, key=ToLiquidString)
+    return sorted(Items, key=lambda Item: (Item.get(Key) is None, ToLiquidString(Item.get(Key))))
+
+LIQUID_FILTERS = {
+    "date": FilterDate,
+    "date_to_xmlschema": lambda Value, Scope: FilterDate(Value, Scope, "%Y-%m-%dT%H:%M:%S+00:00"),
+    "date_to_string": lambda Value, Scope: FilterDate(Value, Scope, "%d %b %Y"),
+    "relative_url": FilterRelativeUrl,
+    "absolute_url": FilterAbsoluteUrl,
+    "escape": lambda Value, Scope: html.escape(ToLiquidString(Value)),
+    "xml_escape": lambda Value, Scope: html.escape(ToLiquidString(Value)),
+    "strip_html": lambda Value, Scope: re.sub(r'<[^>]*>', '', ToLiquidString(Value)),
+    "strip_newlines": lambda Value, Scope: ToLiquidString(Value).replace("\n", ""),
+    "strip": lambda Value, Scope: ToLiquidString(Value).strip(),
+    "upcase": lambda Value, Scope: ToLiquidString(Value).upper(),
+    "downcase": lambda Value, Scope: ToLiquidString(Value).lower(),
+    "capitalize": lambda Value, Scope: ToLiquidString(Value).capitalize(),
+    "slugify": lambda Value, Scope: Slugify(ToLiquidString(Value)),
+    "append": lambda Value, Scope, Suffix="": ToLiquidString(Value) + ToLiquidString(Suffix),
+    "prepend": lambda Value, Scope, Prefix="": ToLiquidString(Prefix) + ToLiquidString(Value),
+    "replace": lambda Value, Scope, Old="", New="": ToLiquidString(Value).replace(ToLiquidString(Old), ToLiquidString(New)),
+    "remove": lambda Value, Scope, Old="": ToLiquidString(Value).replace(ToLiquidString(Old), ""),
+    "split": lambda Value, Scope, Separator=" ": ToLiquidString(Value).split(Separator),
+    "join": lambda Value, Scope, Separator=" ": Separator.join(ToLiquidString(Item) for Item in (Value or [])),
+    "truncatewords": lambda Value, Scope, Count=15: " ".join(ToLiquidString(Value).split()[:int(Count)]),
+    "number_of_words": lambda Value, Scope: len(ToLiquidString(Value).split()),
+    "size": lambda Value, Scope: len(Value) if Value is not None else 0,
+    "first": lambda Value, Scope: Value[0] if Value else None,
+    "last": lambda Value, Scope: Value[-1] if Value else None,
+    "reverse": lambda Value, Scope: list(reversed(list(Value or []))),
+    "default": lambda Value, Scope, Fallback="": Value if Value not in (None, False, "", [], {}) else Fallback,
+    "jsonify": lambda Value, Scope: json.dumps(Value, default=ToLiquidString),
+    "markdownify": lambda Value, Scope: MarkdownConverter().Convert(ToLiquidString(Value)),
+    "where": FilterWhere,
+    "sort": FilterSort
+}
+
+#
+# Markdown
+#
+
+IalPattern = re.compile(r'^\s*\{:\s*([^}]*)\}\s*$')
+
+def ParseIal(Markup: str) -> str:
+    """Convert kramdown inline attribute list markup to an HTML attribute string."""
+    Classes = re.findall(r'\.([\w-]+)', Markup)
+    IdMatch = re.search(r'#([\w-]+)', Markup)
+    Attributes = []
+    if IdMatch:
+        Attributes.append(f' id="{IdMatch.group(1)}"')
+    if Classes:
+        Attributes.append(f' class="{" ".join(Classes)}"')
+    for Key, Value in re.findall(r'([\w-]+)="([^"]*)"', Markup):
+        Attributes.append(f' {Key}="{html.escape(Value)}"')
+    return "".join(Attributes)
+
+def AttachHeadingIals(Text: str) -> str:
+    """Move standalone kramdown IAL lines onto the heading above them."""
+    Lines = Text.split("\n")
+    Result = []
+    for Line in Lines:
+        if IalPattern.match(Line) and Result and Result[-1].lstrip().startswith("#"):
+            Result[-1] = f"{Result[-1].rstrip()} {Line.strip()}"
+            continue
+        Result.append(Line)
+    return "\n".join(Result)
+
+class MarkdownConverter:
+    """Converts Markdown to HTML with the markdown package or the built-in fallback."""
+
+    BlockStarters = re.compile(r'^(#{1,6}\s|```|~~~|>|\s{0,3}([-*+]|\d+\.)\s+|\s{0,3}(\*\s*){3,}$|\s{0,3}(-\s*){3,}$|<(div|table|pre|p|ul|ol|h\d|section|details|figure|blockquote|hr|script|style)\b)')
+
+    def __init__(self):
+        """Initialize the converter."""
+        self.Engine = None
+        if MarkdownLib is not None:
+            self.Engine = MarkdownLib.Markdown(extensions=["extra", "toc", "sane_lists"])
+
+    def Convert(self, Text: str) -> str:
+        """Convert Markdown text to HTML."""
+        Text = AttachHeadingIals(Text.replace("\r\n", "\n"))
+        if self.Engine is not None:
+            self.Engine.reset()
+            return self.Engine.convert(Text)
+        return self.RenderBlocks(Text.split("\n"))
+
+    #
+    # Built-in block parser
+    #
+
+    def RenderBlocks(self, Lines: list) -> str:
+        """Render a list of lines as HTML blocks."""
+        Output = []
+        Index = 0
+
+        while Index < len(Lines):
+            Line = Lines[Index]
+            Stripped = Line.strip()
+
+            if not Stripped:
+                Index += 1
+                continue
+
+            # Fenced code
+            FenceMatch = re.match(r'^\s*(```|~~~)\s*([\w+-]*)', Line)
+            if FenceMatch:
+                Fence, Language = FenceMatch.groups()
+                Index += 1
+                Code = []
+                while Index < len(Lines) and not Lines[Index].strip().startswith(Fence):
+                    Code.append(Lines[Index])
+                    Index += 1
+                Index += 1
+                ClassAttribute = f' class="language-{Language}"' if Language else ""
+                Output.append(f"<pre><code{ClassAttribute}>{html.escape(chr(10).join(Code))}\n</code></pre>")
+                continue
+
+            # Headings
+            HeadingMatch = re.match(r'^(#{1,6})\s+(.*?)\s*#*\s*(\{:([^}]*)\})?\s*$', Line)
+            if HeadingMatch:
+                Level = len(HeadingMatch.group(1))
+                Text = HeadingMatch.group(2)
+                Attributes = ParseIal(HeadingMatch.group(4) or "")
+                if ' id="' not in Attributes:
+                    Attributes = f' id="{Slugify(Text)}"' + Attributes
+                Output.append(f"<h{Level}{Attributes}>{self.RenderInline(Text)}</h{Level}>")
+                Index += 1
+                continue
+
+            # Horizontal rules
+            if re.match(r'^\s{0,3}((\*\s*){3,}|(-\s*){3,}|(_\s*){3,})$', Line):
+                Output.append("<hr />")
+                Index += 1
+                continue
+
+            # Block quotes
+            if Stripped.startswith(">"):
+                Quoted = []
+                while Index < len(Lines) and Lines[Index].strip().startswith(">"):
+                    Quoted.append(re.sub(r'^\s*>\s?', '', Lines[Index]))
+                    Index += 1
+                Output.append(f"<blockquote>\n{self.RenderBlocks(Quoted)}\n</blockquote>")
+                continue
+
+            # Lists
+            ListMatch = re.match(r'^(\s{0,3})([-*+]|\d+\.)\s+', Line)
+            if ListMatch:
+                Index = self.RenderList(Lines, Index, Output)
+                continue
+
+            # Tables
+            if "|" in Line and Index + 1 < len(Lines) and re.match(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$', Lines[Index + 1]):
+                Index = self.RenderTable(Lines, Index, Output)
+                continue
+
+            # Raw HTML blocks
+            if re.match(r'^\s{0,3}</?[a-zA-Z][^>]*>', Line) and not re.match(r'^\s*<(a|span|em|strong|code|img|br)\b', Line):
+                Block = []
+                while Index < len(Lines) and Lines[Index].strip():
+                    Block.append(Lines[Index])
+                    Index += 1
+                Output.append("\n".join(Block))
+                continue
+
+            # Paragraphs
+            Paragraph = []
+            while Index < len(Lines) and Lines[Index].strip():
+                if Paragraph and self.BlockStarters.match(Lines[Index]):
+                    break
+                Paragraph.append(Lines[Index].strip())
+                Index += 1
+
+            Attributes = ""
+            if len(Paragraph) > 1 and IalPattern.match(Paragraph[-1]):
+                Attributes = ParseIal(IalPattern.match(Paragraph.pop()).group(1))
+            elif len(Paragraph) == 1 and IalPattern.match(Paragraph[0]):
+                # A standalone IAL applies to the previous block
+                if Output:
+                    Output[-1] = re.sub(r'^<(\w+)', lambda Match: f"<{Match.group(1)}{ParseIal(IalPattern.match(Paragraph[0]).group(1))}", Output[-1], count=1)
+                continue
+
+            Output.append(f"<p{Attributes}>{self.RenderInline(chr(10).join(Paragraph))}</p>")
+
+        return "\n".join(Output)
+
+    def RenderList(self, Lines: list, Index: int, Output: list) -> int:
+        """Render a (possibly nested) list starting at Index; return the next index."""
+        FirstMatch = re.match(r'^(\s*)([-*+]|\d+\.)\s+', Lines[Index])
+        Indent = len(FirstMatch.group(1))
+        Ordered = FirstMatch.group(2)[0].isdigit()
+        Items = []
+
+        while Index < len(Lines):
+            Line = Lines[Index]
+            ItemMatch = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.*)$', Line)
+
+            if ItemMatch and len(ItemMatch.group(1)) == Indent and ItemMatch.group(2)[0].isdigit() == Ordered:
+                Items.append([ItemMatch.group(3)])
+                Index += 1
+            elif Line.strip() and Items and (len(Line) - len(Line.lstrip()) > Indent or not ItemMatch):
+                if not ItemMatch and len(Line) - len(Line.lstrip()) <= Indent and not Lines[Index - 1].strip():
+                    break
+                Items[-1].append(Line)
+                Index += 1
+            elif not Line.strip() and Index + 1 < len(Lines) and Items:
+                NextLine = Lines[Index + 1]
+                NextMatch = re.match(r'^(\s*)([-*+]|\d+\.)\s+', NextLine)
+                if NextLine.strip() and len(NextLine) - len(NextLine.lstrip()) > Indent:
+                    Items[-1].append("")
+                elif not (NextMatch and len(NextMatch.group(1)) == Indent and NextMatch.group(2)[0].isdigit() == Ordered):
+                    break
+                Index += 1
+            else:
+                break
+
+        Rendered = []
+        for Item in Items:
+            Body = [Item[0]] + [Line[Indent + 2:] if Line.startswith(" " * (Indent + 2)) else Line.lstrip() for Line in Item[1:]]
+            Html = self.RenderBlocks(Body)
+            # Tight list items are not wrapped in paragraphs
+            if "" not in Item:
+                Html = re.sub(r'^<p>(.*?)</p>', r'\1', Html, count=1, flags=re.DOTALL)
+            Rendered.append(f"<li>{Html}</li>")
+
+        Tag = "ol" if Ordered else "ul"
+        Output.append(f"<{Tag}>\n" + "\n".join(Rendered) + f"\n</{Tag}>")
+        return Index
+
+    def RenderTable(self, Lines: list, Index: int, Output: list) -> int:
+        """Render a pipe table starting at Index; return the next index."""
+        def Cells(Line):
+            return [Cell.strip() for Cell in Line.strip().strip("|").split("|")]
+
+        Header = Cells(Lines[Index])
+        Alignments = []
+        for Cell in Cells(Lines[Index + 1]):
+            if Cell.startswith(":") and Cell.endswith(":"):
+                Alignments.append(' style="text-align: center"')
+            elif Cell.endswith(":"):
+                Alignments.append(' style="text-align: right"')
+            elif Cell.startswith(":"):
+                Alignments.append(' style="text-align: left"')
+            else:
+                Alignments.append("")
+        Index += 2
+
+        Rows = []
+        while Index < len(Lines) and "|" in Lines[Index] and Lines[Index].strip():
+            Rows.append(Cells(Lines[Index]))
+            Index += 1
+
+        def Row(Values, Tag):
+            return "<tr>" + "".join(
+                f"<{Tag}{Alignments[Position] if Position < len(Alignments) else ''}>{self.RenderInline(Value)}</{Tag}>"
+                for Position, Value in enumerate(Values)) + "</tr>"
+
+        Body = "\n".join(Row(Values, "td") for Values in Rows)
+        Output.append(f"<table>\n<thead>\n{Row(Header, 'th')}\n</thead>\n<tbody>\n{Body}\n</tbody>\n</table>")
+        return Index
+
+    #
+    # Built-in inline parser
+    #
+
+    def RenderInline(self, Text: str) -> str:
+        """Render inline Markdown: code, images, links, emphasis and line breaks."""
+        Placeholders = []
+
+        def Protect(Html: str) -> str:
+            Placeholders.append(Html)
+            return f"\x00{len(Placeholders) - 1}\x00"
+
+        Text = re.sub(r'(`+)(.+?)\1', lambda Match: Protect(f"<code>{html.escape(Match.group(2).strip())}</code>"), Text)
+        Text = re.sub(r'&(?!#?\w+;)', '&amp;', Text)
+
+        Text = re.sub(
+            r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)(\{:([^}]*)\})?',
+            lambda Match: Protect(f'<img src="{Match.group(2)}" alt="{html.escape(Match.group(1))}"'
+                                  + (f' title="{html.escape(Match.group(3))}"' if Match.group(3) else "")
+                                  + ParseIal(Match.group(5) or "") + " />"),
+            Text)
+        Text = re.sub(
+            r'\[([^\]]+)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)(\{:([^}]*)\})?',
+            lambda Match: Protect(f'<a href="{Match.group(2)}"'
+                                  + (f' title="{html.escape(Match.group(3))}"' if Match.group(3) else "")
+                                  + ParseIal(Match.group(5) or "") + f">{self.RenderInline(Match.group(1))}</a>"),
+            Text)
+        Text = re.sub(r'<(https?://[^>\s]+)>', lambda Match: Protect(f'<a href="{Match.group(1)}">{Match.group(1)}</a>'), Text)
+
+        Text = re.sub(r'(\*\*|__)(?=\S)(.+?)(?<=\S)\1', r'<strong>\2</strong>', Text)
+        Text = re.sub(r'(?<![\w*])(\*|_)(?=\S)(.+?)(?<=\S)\1(?![\w*])', r'<em>\2</em>', Text)
+        Text = re.sub(r'~~(.+?)~~', r'<del>\1</del>', Text)
+        Text = re.sub(r' {2,}\n', '<br />\n', Text)
+
+        return re.sub(r'\x00(\d+)\x00', lambda Match: Placeholders[int(Match.group(1))], Text)
+
+#
+# Site Model
+#
+
+class SiteDocument:
+    """A page, collection document or post that is rendered to HTML."""
+
+    def __init__(self, SourcePath: Path, RelativePath: str, Collection: Optional[str], FrontMatter: dict, Body: str):
+        """Initialize the document."""
+        self.SourcePath = SourcePath
+        self.RelativePath = RelativePath
+        self.Collection = Collection
+        self.FrontMatter = FrontMatter
+        self.Body = Body
+        self.Data = dict(FrontMatter)
+        self.Url = ""
+        self.OutputName = None
+        self.OutputPath = None
+        self.Content = None
+        self.ContentDependencies = None
+        self.Rendering = False
+        self.Output = ""
+
+    @property
+    def IsMarkdown(self) -> bool:
+        """Check whether the document is converted from Markdown."""
+        return self.SourcePath.suffix.lower() in MARKDOWN_EXTENSIONS
+
+    @property
+    def OutputExtension(self) -> str:
+        """Extension of the rendered file."""
+        return ".html" if self.IsMarkdown else self.SourcePath.suffix
+
+class DocumentDrop(dict):
+    """Template view of a document whose content is rendered on first use."""
+
+    def __init__(self, Document: SiteDocument, Builder):
+        """Initialize the drop from the document's data."""
+        super().__init__(Document.Data)
+        self.update({
+            "url": Document.Url,
+            "path": Document.RelativePath,
+            "collection": Document.Collection,
+            "content": None
+        })
+        self.setdefault("title", None)
+        self.Document = Document
+        self.Builder = Builder
+
+    def get(self, Key, Default=None):
+        """Look up a variable, rendering the content when it is requested."""
+        if Key == "content":
+            return self.Builder.EnsureContent(self.Document)
+        return super().get(Key, Default)
+
+class SiteDrop(dict):
+    """The `site` variable; records which top-level keys a template reads."""
+
+    def __init__(self, Data: dict, Builder):
+        """Initialize the drop."""
+        super().__init__(Data)
+        self.Builder = Builder
+
+    def get(self, Key, Default=None):
+        """Look up a site variable and record the dependency."""
+        self.Builder.RecordDependency("site", Key)
+        return super().get(Key, Default)
+
+class SiteBuilder:
+    """Builds a Jekyll-style source directory into a static HTML site.
+
+    Builds are incremental. For every output the builder records which layouts,
+    includes and `site` keys it used, and persists that graph in SOURCE/.site-builder.
+    The next build re-renders only documents whose source or dependencies changed.
+    """
+
+    GraphVersion = 1
+
+    # Config keys that change how documents are discovered or where they are written
+    StructuralKeys = ("collections", "defaults", "permalink", "exclude", "include", "keep_files", "future")
+
+    def __init__(self, SourceDir: str, DestinationDir: Optional[str] = None):
+        """Initialize the site builder.
+
+        Args:
+            SourceDir: Site source directory containing _config.yml
+            DestinationDir: Output directory (default: SourceDir/_site)
+        """
+        self.SourceDir = Path(SourceDir).resolve()
+        self.DestinationDir = Path(DestinationDir).resolve() if DestinationDir else self.SourceDir / "_site"
+        self.CacheDir = self.SourceDir / ".site-builder"
+        self.GraphPath = self.CacheDir / "graph.json"
+        self.Config = self.LoadConfig()
+        self.Markdown = MarkdownConverter()
+        self.LayoutCache = {}
+        self.IncludeCache = {}
+        self.ParseCache = {}
+        self.Graph = None
+        self.Signatures = {}
+        self.Changed = set()
+        self.Site = None
+        self.SiteHashes = {}
+        self.DependencyStack = []
+        self.SearchIndex = None
+        self.Pages = []
+        self.Posts = []
+        self.Collections = {}
+        self.StaticFiles = []
+        self.Written = set()
+        self.Stats = {}
+
+    #
+    # Configuration
+    #
+
+    def LoadConfig(self) -> dict:
+        """Load _config.yml with Jekyll defaults filled in."""
+        ConfigPath = self.SourceDir / "_config.yml"
+        Config = {}
+        if ConfigPath.exists():
+            with open(ConfigPath, 'r') as f:
+                Config = yaml.safe_load(f) or {}
+
+        Config.setdefault("baseurl", "")
+        Config.setdefault("url", "")
+        Config.setdefault("permalink", "date")
+        Config.setdefault("collections", {})
+        Config.setdefault("defaults", [])
+        Config.setdefault("exclude", [])
+        Config.setdefault("include", [])
+        Config.setdefault("keep_files", [".git", ".svn"])
+        Config["baseurl"] = Config["baseurl"] or ""
+        return Config
+
+    def IsExcluded(self, RelativePath: str) -> bool:
+        """Check whether a source path is excluded from the build."""
+        Parts = RelativePath.split("/")
+        for Pattern in self.Config["include"]:
+            if RelativePath == Pattern.strip("/") or Parts[0] == Pattern.strip("/"):
+                return False
+
+        for Pattern in DEFAULT_EXCLUDES + list(self.Config["exclude"]):
+            Pattern = Pattern.strip("/")
+            if RelativePath == Pattern or RelativePath.startswith(Pattern + "/"):
+                return True
+
+        return any(Part.startswith((".", "_", "#")) or Part.endswith("~") for Part in Parts)
+
+    def ApplyDefaults(self, Document: SiteDocument, Type: str) -> None:
+        """Merge front matter defaults whose scope matches the document."""
+        Values = {}
+        for Default in self.Config["defaults"]:
+            Scope = Default.get("scope", {})
+            ScopePath = (Scope.get("path") or "").strip("/")
+            if ScopePath and not (Document.RelativePath == ScopePath or Document.RelativePath.startswith(ScopePath + "/")):
+                continue
+            if Scope.get("type") and Scope["type"] != Type:
+                continue
+            Values.update(Default.get("values", {}))
+
+        Values.update(Document.FrontMatter)
+        Document.Data = Values
+
+    #
+    # Change Detection
+    #
+
+    def HashBytes(self, Data: bytes) -> str:
+        """Return a short content hash."""
+        return hashlib.sha256(Data).hexdigest()[:32]
+
+    def HashValue(self, Value) -> str:
+        """Return a hash of a JSON-serializable value."""
+        return self.HashBytes(json.dumps(Value, sort_keys=True, default=str).encode('utf-8'))
+
+    def StructureHash(self) -> str:
+        """Hash everything that invalidates the whole dependency graph."""
+        return self.HashValue({
+            "version": self.GraphVersion,
+            "markdown": MarkdownLib.__version__ if MarkdownLib is not None and hasattr(MarkdownLib, "__version__") else "builtin",
+            "destination": str(self.DestinationDir),
+            "config": {Key: self.Config.get(Key) for Key in self.StructuralKeys}
+        })
+
+    def ScanSources(self) -> None:
+        """Stat every source file and work out which ones changed since the last build.
+
+        Files whose size and mtime are unchanged keep their recorded hash, so only
+        touched files are read.
+        """
+        Previous = self.Graph["files"] if self.Graph else {}
+        Signatures = {}
+
+        SkipDirs = {str(self.DestinationDir), str(self.CacheDir)}
+        for Root, Dirs, Files in os.walk(self.SourceDir):
+            Dirs[:] = [Dir for Dir in Dirs if os.path.join(Root, Dir) not in SkipDirs and Dir not in (".git", ".svn")]
+            RelativeRoot = os.path.relpath(Root, self.SourceDir).replace(os.sep, "/")
+            Prefix = "" if RelativeRoot == "." else RelativeRoot + "/"
+
+            for FileName in Files:
+                FilePath = os.path.join(Root, FileName)
+                RelativePath = Prefix + FileName
+                try:
+                    Stat = os.stat(FilePath)
+                except OSError:
+                    continue
+
+                Old = Previous.get(RelativePath)
+                if Old and Old[0] == Stat.st_size and Old[1] == Stat.st_mtime_ns:
+                    Signatures[RelativePath] = Old
+                else:
+                    with open(FilePath, 'rb') as f:
+                        Signatures[RelativePath] = [Stat.st_size, Stat.st_mtime_ns, self.HashBytes(f.read())]
+
+        self.Changed = {
+            RelativePath for RelativePath in set(Signatures) | set(Previous)
+            if (Signatures.get(RelativePath) or [None] * 3)[2] != (Previous.get(RelativePath) or [None] * 3)[2]
+        }
+        self.Signatures = Signatures
+
+    def LoadGraph(self) -> Optional[dict]:
+        """Load the dependency graph persisted by the previous build."""
+        try:
+            with open(self.GraphPath, 'r') as f:
+                Graph = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return Graph if Graph.get("version") == self.GraphVersion else None
+
+    def SaveGraph(self, Documents: dict) -> None:
+        """Persist the dependency graph for the next build."""
+        self.Graph = {
+            "version": self.GraphVersion,
+            "structure": self.StructureHash(),
+            "files": self.Signatures,
+            "documents": Documents
+        }
+        self.CacheDir.mkdir(parents=True, exist_ok=True)
+        TempPath = self.GraphPath.with_suffix(".tmp")
+        with open(TempPath, 'w') as f:
+            f.write(json.dumps(self.Graph, separators=(",", ":")))
+        os.replace(TempPath, self.GraphPath)
+
+    def SiteKeyHash(self, Key: str) -> str:
+        """Hash the current value of a top-level `site` key."""
+        if Key in self.SiteHashes:
+            return self.SiteHashes[Key]
+
+        DocumentLists = {"pages": self.Pages, "posts": self.Posts, **self.Collections}
+        DocumentLists["collections"] = [Document for Documents in self.Collections.values() for Document in Documents]
+        if Key in DocumentLists:
+            Documents = DocumentLists[Key]
+            # A document's rendered content is a function of its source
+            Value = [(Document.RelativePath, Document.Url, self.Signatures.get(Document.RelativePath, [None] * 3)[2]) for Document in Documents]
+        else:
+            Value = dict.get(self.Site, Key)
+
+        self.SiteHashes[Key] = self.HashValue(Value)
+        return self.SiteHashes[Key]
+
+    def IsCurrent(self, Document: SiteDocument, Record: Optional[dict]) -> bool:
+        """Check whether a document's recorded output is still valid."""
+        if Record is None or Document.RelativePath in self.Changed:
+            return False
+        if Record["output"] != Document.OutputName:
+            return False
+        if any(f"_layouts/{Name}.html" in self.Changed for Name in Record["layouts"]):
+            return False
+        if any(f"_includes/{Name}" in self.Changed for Name in Record["includes"]):
+            return False
+        if any(self.SiteKeyHash(Key) != Hash for Key, Hash in Record["site"].items()):
+            return False
+        return Document.OutputPath.exists()
+
+    #
+    # Dependency Tracking
+    #
+
+    def RecordDependency(self, Kind: str, Name: str) -> None:
+        """Record that the template being rendered used a layout, include or site key."""
+        if self.DependencyStack:
+            self.DependencyStack[-1][Kind].add(Name)
+
+    def PushDependencies(self) -> None:
+        """Start recording dependencies for a render."""
+        self.DependencyStack.append({"site": set(), "includes": set(), "layouts": set()})
+
+    def PopDependencies(self) -> dict:
+        """Stop recording and fold the recorded dependencies into the enclosing render."""
+        Dependencies = self.DependencyStack.pop()
+        if self.DependencyStack:
+            for Kind, Names in Dependencies.items():
+                self.DependencyStack[-1][Kind] |= Names
+        return Dependencies
+
+    #
+    # Reading
+    #
+
+    def ReadDocument(self, SourcePath: Path, Collection: Optional[str]) -> SiteDocument:
+        """Read a file with front matter into a document, reusing the parse when unchanged."""
+        RelativePath = SourcePath.relative_to(self.SourceDir).as_posix()
+        Signature = self.Signatures.get(RelativePath)
+        Cached = self.ParseCache.get(RelativePath)
+
+        if Cached is not None and Signature is not None and Cached[0] == Signature[2]:
+            FrontMatter, Body = Cached[1], Cached[2]
+        else:
+            FrontMatter, Body = SplitFrontMatter(SourcePath.read_text(encoding='utf-8'))
+            FrontMatter = FrontMatter or {}
+            if Signature is not None:
+                self.ParseCache[RelativePath] = (Signature[2], FrontMatter, Body)
+
+        return SiteDocument(SourcePath, RelativePath, Collection, dict(FrontMatter), Body)
+
+    def ReadSite(self) -> None:
+        """Discover pages, collection documents, posts and static files."""
+        self.Pages = []
+        self.Posts = []
+        self.Collections = {Name: [] for Name, Options in self.Config["collections"].items() if (Options or {}).get("output")}
+        self.StaticFiles = []
+
+        for Root, Dirs, Files in os.walk(self.SourceDir):
+            RootPath = Path(Root)
+            RelativeRoot = RootPath.relative_to(self.SourceDir).as_posix()
+            RelativeRoot = "" if RelativeRoot == "." else RelativeRoot
+
+            Dirs[:] = sorted(
+                Dir for Dir in Dirs
+                if (RootPath / Dir) != self.DestinationDir
+                and not self.IsExcluded(f"{RelativeRoot}/{Dir}".lstrip("/"))
+            )
+
+            for FileName in sorted(Files):
+                RelativePath = f"{RelativeRoot}/{FileName}".lstrip("/")
+                if self.IsExcluded(RelativePath):
+                    continue
+
+                SourcePath = RootPath / FileName
+                if HasFrontMatter(SourcePath):
+                    Document = self.ReadDocument(SourcePath, None)
+                    self.ApplyDefaults(Document, "pages")
+                    self.Pages.append(Document)
+                else:
+                    self.StaticFiles.append(SourcePath)
+
+        for Name in self.Collections:
+            self.ReadCollection(Name)
+
+        self.ReadPosts()
+
+    def ReadCollection(self, Name: str) -> None:
+        """Read the documents of an output collection."""
+        CollectionDir = self.SourceDir / f"_{Name}"
+        if not CollectionDir.is_dir():
+            return
+
+        for Root, Dirs, Files in os.walk(CollectionDir):
+            Dirs[:] = sorted(Dir for Dir in Dirs if not Dir.startswith("."))
+            for FileName in sorted(Files):
+                if not FileName.startswith("."):
+                    self.ReadCollectionFile(Path(Root) / FileName, Name)
+
+    def ReadCollectionFile(self, SourcePath: Path, Name: str) -> None:
+        """Read one file of a collection as a document or a static file."""
+        if HasFrontMatter(SourcePath) or SourcePath.suffix.lower() in MARKDOWN_EXTENSIONS:
+            Document = self.ReadDocument(SourcePath, Name)
+            self.ApplyDefaults(Document, Name)
+            self.Collections[Name].append(Document)
+        else:
+            self.StaticFiles.append(SourcePath)
+
+    def ReadPosts(self) -> None:
+        """Read dated posts from _posts, newest first."""
+        PostsDir = self.SourceDir / "_posts"
+        if not PostsDir.is_dir():
+            return
+
+        Now = datetime.now()
+        for SourcePath in sorted(PostsDir.rglob("*")):
+            Match = re.match(r'(\d{4}-\d{2}-\d{2})-(.+)$', SourcePath.stem)
+            if not SourcePath.is_file() or not Match:
+                continue
+
+            Document = self.ReadDocument(SourcePath, "posts")
+            self.ApplyDefaults(Document, "posts")
+
+            PostDate = ToDateTime(Document.Data.get("date")) or ToDateTime(Match.group(1))
+            if PostDate.tzinfo is not None:
+                PostDate = PostDate.replace(tzinfo=None)
+            if PostDate > Now and not self.Config.get("future"):
+                continue
+
+            Categories = Document.Data.get("categories") or Document.Data.get("category") or []
+            if isinstance(Categories, str):
+                Categories = Categories.split()
+
+            Document.Data["date"] = PostDate
+            Document.Data["slug"] = Match.group(2)
+            Document.Data["categories"] = [str(Category) for Category in Categories]
+            Document.Data.setdefault("title", Match.group(2).replace("-", " ").title())
+            self.Posts.append(Document)
+
+        self.Posts.sort(key=lambda Post: Post.Data["date"], reverse=True)
+
+    #
+    # URLs
+    #
+
+    def ExpandPermalink(self, Template: str, Placeholders: dict) -> str:
+        """Fill :placeholders in a permalink template."""
+        Url = re.sub(r':(\w+)', lambda Match: str(Placeholders.get(Match.group(1), Match.group(0))), Template)
+        Url = re.sub(r'/{2,}', '/', "/" + Url)
+        return Url
+
+    def AssignUrl(self, Document: SiteDocument) -> None:
+        """Compute a document's URL and output path."""
+        Stem = posixpath.splitext(Document.RelativePath)[0]
+        Name = posixpath.basename(Stem)
+        Placeholders = {"output_ext": Document.OutputExtension, "name": Name, "basename": Name}
+
+        if Document.Collection == "posts":
+            PostDate = Document.Data["date"]
+            Template = self.Config["permalink"]
+            Template = DEFAULT_PERMALINKS.get(Template, Template)
+            Placeholders.update({
+                "categories": "/".join(Slugify(Category) for Category in Document.Data["categories"]),
+                "year": PostDate.strftime("%Y"), "month": PostDate.strftime("%m"), "day": PostDate.strftime("%d"),
+                "i_month": str(PostDate.month), "i_day": str(PostDate.day), "y_day": PostDate.strftime("%j"),
+                "title": Document.Data["slug"], "slug": Document.Data["slug"]
+            })
+        elif Document.Collection:
+            CollectionOptions = self.Config["collections"].get(Document.Collection) or {}
+            Template = CollectionOptions.get("permalink", "/:collection/:path:output_ext")
+            CollectionPath = Stem[len(Document.Collection) + 2:]
+            Placeholders.update({"collection": Document.Collection, "path": CollectionPath, "title": Slugify(Name)})
+        else:
+            Template = "/:path:output_ext"
+            Placeholders.update({"path": Stem})
+
+        Template = Document.Data.get("permalink") or Template
+        Url = self.ExpandPermalink(Template, Placeholders)
+
+        # index pages are served from their directory
+        if not Document.Data.get("permalink") and Document.Collection is None and Url.endswith("/index.html"):
+            Url = Url[:-len("index.html")]
+
+        Document.Url = Url
+        RelativeOutput = Url.lstrip("/")
+        if not RelativeOutput or RelativeOutput.endswith("/"):
+            RelativeOutput += "index.html"
+        Document.OutputName = RelativeOutput
+        Document.OutputPath = self.DestinationDir / RelativeOutput
+
+    #
+    # Rendering
+    #
+
+    def LoadLayout(self, Name: str) -> Optional[tuple]:
+        """Return (front matter, compiled template) for a layout, or None."""
+        self.RecordDependency("layouts", Name)
+        if Name in self.LayoutCache:
+            return self.LayoutCache[Name]
+
+        LayoutPath = self.SourceDir / "_layouts" / f"{Name}.html"
+        if LayoutPath.exists():
+            Text = LayoutPath.read_text(encoding='utf-8')
+        elif Name in BUILTIN_LAYOUTS:
+            Text = BUILTIN_LAYOUTS[Name]
+        else:
+            Text = BUILTIN_LAYOUTS["default"] if Name != "default" else None
+
+        Layout = None
+        if Text is not None:
+            FrontMatter, Body = SplitFrontMatter(Text)
+            Layout = (FrontMatter or {}, LiquidTemplate(Body, f"_layouts/{Name}.html"))
+
+        self.LayoutCache[Name] = Layout
+        return Layout
+
+    def LoadInclude(self, Name: str) -> Optional[LiquidTemplate]:
+        """Return the compiled template for an include, or None."""
+        self.RecordDependency("includes", Name)
+        if Name not in self.IncludeCache:
+            IncludePath = self.SourceDir / "_includes" / Name
+            self.IncludeCache[Name] = LiquidTemplate(IncludePath.read_text(encoding='utf-8'), f"_includes/{Name}") if IncludePath.is_file() else None
+        return self.IncludeCache[Name]
+
+    def InvalidateTemplates(self) -> None:
+        """Drop compiled layouts and includes whose files changed."""
+        for Name in list(self.LayoutCache):
+            if f"_layouts/{Name}.html" in self.Changed:
+                del self.LayoutCache[Name]
+        for Name in list(self.IncludeCache):
+            if f"_includes/{Name}" in self.Changed:
+                del self.IncludeCache[Name]
+
+    def BuildNavigation(self) -> list:
+        """List top-level pages and documents for the fallback layout's navigation."""
+        Items = []
+        for Document in self.Pages + [Document for Documents in self.Collections.values() for Document in Documents]:
+            Data = Document.Data
+            if not Data.get("title") or Data.get("nav_exclude") or Data.get("parent") or not Document.IsMarkdown and Document.OutputExtension != ".html":
+                continue
+            Items.append({"title": Data["title"], "url": Document.Url, "nav_order": Data.get("nav_order", 999)})
+
+        Items.sort(key=lambda Item: (Item["nav_order"] if isinstance(Item["nav_order"], (int, float)) else 999, str(Item["title"])))
+        return Items
+
+    def BuildSiteData(self) -> SiteDrop:
+        """Assemble the `site` variable."""
+        Site = dict(self.Config)
+        Site["time"] = datetime.now()
+        Site["pages"] = [DocumentDrop(Document, self) for Document in self.Pages]
+        Site["posts"] = [DocumentDrop(Document, self) for Document in self.Posts]
+        Site["collections"] = [{"label": Name, "docs": [DocumentDrop(Document, self) for Document in Documents]} for Name, Documents in self.Collections.items()]
+        for Name, Documents in self.Collections.items():
+            Site[Name] = [DocumentDrop(Document, self) for Document in Documents]
+        Site["data"] = self.LoadData()
+        Site["navigation"] = self.BuildNavigation()
+        Site["static_files"] = [{"path": "/" + SourcePath.relative_to(self.SourceDir).as_posix()} for SourcePath in self.StaticFiles]
+        return SiteDrop(Site, self)
+
+    def LoadData(self) -> dict:
+        """Load YAML and JSON files from _data."""
+        Data = {}
+        DataDir = self.SourceDir / "_data"
+        if not DataDir.is_dir():
+            return Data
+
+        for DataPath in sorted(DataDir.rglob("*")):
+            if DataPath.suffix.lower() not in (".yml", ".yaml", ".json"):
+                continue
+            with open(DataPath, 'r') as f:
+                Data[DataPath.stem] = json.load(f) if DataPath.suffix.lower() == ".json" else yaml.safe_load(f)
+        return Data
+
+    def EnsureContent(self, Document: SiteDocument) -> str:
+        """Render a document's Liquid and Markdown once, on first use."""
+        if Document.Content is not None:
+            if self.DependencyStack and Document.ContentDependencies:
+                for Kind, Names in Document.ContentDependencies.items():
+                    self.DependencyStack[-1][Kind] |= Names
+            return Document.Content
+        if Document.Rendering:
+            return ""  # A document reading its own content through site.pages
+
+        Document.Rendering = True
+        self.PushDependencies()
+        try:
+            Context = {"site": self.Site, "page": DocumentDrop(Document, self)}
+            Content = LiquidTemplate(Document.Body, Document.RelativePath).Render(Context, self.LoadInclude)
+            Document.Content = self.Markdown.Convert(Content) if Document.IsMarkdown else Content
+        finally:
+            Document.ContentDependencies = self.PopDependencies()
+            Document.Rendering = False
+        return Document.Content
+
+    def RenderDocument(self, Document: SiteDocument) -> dict:
+        """Render a document through its layout chain and return its dependency record."""
+        self.PushDependencies()
+        Content = self.EnsureContent(Document)
+        LayoutName = Document.Data.get("layout")
+        Seen = set()
+
+        while LayoutName and LayoutName not in Seen and Document.OutputExtension == ".html":
+            Seen.add(LayoutName)
+            Layout = self.LoadLayout(LayoutName)
+            if Layout is None:
+                break
+            LayoutData, Template = Layout
+            Context = {"site": self.Site, "page": DocumentDrop(Document, self), "layout": LayoutData, "content": Content}
+            Content = Template.Render(Context, self.LoadInclude)
+            LayoutName = LayoutData.get("layout")
+
+        Document.Output = Content
+        Dependencies = self.PopDependencies()
+        return {
+            "output": Document.OutputName,
+            "layouts": sorted(Dependencies["layouts"]),
+            "includes": sorted(Dependencies["includes"]),
+            "site": {Key: self.SiteKeyHash(Key) for Key in sorted(Dependencies["site"])}
+        }
+
+    def BuildSearchIndex(self, Documents: list, Rendered: set) -> None:
+        """Write the prebuilt search index when the site enables search."""
+        if not self.Config.get("search_enabled"):
+            self.SearchIndex = None
+            return
+
+        if self.SearchIndex is None or self.SearchIndex.Config != self.Config.get("search"):
+            self.SearchIndex = SearchIndexBuilder(self.Config, self.CacheDir)
+
+        # Skipped documents only need rendering if their postings are not cached
+        for Document in Documents:
+            if self.SearchIndex.IsSearchable(Document) and Document.RelativePath not in self.SearchIndex.Cache:
+                self.EnsureContent(Document)
+
+        Rendered = Rendered | {Document.RelativePath for Document in Documents if Document.Content is not None}
+        Files = self.SearchIndex.Build(Documents, Rendered)
+        if Files is None:
+            self.Written.update(str(self.DestinationDir / Name) for Name in self.SearchIndex.Files)
+            return
+
+        for Name, Content in Files.items():
+            self.WriteOutput(self.DestinationDir / Name, Content)
+        self.Stats["search"] = self.SearchIndex.Stats
+
+    #
+    # Writing
+    #
+
+    def WriteOutput(self, OutputPath: Path, Content: str) -> None:
+        """Write an output file unless it already has this content."""
+        Data = Content.encode('utf-8')
+        self.Written.add(str(OutputPath))
+        try:
+            if OutputPath.stat().st_size == len(Data) and OutputPath.read_bytes() == Data:
+                self.Stats["unchanged"] += 1
+                return
+        except OSError:
+            pass
+
+        OutputPath.parent.mkdir(parents=True, exist_ok=True)
+        OutputPath.write_bytes(Data)
+        self.Stats["rendered"] += 1
+
+    def CopyStatic(self, SourcePath: Path) -> None:
+        """Copy a static file unless the destination is already up to date."""
+        OutputPath = self.DestinationDir / SourcePath.relative_to(self.SourceDir)
+        self.Written.add(str(OutputPath))
+        try:
+            SourceStat = SourcePath.stat()
+            OutputStat = OutputPath.stat()
+            if SourceStat.st_size == OutputStat.st_size and int(SourceStat.st_mtime) == int(OutputStat.st_mtime):
+                return
+        except OSError:
+            pass
+
+        OutputPath.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(str(SourcePath), str(OutputPath))
+        self.Stats["static"] += 1
+
+    def RemoveStale(self) -> None:
+        """Delete files left in the destination by earlier builds."""
+        KeepFiles = [Pattern.strip("/") for Pattern in self.Config["keep_files"]]
+        for Root, Dirs, Files in os.walk(self.DestinationDir, topdown=False):
+            for FileName in Files:
+                OutputPath = os.path.join(Root, FileName)
+                if OutputPath in self.Written:
+                    continue
+                RelativePath = os.path.relpath(OutputPath, self.DestinationDir).replace(os.sep, "/")
+                if any(RelativePath == Keep or RelativePath.startswith(Keep + "/") for Keep in KeepFiles):
+                    continue
+                os.unlink(OutputPath)
+                self.Stats["removed"] += 1
+            if Root != str(self.DestinationDir) and not os.listdir(Root):
+                os.rmdir(Root)
+
+    def Build(self, Incremental: bool = True) -> dict:
+        """Build the site and return build statistics.
+
+        Args:
+            Incremental: Reuse outputs whose recorded dependencies are unchanged.
+                A full build still skips writing files whose content is identical.
+        """
+        Start = time.perf_counter()
+        self.Written = set()
+        self.Stats = {"rendered": 0, "unchanged": 0, "skipped": 0, "static": 0, "removed": 0}
+
+        if self.Graph is None:
+            self.Graph = self.LoadGraph()
+        self.Config = self.LoadConfig()
+        self.ScanSources()
+
+        Records = {}
+        if Incremental and self.Graph and self.Graph.get("structure") == self.StructureHash():
+            Records = self.Graph["documents"]
+        else:
+            self.LayoutCache = {}
+            self.IncludeCache = {}
+        self.InvalidateTemplates()
+
+        self.ReadSite()
+        Documents = self.Pages + self.Posts + [Document for Documents in self.Collections.values() for Document in Documents]
+
+        for Document in Documents:
+            self.AssignUrl(Document)
+
+        self.Site = self.BuildSiteData()
+        self.SiteHashes = {}
+
+        NewRecords = {}
+        Rendered = set()
+        for Document in Documents:
+            Record = Records.get(Document.RelativePath)
+            if self.IsCurrent(Document, Record):
+                self.Written.add(str(Document.OutputPath))
+                NewRecords[Document.RelativePath] = Record
+                self.Stats["skipped"] += 1
+                continue
+
+            NewRecords[Document.RelativePath] = self.RenderDocument(Document)
+            self.WriteOutput(Document.OutputPath, Document.Output)
+            Rendered.add(Document.RelativePath)
+
+        self.BuildSearchIndex(Documents, Rendered)
+
+        for SourcePath in self.StaticFiles:
+            self.CopyStatic(SourcePath)
+
+        self.RemoveStale()
+        self.SaveGraph(NewRecords)
+
+        self.Stats.update({
+            "pages": len(self.Pages),
+            "posts": len(self.Posts),
+            "documents": sum(len(Documents) for Documents in self.Collections.values()),
+            "static_files": len(self.StaticFiles),
+            "changed_sources": len(self.Changed),
+            "seconds": time.perf_counter() - Start
+        })
+        return self.Stats
+
+    def Watch(self, Incremental: bool = True) -> None:
+        """Rebuild whenever a source file changes, until interrupted."""
+        Watcher = SiteWatcher(self.SourceDir, IgnoreDirs=[self.DestinationDir, self.CacheDir])
+        print(f"Watching {self.SourceDir} for changes ({Watcher.Backend}). Press Ctrl+C to stop.")
+
+        def OnChange(Paths: Optional[set]) -> None:
+            Names = ", ".join(sorted(Path(FilePath).name for FilePath in Paths)[:5]) if Paths else "rescan"
+            # A bad edit fails this rebuild only; the next change rebuilds again
+            try:
+                Stats = self.Build(Incremental)
+            except Exception as Ex:
+                print(f"  Rebuild failed ({Names}): {Ex}", flush=True)
+                return
+            print(f"  Rebuilt in {Stats['seconds'] * 1000:.0f} ms ({Names}): "
+                  f"{Stats['rendered']} written, {Stats['skipped']} skipped, {Stats['removed']} removed")
+
+        try:
+            Watcher.Watch(OnChange)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        finally:
+            Watcher.Close()
+
+def PrintStats(Builder: SiteBuilder, Stats: dict) -> None:
+    """Print a build summary."""
+    print(f"Built {Builder.DestinationDir} in {Stats['seconds']:.2f}s")
+    print(f"  {Stats['pages']} pages, {Stats['documents']} documents, {Stats['posts']} posts, {Stats['static_files']} static files")
+    print(f"  {Stats['changed_sources']} changed sources: {Stats['rendered']} written, {Stats['unchanged']} unchanged, "
+          f"{Stats['skipped']} skipped, {Stats['static']} copied, {Stats['removed']} removed")
+    if "search" in Stats:
+        Search = Stats["search"]
+        print(f"  Search index: {Search['sections']} sections, {Search['terms']} terms in {Search['shards']} shards ({Search['bytes'] / 1024:.1f} KiB)")
+
+def Main():
+    """Main entry point for the script."""
+    Parser = argparse.ArgumentParser(description="Build the documentation site without Jekyll")
+    Parser.add_argument("--source", dest="SourceDir", default="docs", help="Site source directory (default: docs)")
+    Parser.add_argument("--destination", dest="DestinationDir", default=None, help="Output directory (default: SOURCE/_site)")
+    Parser.add_argument("--full", dest="Full", action="store_true", help="Re-render every document instead of only changed ones")
+    Parser.add_argument("--watch", dest="Watch", action="store_true", help="Rebuild on every source change")
+
+    Args = Parser.parse_args()
+
+    if not (Path(Args.SourceDir) / "_config.yml").exists():
+        print(f"Error: _config.yml not found in {Args.SourceDir}")
+        sys.exit(1)
+
+    Builder = SiteBuilder(Args.SourceDir, Args.DestinationDir)
+    PrintStats(Builder, Builder.Build(Incremental=not Args.Full))
+
+    if Args.Watch:
+        Builder.Watch()
+
+if __name__ == "__main__":
+    Main()
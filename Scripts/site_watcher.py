@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# File: site_watcher.py
+# Path: AIDEV-WEB/scripts/site_watcher.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  3:30PM
+# Description: File watcher that triggers site rebuilds on source changes
+
+"""
+Site Watcher
+
+This module watches a site source tree and reports batches of changed paths. On
+Linux it uses inotify through ctypes, so changes are reported as soon as they happen
+without rescanning the tree. Bursts of events (an editor saving several files, a
+git checkout) are coalesced into a single callback. On other platforms, or when
+inotify is unavailable, it falls back to polling file sizes and mtimes.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Callable, Optional
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+EventHeader = struct.Struct("iIII")
+
+class SiteWatcher:
+    """Reports batches of changed files under a directory tree."""
+
+    def __init__(self, RootDir: str, IgnoreDirs: list = None, Debounce: float = 0.05, PollInterval: float = 0.5):
+        """Initialize the watcher.
+
+        Args:
+            RootDir: Directory to watch recursively
+            IgnoreDirs: Directories whose changes are ignored (e.g. the build output)
+            Debounce: Quiet period that ends a burst of events, in seconds
+            PollInterval: Scan interval when polling, in seconds
+        """
+        self.RootDir = Path(RootDir).resolve()
+        self.IgnoreDirs = {Path(Dir).resolve() for Dir in (IgnoreDirs or [])}
+        self.Debounce = Debounce
+        self.PollInterval = PollInterval
+        self.Fd = None
+        self.Watches = {}
+        self.Snapshot = {}
+        self.Backend = "inotify" if self.StartInotify() else "polling"
+
+    def IsIgnored(self, FilePath: Path) -> bool:
+        """Check whether a path is inside an ignored or hidden directory."""
+        if any(FilePath == Dir or Dir in FilePath.parents for Dir in self.IgnoreDirs):
+            return True
+        try:
+            RelativeParts = FilePath.relative_to(self.RootDir).parts
+        except ValueError:
+            return True
+        return any(Part in (".git", ".svn") for Part in RelativeParts)
+
+    #
+    # inotify
+    #
+
+    def StartInotify(self) -> bool:
+        """Open an inotify instance and watch every directory; return False if unavailable."""
+        if not sys.platform.startswith("linux"):
+            return False
+
+        try:
+            self.Libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            Fd = self.Libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        if Fd < 0:
+            return False
+
+        self.Fd = Fd
+        try:
+            self.AddWatchTree(self.RootDir)
+        except OSError:
+            self.Close()
+            return False
+        return True
+
+    def AddWatch(self, DirPath: Path) -> None:
+        """Watch a single directory."""
+        Descriptor = self.Libc.inotify_add_watch(self.Fd, os.fsencode(str(DirPath)), WATCH_MASK)
+        if Descriptor < 0:
+            Error = ctypes.get_errno()
+            if Error in (errno.ENOENT, errno.ENOTDIR):
+                return  # Removed before we got to it
+            raise OSError(Error, f"inotify_add_watch failed for {DirPath}: {os.strerror(Error)}")
+        self.Watches[Descriptor] = DirPath
+
+    def AddWatchTree(self, DirPath: Path) -> None:
+        """Watch a directory and all directories below it."""
+        for Root, Dirs, _ in os.walk(DirPath):
+            RootPath = Path(Root)
+            Dirs[:] = [Dir for Dir in Dirs if not self.IsIgnored(RootPath / Dir)]
+            self.AddWatch(RootPath)
+
+    def ReadEvents(self, Timeout: Optional[float]) -> Optional[set]:
+        """Read pending inotify events; return changed paths, or None on queue overflow."""
+        Ready, _, _ = select.select([self.Fd], [], [], Timeout)
+        if not Ready:
+            return set()
+
+        try:
+            Buffer = os.read(self.Fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        Changed = set()
+        Offset = 0
+        while Offset + EventHeader.size <= len(Buffer):
+            Descriptor, Mask, _, Length = EventHeader.unpack_from(Buffer, Offset)
+            Name = Buffer[Offset + EventHeader.size:Offset + EventHeader.size + Length].rstrip(b"\0")
+            Offset += EventHeader.size + Length
+
+            if Mask & IN_Q_OVERFLOW:
+                return None
+            if Mask & IN_IGNORED:
+                self.Watches.pop(Descriptor, None)
+                continue
+
+            DirPath = self.Watches.get(Descriptor)
+            if DirPath is None:
+                continue
+            FilePath = DirPath / os.fsdecode(Name) if Name else DirPath
+            if self.IsIgnored(FilePath):
+                continue
+
+            if Mask & IN_ISDIR and Mask & (IN_CREATE | IN_MOVED_TO):
+                self.AddWatchTree(FilePath)
+            Changed.add(FilePath)
+
+        return Changed
+
+    #
+    # Polling
+    #
+
+    def Scan(self) -> dict:
+        """Record (size, mtime) for every watched file."""
+        Snapshot = {}
+        for Root, Dirs, Files in os.walk(self.RootDir):
+            RootPath = Path(Root)
+            Dirs[:] = [Dir for Dir in Dirs if not self.IsIgnored(RootPath / Dir)]
+            for FileName in Files:
+                FilePath = RootPath / FileName
+                try:
+                    Stat = FilePath.stat()
+                except OSError:
+                    continue
+                Snapshot[FilePath] = (Stat.st_size, Stat.st_mtime_ns)
+        return Snapshot
+
+    def Poll(self) -> set:
+        """Wait one poll interval and return the paths that changed."""
+        time.sleep(self.PollInterval)
+        Snapshot = self.Scan()
+        Changed = {FilePath for FilePath in set(Snapshot) | set(self.Snapshot) if Snapshot.get(FilePath) != self.Snapshot.get(FilePath)}
+        self.Snapshot = Snapshot
+        return Changed
+
+    #
+    # Main Loop
+    #
+
+    def WaitForChanges(self) -> Optional[set]:
+        """Block until something changes and return the coalesced batch of paths."""
+        if self.Fd is None:
+            while True:
+                Changed = self.Poll()
+                if Changed:
+                    return Changed
+
+        Changed = set()
+        while not Changed:
+            Changed = self.ReadEvents(None)
+            if Changed is None:
+                return None
+
+        # Coalesce the rest of the burst
+        while True:
+            More = self.ReadEvents(self.Debounce)
+            if More is None:
+                return None
+            if not More:
+                return Changed
+            Changed |= More
+
+    def Watch(self, Callback: Callable[[Optional[set]], None]) -> None:
+        """Call Callback with each batch of changed paths (None means rescan everything)."""
+        if self.Fd is None:
+            self.Snapshot = self.Scan()
+
+        while True:
+            Callback(self.WaitForChanges())
+
+    def Close(self) -> None:
+        """Release the inotify instance."""
+        if self.Fd is not None:
+            os.close(self.Fd)
+            self.Fd = None
+            self.Watches = {}
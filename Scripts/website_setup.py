@@ -3,7 +3,7 @@
 # Path: AIDEV-WEB/scripts/website_setup.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-28
-# Last Modified: 2025-03-28  08:48PM
+# Last Modified: 2026-10-17  11:59PM
 # Description: Script to set up the AIDEV-WEB documentation website
 # Author: Claude (Anthropic), as part of Project Himalaya
 # Human Collaboration: Herbert J. Bowers
@@ -24,6 +24,8 @@ import argparse
 from datetime import datetime
 from typing import Optional
 
+from site_builder import SiteBuilder
+
 class WebsiteSetup:
     """Handles the setup of the AIDEV-WEB documentation website."""
 
@@ -156,8 +158,22 @@ Stay tuned for more updates!
 """)
         print(f"  Created sample post: {PostPath}")
 
-    def BuildSite(self) -> None:
-        """Build the Jekyll site."""
+    def BuildSite(self, Engine: str = "jekyll", Full: bool = False) -> None:
+        """Build the site with Jekyll, or with the in-process builder when Engine is "python"."""
+        if Engine == "python":
+            print("Building site...")
+            try:
+                Builder = SiteBuilder(self.DocsDir)
+                Stats = Builder.Build(Incremental=not Full)
+                print(f"  Site built successfully in {Stats['seconds']:.2f}s: {Builder.DestinationDir}")
+                print(f"  {Stats['pages']} pages, {Stats['documents']} documents, {Stats['posts']} posts, {Stats['static_files']} static files")
+                print(f"  {Stats['rendered']} written, {Stats['unchanged']} unchanged, {Stats['skipped']} skipped, {Stats['static']} copied, {Stats['removed']} removed")
+                if "search" in Stats:
+                    print(f"  Search index: {Stats['search']['sections']} sections in {Stats['search']['shards']} shards")
+            except Exception as Ex:
+                print(f"  An unexpected error occurred during build: {str(Ex)}")
+            return
+
         print("Building Jekyll site...")
         try:
             print(f"Running 'bundle exec jekyll build' in {self.DocsDir}...")
@@ -179,6 +195,13 @@ Stay tuned for more updates!
         except Exception as Ex:
             print(f"  An unexpected error occurred during build: {str(Ex)}")
 
+    def WatchSite(self) -> None:
+        """Build the site, then rebuild the affected pages on every change."""
+        Builder = SiteBuilder(self.DocsDir)
+        Stats = Builder.Build()
+        print(f"Built {Builder.DestinationDir} in {Stats['seconds']:.2f}s ({Stats['rendered']} written, {Stats['skipped']} skipped)")
+        Builder.Watch()
+
 def main():
     """Main execution function for website_setup.py script."""
     parser = argparse.ArgumentParser(description="Setup and manage the AIDEV-WEB documentation website.")
@@ -205,7 +228,24 @@ def main():
     parser.add_argument(
         "--build",
         action="store_true",
-        help="Build the Jekyll site"
+        help="Build the site into docs/_site"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With --engine python, re-render every page instead of only the pages affected by changes"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rebuild affected pages with the Python builder whenever a file in docs/ changes"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["python", "jekyll"],
+        default="jekyll",
+        help="Site build engine: 'bundle exec jekyll build' or the in-process Python builder, "
+             "which supports a subset of Liquid and kramdown (default: jekyll)"
     )
 
     args = parser.parse_args()
@@ -219,9 +259,11 @@ def main():
     if args.create_post:
         Setup.CreateSampleBlogPost()
     if args.build:
-        Setup.BuildSite()
+        Setup.BuildSite(Engine=args.engine, Full=args.full)
+    if args.watch:
+        Setup.WatchSite()
 
-    if not any([args.install_deps, args.create_theme, args.create_post, args.build]):
+    if not any([args.install_deps, args.create_theme, args.create_post, args.build, args.watch]):
         print("No actions specified. Use --help for options.")
         print("Example: python scripts/website_setup.py --install-deps --build")
 
@@ -0,0 +1,738 @@
+# File: CodebaseSummary.py
+# Path: SysUtils/CodebaseSummary.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  10:00PM
+# Description: Codebase snapshot engine behind CodebaseSummary.sh
+
+"""
+Codebase Summary
+
+This module writes the codebase snapshot that CodebaseSummary.sh used to
+assemble from tree, find, a cat loop and several more cat and grep passes over
+temporary files. The snapshot has the same sections: a summary header, the
+directory structure as `tree -f` draws it, every included file, and the lists
+of program files and documents.
+
+The repository is walked once. The directory structure is written to the
+output as the walk goes, and the walk collects the paths of the files to
+include. File contents are then copied straight into the output in fixed-size
+blocks through a single buffered writer. Memory therefore depends on the number
+of paths and not on file sizes, and every byte is written once. Counts come
+from the walk instead of a grep over the output.
+
+Included are Python files outside .venv and CurrentMods (and the scratch
+scripts SimpleTest.py and test_pyside.py), and Markdown files under Docs.
+Files and directories ignored by git are left out of both the tree and the
+files. Each .gitignore is compiled into a few regular expressions when the walk
+reaches its directory. Ignored directories are pruned before they are read, so
+trees such as node_modules, _site and .venv cost one match instead of a walk.
+
+With a byte or token budget, the snapshot is written as numbered shards in a
+directory instead of one file. A shard is closed before a file entry that would
+overflow it, so entries stay whole unless one is larger than the budget; such
+an entry is split at line boundaries. index.json maps each included file to the
+shard, offset and length of every part of its entry, so a consumer can read
+just the shards it needs.
+
+Between runs, a cache keeps the contents of the included files in one segment
+store, with each file's size, modification time and digest. A file whose stat
+is unchanged is spliced from the store without being opened; any other file is
+read once, copied to the snapshot and, if its digest changed, appended to the
+store. The store is compacted when most of it is dead. With --since, the Files
+section and the lists hold only the files changed since a git revision.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+from pathlib import Path
+from functools import partial
+from datetime import datetime
+
+RULE = "=" * 64
+BYTES_PER_TOKEN = 4
+
+HEADER = """This file is a comprehensive codebase snapshot for the {Project} project, generated to facilitate analysis and development.
+
+================================================================
+File Summary
+================================================================
+
+Purpose:
+--------
+This document provides a consolidated view of the project's Python source code,
+excluding any files specified in the .gitignore file. It serves as a reference
+for developers, making it easier to understand the codebase structure and
+functionality in a single document.
+
+File Format:
+------------
+The content is organized as follows:
+1. This summary section
+2. Repository information
+3. Directory structure
+4. Multiple file entries, each consisting of:
+5. List of Program files
+6. List of Documents
+
+"""
+
+class IgnoreRules:
+    """The patterns of one .gitignore, compiled into a matcher for paths below its directory."""
+
+    def __init__(self, Lines: list):
+        """Compile gitignore patterns.
+
+        Consecutive patterns with the same sign are joined into one regular
+        expression. The last matching pattern decides, so the runs are tried
+        from last to first. Directory-only patterns are left out of the runs
+        used for files.
+
+        Args:
+            Lines: Lines of a .gitignore file
+        """
+        Rules = [Rule for Rule in map(self.ParsePattern, Lines) if Rule]
+        self.DirectoryRuns = self.JoinRuns(Rules)
+        self.FileRuns = self.JoinRuns([Rule for Rule in Rules if not Rule[2]])
+
+    @classmethod
+    def FromFile(cls, FilePath: str):
+        """Read and compile a .gitignore file, or return None if it cannot be read or has no patterns."""
+        try:
+            with open(FilePath, 'r', encoding='utf-8', errors='replace') as f:
+                Rules = cls(f.read().splitlines())
+        except OSError:
+            return None
+        return Rules if Rules.DirectoryRuns else None
+
+    @staticmethod
+    def ParsePattern(Line: str):
+        """Translate one gitignore line to (regex, negated, directory only), or None."""
+        Line = re.sub(r'(?<!\\) +$', '', Line)
+        if not Line or Line.startswith("#"):
+            return None
+        Negated = Line.startswith("!")
+        if Negated:
+            Line = Line[1:]
+        elif Line.startswith(("\\#", "\\!")):
+            Line = Line[1:]
+        DirectoryOnly = Line.endswith("/")
+        Line = Line.rstrip("/")
+        if not Line:
+            return None
+
+        # A slash anywhere but the end anchors the pattern to the .gitignore's directory
+        Anchored = "/" in Line
+        Line = Line.lstrip("/")
+        Parts = []
+        i = 0
+        while i < len(Line):
+            if Line.startswith("**/", i):
+                Parts.append("(?:.*/)?")
+                i += 3
+            elif Line.startswith("**", i):
+                Parts.append(".*")
+                i += 2
+            elif Line[i] == "*":
+                Parts.append("[^/]*")
+                i += 1
+            elif Line[i] == "?":
+                Parts.append("[^/]")
+                i += 1
+            elif Line[i] == "[" and "]" in Line[i + 2:]:
+                End = Line.index("]", i + 2)
+                Class = Line[i + 1:End]
+                if Class.startswith("!"):
+                    Class = "^" + Class[1:]
+                Parts.append(f"[{Class}]")
+                i = End + 1
+            elif Line[i] == "\\" and i + 1 < len(Line):
+                Parts.append(re.escape(Line[i + 1]))
+                i += 2
+            else:
+                Parts.append(re.escape(Line[i]))
+                i += 1
+        return ("" if Anchored else "(?:.*/)?") + "".join(Parts), Negated, DirectoryOnly
+
+    @staticmethod
+    def JoinRuns(Rules: list) -> list:
+        """Join consecutive rules of the same sign; return [(compiled regex, negated)], last run first."""
+        Runs = []
+        for Pattern, Negated, _ in Rules:
+            if Runs and Runs[-1][1] == Negated:
+                Runs[-1][0].append(Pattern)
+            else:
+                Runs.append(([Pattern], Negated))
+        return [(re.compile("(?:" + "|".join(Patterns) + ")$", re.DOTALL), Negated)
+                for Patterns, Negated in reversed(Runs)]
+
+    def Match(self, RelativePath: str, IsDir: bool):
+        """Return True if a path is ignored, False if it is re-included, or None if no pattern matches.
+
+        Args:
+            RelativePath: Path relative to the .gitignore's directory, with / separators
+            IsDir: Whether the path is a directory
+        """
+        for Regex, Negated in (self.DirectoryRuns if IsDir else self.FileRuns):
+            if Regex.match(RelativePath):
+                return not Negated
+        return None
+
+class SnapshotWalker:
+    """Walks a repository once, drawing its tree and collecting the files to include."""
+
+    ExcludedDirs = {".git", ".venv", "CurrentMods"}
+    ExcludedFiles = {"SimpleTest.py", "test_pyside.py"}
+    DocumentsDir = "Docs"
+
+    def __init__(self, Root: str = ".", SkipPath: str = None, UseGitIgnore: bool = True):
+        """Initialize the walker.
+
+        Args:
+            Root: Repository root
+            SkipPath: Root-relative path to leave out, such as the snapshot being written
+            UseGitIgnore: Leave out what the repository's .gitignore files ignore
+        """
+        self.Root = Root
+        self.SkipPath = SkipPath
+        self.UseGitIgnore = UseGitIgnore
+        self.ProgramFiles = []
+        self.Documents = []
+        self.Directories = 0
+        self.Files = 0
+        self.IgnoredFiles = 0
+        self.IgnoredDirectories = 0
+        self.WalkTime = 0.0
+
+    def SortKey(self, Entry) -> tuple:
+        """Order entries by name, ignoring case first, as tree does."""
+        return (Entry.name.lower(), Entry.name)
+
+    def Walk(self, Write) -> None:
+        """Walk the repository, passing each line of the tree drawing to Write.
+
+        Args:
+            Write: Called with each line of the directory structure, newline included
+        """
+        Start = time.perf_counter()
+        Rules = []
+        if self.UseGitIgnore:
+            Exclude = IgnoreRules.FromFile(os.path.join(self.Root, ".git", "info", "exclude"))
+            if Exclude:
+                Rules.append(("", Exclude))
+        Write(".\n")
+        self.WalkDirectory("", "", True, True, Rules, Write)
+        Write(f"\n{self.Directories} directories, {self.Files} files\n")
+        self.ProgramFiles.sort()
+        self.Documents.sort()
+        self.WalkTime = time.perf_counter() - Start
+
+    def IsIgnored(self, RelativePath: str, IsDir: bool, Rules: list) -> bool:
+        """Check a path against the .gitignore files above it, the nearest first."""
+        for Base, Matcher in reversed(Rules):
+            Result = Matcher.Match(RelativePath[len(Base):], IsDir)
+            if Result is not None:
+                return Result
+        return False
+
+    def WalkDirectory(self, RelativeDir: str, Prefix: str, Visible: bool, Collecting: bool,
+                      Rules: list, Write) -> None:
+        """Walk one directory.
+
+        Args:
+            RelativeDir: Directory relative to the root, '' for the root
+            Prefix: Tree drawing prefix for its entries
+            Visible: Draw its entries; tree leaves out hidden entries
+            Collecting: Collect its files; excluded directories are only drawn
+            Rules: (root-relative base, IgnoreRules) for the .gitignore files above it
+            Write: Called with each line of the tree drawing
+        """
+        with os.scandir(os.path.join(self.Root, RelativeDir)) as Scan:
+            Entries = sorted(Scan, key=self.SortKey)
+        Base = f"{RelativeDir}/" if RelativeDir else ""
+        if self.UseGitIgnore and any(Entry.name == ".gitignore" for Entry in Entries):
+            Matcher = IgnoreRules.FromFile(os.path.join(self.Root, RelativeDir, ".gitignore"))
+            if Matcher:
+                Rules = Rules + [(Base, Matcher)]
+
+        Kept = []
+        for Entry in Entries:
+            if Base + Entry.name == self.SkipPath or Entry.name == ".git":
+                continue
+            IsDir = Entry.is_dir()
+            if Rules and self.IsIgnored(Base + Entry.name, IsDir, Rules):
+                if IsDir:
+                    self.IgnoredDirectories += 1
+                else:
+                    self.IgnoredFiles += 1
+                continue
+            Kept.append((Entry, IsDir))
+        Entries = [Entry for Entry, _ in Kept]
+
+        Shown = [Entry for Entry in Entries if not Entry.name.startswith(".")] if Visible else []
+        Last = Shown[-1].name if Shown else None
+        for Entry, IsDir in Kept:
+            RelativePath = Base + Entry.name
+            EntryVisible = Visible and not Entry.name.startswith(".")
+            IsLast = Entry.name == Last
+            if EntryVisible:
+                Write(f"{Prefix}{'└── ' if IsLast else '├── '}./{RelativePath}\n")
+                if IsDir:
+                    self.Directories += 1
+                else:
+                    self.Files += 1
+
+            if IsDir:
+                if Entry.is_symlink():
+                    continue
+                EntryCollecting = Collecting and not (not RelativeDir and Entry.name in self.ExcludedDirs)
+                if EntryVisible or EntryCollecting:
+                    self.WalkDirectory(RelativePath, Prefix + ("    " if IsLast else "│   "),
+                                       EntryVisible, EntryCollecting, Rules, Write)
+            elif Collecting and Entry.is_file():
+                self.Collect(RelativePath, Entry.name)
+
+    def Collect(self, RelativePath: str, Name: str) -> None:
+        """Add a file to the program files or documents if it belongs in the snapshot."""
+        if Name.endswith(".py") and RelativePath not in self.ExcludedFiles:
+            self.ProgramFiles.append(RelativePath)
+        elif Name.endswith(".md") and RelativePath.startswith(self.DocumentsDir + "/"):
+            self.Documents.append(RelativePath)
+
+class ShardedOutput:
+    """A binary writer that spreads its output over numbered shard files in a directory."""
+
+    IndexName = "index.json"
+
+    def __init__(self, OutputDir: str, MaxBytes: int, BufferSize: int):
+        """Initialize the writer.
+
+        Args:
+            OutputDir: Directory for the shards and index.json; created if missing
+            MaxBytes: Budget for each shard
+            BufferSize: Write buffer size for each shard
+        """
+        self.OutputDir = OutputDir
+        self.MaxBytes = MaxBytes
+        self.BufferSize = BufferSize
+        self.Shards = []    # [name, bytes]
+        self.Files = {}     # Relative path -> [[shard name, offset, length], ...]
+        self.Entry = None
+        self.File = None
+        self.Used = 0
+        self.Total = 0
+        os.makedirs(OutputDir, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *Exc) -> None:
+        self.close()
+
+    def NextShard(self) -> None:
+        """Close the current shard and start the next one."""
+        if self.File:
+            self.File.close()
+        Name = f"part-{len(self.Shards) + 1:03d}.txt"
+        self.Shards.append([Name, 0])
+        self.File = open(os.path.join(self.OutputDir, Name), "wb", buffering=self.BufferSize)
+        self.Used = 0
+        if self.Entry is not None:
+            self.Files[self.Entry].append([Name, 0, 0])
+
+    def write(self, Data: bytes) -> None:
+        """Write a block, starting a new shard first if it would overflow the current one."""
+        if self.File is None or (self.Used and self.Used + len(Data) > self.MaxBytes):
+            self.NextShard()
+        self.File.write(Data)
+        self.Used += len(Data)
+        self.Total += len(Data)
+        self.Shards[-1][1] = self.Used
+        if self.Entry is not None:
+            self.Files[self.Entry][-1][2] += len(Data)
+
+    def WriteSplit(self, Data: bytes) -> None:
+        """Write data that may not fit, filling each shard up to its last whole line."""
+        while len(Data) > self.MaxBytes - self.Used:
+            Room = self.MaxBytes - self.Used
+            Cut = Data.rfind(b"\n", 0, Room) + 1
+            if not Cut and not self.Used:
+                # A line longer than the budget is cut, on a UTF-8 character boundary
+                Cut = Room
+                while Cut > 1 and Data[Cut] & 0xC0 == 0x80:
+                    Cut -= 1
+            if Cut:
+                self.write(Data[:Cut])
+                Data = Data[Cut:]
+            self.NextShard()
+        if Data:
+            self.write(Data)
+
+    def Fit(self, Size: int) -> None:
+        """Start a new shard unless the current one has room for Size more bytes."""
+        if self.File is None or (self.Used and self.Used + Size > self.MaxBytes):
+            self.NextShard()
+
+    def Room(self) -> int:
+        """Bytes left in the current shard's budget."""
+        return self.MaxBytes - self.Used
+
+    def BeginEntry(self, RelativePath: str) -> None:
+        """Start recording the parts written for a file entry."""
+        self.Entry = RelativePath
+        self.Files[RelativePath] = [[self.Shards[-1][0], self.Used, 0]]
+
+    def EndEntry(self) -> None:
+        """Stop recording parts."""
+        self.Entry = None
+
+    def tell(self) -> int:
+        """Bytes written to all shards."""
+        return self.Total
+
+    def close(self) -> None:
+        """Close the last shard and write index.json."""
+        if self.File:
+            self.File.close()
+            self.File = None
+        Index = {"max_bytes": self.MaxBytes,
+                 "shards": [{"name": Name, "bytes": Size} for Name, Size in self.Shards],
+                 "files": {Path: {"parts": Parts} for Path, Parts in self.Files.items()}}
+        with open(os.path.join(self.OutputDir, self.IndexName), "w", encoding="utf-8") as f:
+            f.write(json.dumps(Index, indent=1, ensure_ascii=False))
+
+def DefaultCacheDir() -> Path:
+    """Return the cache directory, honoring XDG_CACHE_HOME."""
+    Base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(Base) / "codebasesummary"
+
+class SnapshotCache:
+    """The contents of the files in earlier snapshots of one repository, kept in a segment store."""
+
+    Version = 1
+    CompactMinimum = 1024 * 1024
+
+    def __init__(self, Root: str, CacheDir: str = None):
+        """Open the cache for a repository.
+
+        Args:
+            Root: Repository root; each root has its own store
+            CacheDir: Cache directory (default: DefaultCacheDir())
+        """
+        Key = hashlib.blake2b(os.path.abspath(Root).encode("utf-8"), digest_size=8).hexdigest()
+        self.CacheDir = (Path(CacheDir) if CacheDir else DefaultCacheDir()) / Key
+        self.StorePath = self.CacheDir / "segments.bin"
+        self.IndexPath = self.CacheDir / "index.json"
+        self.Files = {}     # Relative path -> [size, mtime_ns, digest, offset, length]
+        self.Reused = 0
+        self.Read = 0
+        self.CacheDir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(self.IndexPath, 'r', encoding='utf-8') as f:
+                Index = json.load(f)
+        except (OSError, ValueError):
+            Index = {}
+        self.Store = open(self.StorePath, "a+b")
+        self.Store.seek(0, os.SEEK_END)
+        End = self.Store.tell()
+        if Index.get("version") == self.Version:
+            self.Files = {Path: Entry for Path, Entry in Index.get("files", {}).items() if Entry[3] + Entry[4] <= End}
+
+    def Lookup(self, RelativePath: str, FilePath: str):
+        """Return the (offset, length) of a file's segment if the file is unchanged, else None."""
+        Entry = self.Files.get(RelativePath)
+        if Entry is None:
+            return None
+        try:
+            Stat = os.stat(FilePath)
+        except OSError:
+            return None
+        if [Stat.st_size, Stat.st_mtime_ns] != Entry[:2]:
+            return None
+        self.Reused += 1
+        return Entry[3], Entry[4]
+
+    def ReadSegment(self, Offset: int, Length: int, BlockSize: int):
+        """Yield a segment of the store in blocks."""
+        self.Store.seek(Offset)
+        while Length > 0:
+            Block = self.Store.read(min(BlockSize, Length))
+            if not Block:
+                raise OSError(f"Snapshot cache {self.StorePath} is truncated")
+            Length -= len(Block)
+            yield Block
+
+    def Record(self, RelativePath: str, Stat: os.stat_result, Blocks):
+        """Pass a file's blocks through, hashing them and appending them to the store.
+
+        If the digest matches the cached one the appended copy is dropped and
+        only the stat is updated.
+        """
+        self.Read += 1
+        Hash = hashlib.blake2b(digest_size=20)
+        Offset = self.Store.seek(0, os.SEEK_END)
+        for Block in Blocks:
+            Hash.update(Block)
+            self.Store.write(Block)
+            yield Block
+        Length = self.Store.tell() - Offset
+        Digest = Hash.hexdigest()
+
+        Previous = self.Files.get(RelativePath)
+        if Previous is not None and Previous[2] == Digest and Previous[4] == Length:
+            self.Store.truncate(Offset)
+            Offset = Previous[3]
+        self.Files[RelativePath] = [Stat.st_size, Stat.st_mtime_ns, Digest, Offset, Length]
+
+    def Save(self, Keep) -> None:
+        """Forget files that are no longer included, compact the store if needed, and write the index.
+
+        Args:
+            Keep: Relative paths of all files included in this snapshot
+        """
+        Keep = set(Keep)
+        self.Files = {Path: Entry for Path, Entry in self.Files.items() if Path in Keep}
+        Live = sum(Entry[4] for Entry in self.Files.values())
+        End = self.Store.seek(0, os.SEEK_END)
+        if End > self.CompactMinimum and End > 2 * Live:
+            self.Compact()
+        self.Store.flush()
+        os.fsync(self.Store.fileno())
+
+        Temporary = self.IndexPath.with_name(f".index.json.{os.getpid()}")
+        with open(Temporary, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"version": self.Version, "files": self.Files}, separators=(",", ":")))
+        os.replace(Temporary, self.IndexPath)
+
+    def Compact(self) -> None:
+        """Rewrite the store with only the segments still in use."""
+        Temporary = self.StorePath.with_name(f".segments.bin.{os.getpid()}")
+        with open(Temporary, "wb") as Output:
+            for Entry in sorted(self.Files.values(), key=lambda Entry: Entry[3]):
+                Offset = Output.tell()
+                for Block in self.ReadSegment(Entry[3], Entry[4], 1024 * 1024):
+                    Output.write(Block)
+                Entry[3] = Offset
+        os.replace(Temporary, self.StorePath)
+        self.Store.close()
+        self.Store = open(self.StorePath, "a+b")
+
+    def Close(self) -> None:
+        """Close the segment store."""
+        self.Store.close()
+
+class SnapshotWriter:
+    """Writes a codebase snapshot through one buffered binary writer."""
+
+    BufferSize = 1024 * 1024
+
+    def __init__(self, Root: str, OutputPath: str, Project: str = None, UseGitIgnore: bool = True,
+                 ShardBytes: int = None, Cache: SnapshotCache = None, Since: str = None):
+        """Initialize the writer.
+
+        Args:
+            Root: Repository root
+            OutputPath: Snapshot file to write, or directory for the shards
+            Project: Project name for the header (default: name of the root directory)
+            UseGitIgnore: Leave out what the repository's .gitignore files ignore
+            ShardBytes: Budget for each shard; None writes a single file
+            Cache: Cache of file contents from earlier snapshots
+            Since: Include only files changed since this git revision
+        """
+        self.Root = Root
+        self.OutputPath = OutputPath
+        self.Project = Project or os.path.basename(os.path.abspath(Root))
+        self.UseGitIgnore = UseGitIgnore
+        self.ShardBytes = ShardBytes
+        self.Cache = Cache
+        self.Since = Since
+        self.Shards = None
+        self.Output = None
+        self.BytesWritten = 0
+
+    def Write(self, Text: str) -> None:
+        """Write text to the snapshot."""
+        Data = Text.encode("utf-8")
+        self.Output.write(Data)
+        self.BytesWritten += len(Data)
+
+    def Section(self, Title: str) -> None:
+        """Write a section heading."""
+        self.Write(f"{RULE}\n{Title}\n{RULE}\n")
+
+    def BeginEntry(self, RelativePath: str, Size: int) -> None:
+        """Start a file entry of Size bytes in total, moving to a new shard if it does not fit."""
+        if self.Shards:
+            self.Shards.Fit(Size)
+            self.Shards.BeginEntry(RelativePath)
+
+    def EndEntry(self) -> None:
+        """Finish a file entry."""
+        if self.Shards:
+            self.Shards.EndEntry()
+
+    def WriteBlocks(self, Blocks, Size: int) -> None:
+        """Write the contents of a file entry, splitting it over shards if it does not fit one."""
+        Before = self.Output.tell()
+        Write = self.Shards.WriteSplit if self.Shards and Size > self.Shards.Room() else self.Output.write
+        for Block in Blocks:
+            Write(Block)
+        self.BytesWritten += self.Output.tell() - Before
+
+    def CopyFile(self, RelativePath: str) -> None:
+        """Write a file entry, copying the file's bytes in blocks or splicing them from the cache."""
+        Heading = f"================\nFile: {RelativePath}\n================\n"
+        FilePath = os.path.join(self.Root, RelativePath)
+        Cached = self.Cache.Lookup(RelativePath, FilePath) if self.Cache else None
+        if Cached:
+            Offset, Size = Cached
+            self.BeginEntry(RelativePath, len(Heading.encode("utf-8")) + Size + 1)
+            self.Write(Heading)
+            self.WriteBlocks(self.Cache.ReadSegment(Offset, Size, self.BufferSize), Size)
+            self.Write("\n")
+            self.EndEntry()
+            return
+
+        try:
+            Source = open(FilePath, "rb")
+        except OSError as Ex:
+            Entry = f"{Heading}Error reading file: {Ex.strerror}\n\n"
+            self.BeginEntry(RelativePath, len(Entry.encode("utf-8")))
+            self.Write(Entry)
+            self.EndEntry()
+            return
+
+        with Source:
+            Stat = os.fstat(Source.fileno())
+            self.BeginEntry(RelativePath, len(Heading.encode("utf-8")) + Stat.st_size + 1)
+            self.Write(Heading)
+            Blocks = iter(partial(Source.read, self.BufferSize), b"")
+            if self.Cache:
+                Blocks = self.Cache.Record(RelativePath, Stat, Blocks)
+            self.WriteBlocks(Blocks, Stat.st_size)
+        self.Write("\n")
+        self.EndEntry()
+
+    def ChangedFiles(self) -> set:
+        """Paths relative to the root of the files changed since self.Since, untracked files included.
+
+        Raises:
+            RuntimeError: git cannot compare against the revision
+        """
+        Changed = set()
+        for Command in (["diff", "--name-only", "--no-renames", "--relative", "-z", self.Since, "--"],
+                        ["ls-files", "--others", "--exclude-standard", "-z"]):
+            Result = subprocess.run(["git", "-C", self.Root, *Command], capture_output=True)
+            if Result.returncode != 0:
+                raise RuntimeError(Result.stderr.decode("utf-8", "replace").strip())
+            Changed.update(Path for Path in Result.stdout.decode("utf-8", "surrogateescape").split("\0") if Path)
+        return Changed
+
+    def Generate(self) -> SnapshotWalker:
+        """Walk the repository and write the whole snapshot; return the walker with its counts."""
+        SkipPath = os.path.relpath(os.path.abspath(self.OutputPath), os.path.abspath(self.Root)).replace(os.sep, "/")
+        Walker = SnapshotWalker(self.Root, SkipPath, self.UseGitIgnore)
+        Changed = self.ChangedFiles() if self.Since else None
+        if self.ShardBytes:
+            self.Shards = Output = ShardedOutput(self.OutputPath, self.ShardBytes, self.BufferSize)
+        else:
+            Output = open(self.OutputPath, "wb", buffering=self.BufferSize)
+        with Output as self.Output:
+            self.Write(HEADER.format(Project=self.Project))
+            self.Section("Directory Structure")
+            Walker.Walk(self.Write)
+            self.Write("\n")
+            Collected = Walker.ProgramFiles + Walker.Documents
+            if Changed is not None:
+                Walker.ProgramFiles = [Path for Path in Walker.ProgramFiles if Path in Changed]
+                Walker.Documents = [Path for Path in Walker.Documents if Path in Changed]
+
+            self.Section("Files")
+            self.Write("\n")
+            for RelativePath in Walker.ProgramFiles + Walker.Documents:
+                self.CopyFile(RelativePath)
+
+            Included = [f"./{Path}" for Path in Walker.ProgramFiles] + Walker.Documents
+            self.Write("\n")
+            self.Section("List of Program Files")
+            self.Write("\nProgram files included:\n")
+            for Path in Included:
+                self.Write(f"{Path}\n")
+            self.Write(f"\nThere are {len(Included)} program files included in the Files section of the CodebaseSummary document.\n")
+
+            self.Write("\n")
+            self.Section("List of Documents")
+            self.Write("\nDocuments included:\n")
+            for Path in Walker.Documents:
+                self.Write(f"{Path}\n")
+        self.Output = None
+        if self.Cache:
+            self.Cache.Save(Collected)
+        return Walker
+
+def Main():
+    """Main entry point for the codebase snapshot."""
+    Parser = argparse.ArgumentParser(description="Generate a comprehensive codebase snapshot in a structured format")
+    Parser.add_argument("Root", nargs="?", default=".", help="Repository root (default: current directory)")
+    Parser.add_argument("-o", "--output", dest="Output", default=None,
+                        help="Snapshot file, or directory when sharded (default: CodebaseSummary_<timestamp>[.txt])")
+    Parser.add_argument("--project", dest="Project", default=None,
+                        help="Project name for the header (default: name of the root directory)")
+    Parser.add_argument("--no-gitignore", dest="UseGitIgnore", action="store_false",
+                        help="Include files that .gitignore ignores")
+    Budget = Parser.add_mutually_exclusive_group()
+    Budget.add_argument("--max-bytes", dest="MaxBytes", type=int, default=None,
+                        help="Split the snapshot into shards of at most this many bytes")
+    Budget.add_argument("--max-tokens", dest="MaxTokens", type=int, default=None,
+                        help=f"Split the snapshot into shards of about this many tokens ({BYTES_PER_TOKEN} bytes each)")
+    Parser.add_argument("--since", dest="Since", default=None, metavar="REVISION",
+                        help="Include only files changed since a git revision")
+    Parser.add_argument("--no-cache", dest="UseCache", action="store_false",
+                        help="Read every file instead of reusing unchanged ones from the snapshot cache")
+    Parser.add_argument("--cache-dir", dest="CacheDir", default=None,
+                        help="Snapshot cache directory (default: ~/.cache/codebasesummary)")
+    Args = Parser.parse_args()
+
+    if not os.path.isdir(Args.Root):
+        print(f"Error: {Args.Root} is not a directory.", file=sys.stderr)
+        sys.exit(1)
+
+    ShardBytes = Args.MaxBytes or (Args.MaxTokens and Args.MaxTokens * BYTES_PER_TOKEN)
+    if ShardBytes is not None and ShardBytes <= 0:
+        print("Error: the shard budget must be positive.", file=sys.stderr)
+        sys.exit(1)
+    OutputPath = Args.Output or f"CodebaseSummary_{datetime.now():%Y%m%d_%H%M%S}{'' if ShardBytes else '.txt'}"
+    print(f"Generating codebase summary to {OutputPath}...")
+
+    Start = time.perf_counter()
+    Cache = SnapshotCache(Args.Root, Args.CacheDir) if Args.UseCache else None
+    Writer = SnapshotWriter(Args.Root, OutputPath, Args.Project, Args.UseGitIgnore, ShardBytes, Cache, Args.Since)
+    try:
+        Walker = Writer.Generate()
+    except RuntimeError as Ex:
+        print(f"Error: {Ex}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if Cache:
+            Cache.Close()
+
+    print(f"Codebase summary generated: {OutputPath}")
+    print(f"It contains {len(Walker.ProgramFiles) + len(Walker.Documents)} program files "
+          f"({Writer.BytesWritten / 1048576:.1f} MB in {time.perf_counter() - Start:.2f}s).")
+    if Writer.Shards:
+        print(f"Written as {len(Writer.Shards.Shards)} shards of up to {ShardBytes} bytes, "
+              f"indexed in {os.path.join(OutputPath, ShardedOutput.IndexName)}.")
+    if Cache:
+        print(f"Reused {Cache.Reused} unchanged files from the snapshot cache and read {Cache.Read}.")
+    print(f"Walked the repository in {Walker.WalkTime:.2f}s, skipping {Walker.IgnoredFiles} ignored files "
+          f"and {Walker.IgnoredDirectories} ignored directories.")
+
+if __name__ == '__main__':
+    Main()
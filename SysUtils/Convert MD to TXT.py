@@ -1,77 +1,443 @@
 import os
 import re
+import sys
+import json
+import time
 import shutil
+import hashlib
+import posixpath
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
+from urllib.parse import unquote
 
-def convert_markdown_to_text(source_dir="Docs/KnowledgeDatabaseIndex", dest_dir="Text"):
+# Paths sent to a worker per task, and tasks kept in flight per worker
+BATCH_SIZE = 64
+TASKS_PER_WORKER = 4
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 1.0
+
+# Manifest of converted files, kept in the output directory. Bump the version
+# when the conversion changes so every file is converted again.
+MANIFEST_NAME = ".conversion_manifest.json"
+MANIFEST_VERSION = 2
+
+# Link graph of the converted files, kept in the output directory
+LINK_GRAPH_NAME = "link_graph.json"
+
+# Broken links listed in the console report; the link graph has all of them
+BROKEN_LINKS_SHOWN = 20
+
+# One pass over a file finds every token that may hold a reference. Code is
+# matched so that it is left alone; inline links, reference definitions and
+# bare file mentions are resolved and rewritten if they point at a converted file.
+TOKEN_PATTERN = r'''
+    (?P<fence>^(?P<fence_mark>```|~~~).*?^(?P=fence_mark)[^\n]*$)
+  | (?P<code>`[^`\n]+`)
+  | \[(?P<text>[^\]\n]*)\]\((?P<target><[^>\n]+>|[^)\s]+)(?P<title>\s+"[^"\n]*")?\)
+  | ^[ ]{0,3}\[(?P<ref_id>[^\]\n]+)\]:[ \t]*(?P<ref_target>\S+)
+  | (?<![^\s(])(?P<mention>[^\s()\[\]<>"'`]*?\.md)\b
+'''
+
+# Set once per worker process by init_worker()
+token_pattern = None
+markdown_index = frozenset()
+created_dirs = set()
+
+def init_worker(index):
+    """
+    Compiles the token pattern and keeps the index of Markdown files for this worker process.
+
+    Args:
+        index: Source-relative paths, with '/' separators, of every .md file being converted
+    """
+    global token_pattern, markdown_index
+    token_pattern = re.compile(TOKEN_PATTERN, re.MULTILINE | re.DOTALL | re.VERBOSE)
+    markdown_index = index
+
+@lru_cache(maxsize=65536)
+def resolve_reference(target, rel_dir):
+    """
+    Resolves a link target to the source-relative path of a .md file.
+
+    Args:
+        target: Link target as written, possibly with an anchor or query
+        rel_dir: Source-relative directory of the file containing the link
+
+    Returns:
+        Tuple of (resolved path, length of the path part of target), or None for
+        external URLs, anchors, other file types and paths outside the source tree
+    """
+    if '://' in target or target.startswith(('mailto:', '#', 'www.')):
+        return None
+    path = target.split('#', 1)[0].split('?', 1)[0]
+    if not path.endswith('.md'):
+        return None
+
+    base = '' if path.startswith('/') else rel_dir
+    resolved = posixpath.normpath(posixpath.join(base, unquote(path).lstrip('/')))
+    if resolved == '..' or resolved.startswith('../'):
+        return None
+    return resolved, len(path)
+
+def convert_content(content, rel_path):
+    """
+    Rewrites the references in a Markdown file that point at converted files from .md to .txt.
+
+    Args:
+        content: Text of the Markdown file
+        rel_path: Source-relative path of the file, with '/' separators
+
+    Returns:
+        Tuple of (converted text, sorted link targets, sorted mentioned files).
+        Targets and mentions are resolved source-relative .md paths, whether or
+        not the files exist.
+    """
+    rel_dir = posixpath.dirname(rel_path)
+    links = set()
+    mentions = set()
+
+    def rewrite(target, found):
+        """Point a target at the .txt output if it resolves to a file in the index."""
+        bracketed = target.startswith('<') and target.endswith('>')
+        reference = resolve_reference(target[1:-1] if bracketed else target, rel_dir)
+        if reference is None:
+            return target
+        resolved, path_length = reference
+        found.add(resolved)
+        if resolved not in markdown_index:
+            return target
+        # Swap the extension at the end of the path part, before any anchor
+        end = path_length + bracketed
+        return target[:end - len('.md')] + '.txt' + target[end:]
+
+    def replace(match):
+        if match.group('target') is not None:
+            text = token_pattern.sub(replace, match.group('text'))
+            return f"[{text}]({rewrite(match.group('target'), links)}{match.group('title') or ''})"
+        if match.group('ref_target') is not None:
+            prefix = match.group(0)[:match.start('ref_target') - match.start(0)]
+            return prefix + rewrite(match.group('ref_target'), links)
+        if match.group('mention') is not None:
+            return rewrite(match.group('mention'), mentions)
+        return match.group(0)  # Code
+
+    return token_pattern.sub(replace, content), sorted(links), sorted(mentions)
+
+def convert_batch(batch):
+    """
+    Converts a batch of Markdown files in a worker process.
+
+    A file whose content hash matches the one in the manifest, and whose output
+    still exists, is not converted again.
+
+    Args:
+        batch: List of (Markdown file, text file, relative path, previous content
+            hash or None)
+
+    Returns:
+        List of (relative path, content hash, bytes read, bytes written, links,
+        mentions, error); bytes written and links are None for an unchanged file,
+        and the hash is None on error
+    """
+    results = []
+
+    for md_file, txt_file, rel_path, old_hash in batch:
+        try:
+            # Read the content of the Markdown file
+            with open(md_file, 'rb') as f:
+                raw = f.read()
+            content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            if content_hash == old_hash and os.path.exists(txt_file):
+                results.append((rel_path, content_hash, len(raw), None, None, None, None))
+                continue
+            content = raw.decode('utf-8')
+
+            # Create destination directory structure, once per directory
+            dest_file_dir = os.path.dirname(txt_file)
+            if dest_file_dir not in created_dirs:
+                os.makedirs(dest_file_dir, exist_ok=True)
+                created_dirs.add(dest_file_dir)
+
+            # Update internal references from .md to .txt
+            content, links, mentions = convert_content(content, rel_path)
+
+            # Write the updated content to the text file
+            with open(txt_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+            results.append((rel_path, content_hash, len(raw), os.path.getsize(txt_file), links, mentions, None))
+        except (OSError, UnicodeDecodeError) as e:
+            results.append((rel_path, None, 0, 0, None, None, str(e)))
+
+    return results
+
+def iter_markdown_files(source_dir, text_dir):
+    """
+    Yields (path, stat) for every .md file below the source directory, skipping
+    the output directory.
+
+    Args:
+        source_dir: The source directory containing Markdown files
+        text_dir: The output directory, which is not searched
+    """
+    text_dir = os.path.abspath(text_dir)
+    stack = [source_dir]
+    while stack:
+        current_dir = stack.pop()
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if os.path.abspath(entry.path) != text_dir:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    yield entry.path, entry.stat()
+
+def load_manifest(text_dir):
+    """
+    Loads the manifest of converted files, or an empty one if it is missing or outdated.
+
+    Returns:
+        Dict of relative source path -> {"size", "mtime_ns", "hash", "output",
+        "links", "mentions"}
+    """
+    try:
+        with open(os.path.join(text_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+def save_manifest(text_dir, files):
+    """
+    Writes the manifest of converted files, replacing the previous one atomically.
+    """
+    manifest_path = os.path.join(text_dir, MANIFEST_NAME)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"version": MANIFEST_VERSION, "files": files}, separators=(",", ":")))
+    os.replace(temp_path, manifest_path)
+
+def remove_output(text_dir, output):
+    """
+    Deletes an output file, and any directories left empty by it up to the output directory.
+    """
+    txt_file = os.path.join(text_dir, output)
+    try:
+        os.remove(txt_file)
+    except FileNotFoundError:
+        pass
+    parent = os.path.dirname(txt_file)
+    while os.path.abspath(parent) != os.path.abspath(text_dir):
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
+        parent = os.path.dirname(parent)
+
+def write_link_graph(text_dir, files):
+    """
+    Writes the link graph of the converted files and returns its broken links.
+
+    Args:
+        text_dir: The output directory
+        files: Manifest entries of every converted file
+
+    Returns:
+        Sorted list of (source file, missing target) pairs
+    """
+    links = {}
+    broken = {}
+    inbound = dict.fromkeys(files, 0)
+    for rel_path, entry in sorted(files.items()):
+        for target in entry["links"]:
+            if target in files:
+                links.setdefault(rel_path, []).append(target)
+                inbound[target] += 1
+            else:
+                broken.setdefault(rel_path, []).append(target)
+
+    graph = {
+        "files": len(files),
+        "links": links,
+        "broken": broken,
+        "unreferenced": sorted(rel_path for rel_path, count in inbound.items() if not count)
+    }
+    with open(os.path.join(text_dir, LINK_GRAPH_NAME), 'w', encoding='utf-8') as f:
+        f.write(json.dumps(graph, separators=(",", ":")))
+
+    return [(rel_path, target) for rel_path, targets in broken.items() for target in targets]
+
+def iter_batches(md_files, source_dir, text_dir, manifest, changed_paths, pending_stats, counts):
+    """
+    Yields lists of files to convert.
+
+    Files whose size and modification time match the manifest are skipped
+    without being read, unless they refer to a file that was added or removed,
+    since that changes which of their references are rewritten.
+
+    Args:
+        md_files: List of (path, stat) of every Markdown file
+        source_dir: The source directory containing Markdown files
+        text_dir: The output directory that mirrors the source structure
+        manifest: Manifest entries from the previous run
+        changed_paths: Relative paths of the Markdown files added or removed since then
+        pending_stats: Dict that collects (size, mtime_ns) of the files sent for conversion
+        counts: Dict whose "skipped" count is incremented for unchanged files
+    """
+    batch = []
+    for md_file, stat in md_files:
+        # Create relative path to maintain directory structure
+        rel_path = os.path.relpath(md_file, source_dir).replace(os.sep, '/')
+
+        # Generate output filename
+        output = rel_path[:-len('.md')] + '.txt'
+        txt_file = os.path.join(text_dir, output)
+
+        entry = manifest.get(rel_path)
+        old_hash = entry["hash"] if entry else None
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            if changed_paths.isdisjoint(entry["links"]) and changed_paths.isdisjoint(entry["mentions"]):
+                counts["skipped"] += 1
+                continue
+            old_hash = None  # Same content, but its references resolve differently
+
+        pending_stats[rel_path] = (stat.st_size, stat.st_mtime_ns)
+        batch.append((md_file, txt_file, rel_path, old_hash))
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def convert_markdown_to_text(source_dir="Docs/KnowledgeDatabaseIndex", dest_dir="Text", workers=None, force=False):
     """
     Converts all Markdown (.md) files in the source directory to text (.txt) files,
     placing them in a 'Text' subdirectory while preserving the folder structure.
     Also updates internal references from .md to .txt.
-    
+
+    The tree is walked once up front to build an index of the Markdown files.
+    Each file is then tokenized in a single pass. Inline links, reference
+    definitions and bare mentions of .md files are rewritten only if they resolve
+    to a file in the index; URLs, code and references to missing files are left
+    as they are. A link graph, with broken links and files nothing links to, is
+    written to link_graph.json in the output directory.
+
+    Files are converted on a pool of worker processes in batches, with a bounded
+    number of batches in flight. Progress is printed about once a second, and a
+    summary with files per second and bytes processed is printed at the end.
+
+    Conversion is incremental. A manifest in the output directory records the
+    size, modification time, content hash and references of each converted
+    source. Files with an unchanged size and modification time are skipped after
+    a stat, and files whose content hash is unchanged are not rewritten. Outputs
+    whose source was deleted are removed.
+
     Args:
         source_dir: The source directory containing Markdown files
         dest_dir: The destination subdirectory (default: "Text")
+        workers: Number of worker processes (default: CPU count)
+        force: Convert every file, even if the manifest says it is up to date
     """
     # Ensure the source directory exists
     if not os.path.exists(source_dir):
         print(f"Error: Source directory '{source_dir}' does not exist.")
         return
-        
+
     # Create the destination directory if it doesn't exist
     text_dir = os.path.join(source_dir, dest_dir)
     os.makedirs(text_dir, exist_ok=True)
-    
-    # Regular expression to find Markdown references like [text](filename.md)
-    md_ref_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\.md\)')
-    
-    # Find all .md files in the source directory and its subdirectories
-    md_files = []
-    for root, _, files in os.walk(source_dir):
-        # Skip the Text directory itself
-        if os.path.abspath(root).startswith(os.path.abspath(text_dir)):
-            continue
-            
-        for file in files:
-            if file.endswith('.md'):
-                md_files.append(os.path.join(root, file))
-    
-    print(f"Found {len(md_files)} Markdown files to convert.")
-    
-    # Process each file
-    for md_file in md_files:
-        # Create relative path to maintain directory structure
-        rel_path = os.path.relpath(md_file, source_dir)
-        
-        # Create destination directory structure
-        dest_file_dir = os.path.join(text_dir, os.path.dirname(rel_path))
-        os.makedirs(dest_file_dir, exist_ok=True)
-        
-        # Generate output filename
-        txt_filename = os.path.basename(md_file).replace('.md', '.txt')
-        txt_file = os.path.join(dest_file_dir, txt_filename)
-        
-        print(f"Converting: {md_file} -> {txt_file}")
-        
-        # Read the content of the Markdown file
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Update internal references from .md to .txt
-        content = md_ref_pattern.sub(r'[\1](\2.txt)', content)
-        
-        # Update any other explicit mentions of .md files
-        content = re.sub(r'(\S+)\.md\b', r'\1.txt', content)
-        
-        # Write the updated content to the text file
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-    
-    print(f"\nConversion complete. {len(md_files)} files converted to .txt format in the {dest_dir} directory.")
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    last_report = start
+    converted = 0
+    bytes_read = 0
+    bytes_written = 0
+    errors = []
+
+    # Index every Markdown file before converting any, so references can be resolved
+    md_files = list(iter_markdown_files(source_dir, text_dir))
+    index = frozenset(os.path.relpath(md_file, source_dir).replace(os.sep, '/') for md_file, _ in md_files)
+    print(f"Found {len(md_files)} Markdown files in {time.perf_counter() - start:.2f}s.")
+
+    manifest = load_manifest(text_dir)
+    files = dict(manifest)
+    changed_paths = index.symmetric_difference(manifest)
+    pending_stats = {}
+    counts = {"skipped": 0, "unchanged": 0, "removed": 0}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(index,)) as pool:
+        pending = set()
+        batches = iter_batches(md_files, source_dir, text_dir, {} if force else manifest,
+                               changed_paths, pending_stats, counts)
+        exhausted = False
+
+        while pending or not exhausted:
+            # Keep the pool fed without queueing the whole tree at once
+            while not exhausted and len(pending) < workers * TASKS_PER_WORKER:
+                batch = next(batches, None)
+                if batch is None:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(convert_batch, batch))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for rel_path, content_hash, read, written, links, mentions, error in future.result():
+                    size, mtime_ns = pending_stats.pop(rel_path)
+                    if error is not None:
+                        errors.append((rel_path, error))
+                        files.pop(rel_path, None)
+                        continue
+                    bytes_read += read
+                    if written is None:
+                        counts["unchanged"] += 1
+                        files[rel_path].update(size=size, mtime_ns=mtime_ns)
+                        continue
+                    converted += 1
+                    bytes_written += written
+                    files[rel_path] = {"size": size, "mtime_ns": mtime_ns, "hash": content_hash,
+                                       "output": rel_path[:-len('.md')] + '.txt',
+                                       "links": links, "mentions": mentions}
+
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                print(f"Converted {converted} files ({converted / (now - start):.0f} files/s), "
+                      f"{counts['skipped']} up to date")
+                last_report = now
+
+    # Remove the outputs of sources that no longer exist
+    for rel_path in [rel_path for rel_path in files if rel_path not in index]:
+        remove_output(text_dir, files.pop(rel_path)["output"])
+        counts["removed"] += 1
+    save_manifest(text_dir, files)
+    broken_links = write_link_graph(text_dir, files)
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    for rel_path, error in errors:
+        print(f"Error converting {rel_path}: {error}", file=sys.stderr)
+    for rel_path, target in broken_links[:BROKEN_LINKS_SHOWN]:
+        print(f"Broken link in {rel_path}: {target}")
+    if len(broken_links) > BROKEN_LINKS_SHOWN:
+        print(f"... and {len(broken_links) - BROKEN_LINKS_SHOWN} more broken links in {LINK_GRAPH_NAME}")
+
+    print(f"\nConversion complete. {converted} files converted to .txt format in the {dest_dir} directory.")
+    print(f"{counts['skipped'] + counts['unchanged']} files up to date "
+          f"({counts['unchanged']} touched but unchanged), {counts['removed']} outputs of deleted files removed, "
+          f"{len(broken_links)} broken links.")
+    print(f"{bytes_read / 1048576:.1f} MB read, {bytes_written / 1048576:.1f} MB written in {elapsed:.2f}s "
+          f"({converted / elapsed:.0f} files/s, {bytes_read / 1048576 / elapsed:.1f} MB/s) "
+          f"with {workers} workers, {len(errors)} errors.")
 
 if __name__ == "__main__":
     # Use the specified base directory
     source_dir = "Docs/KnowledgeDatabaseIndex"
-    
+
     # Run the conversion
-    convert_markdown_to_text(source_dir)
\ No newline at end of file
+    convert_markdown_to_text(source_dir, force="--force" in sys.argv[1:])
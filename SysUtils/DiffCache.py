@@ -0,0 +1,261 @@
+# File: DiffCache.py
+# Path: SysUtils/DiffCache.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: On-disk cache of diff results for MyDiff, keyed by file content
+
+"""
+Diff Cache
+
+This module keeps diff results between runs of MyDiff and DiffCli, so comparing
+a pair of files again does not read, index or diff them again.
+
+A result is keyed by the BLAKE2b digests of both files, the algorithm and any
+other options that change the result. It is stored as a blob of opcodes, next to
+a blob of line offsets for each file. With the offsets, a file can be mapped and
+shown without scanning it.
+
+To avoid hashing a file just to look up its result, the cache remembers the size,
+modification time and digest of every file it has seen. When a file changes, the
+entries for its old content are dropped, unless another known file still has that
+content. Other entries are not touched.
+
+Everything lives in one directory (by default ~/.cache/mydiff):
+
+    cache.json         entries with their size, last use and digests, and the known files
+    blobs/diff-<key>   opcodes as packed 64-bit integers
+    blobs/lines-<d>    line offsets of the file with digest <d>
+
+Entries are evicted least recently used first once the blobs exceed the size cap.
+Blobs are written to a temporary file and renamed into place, so worker processes
+can write them concurrently. Changes to cache.json are recorded in a journal,
+which a worker returns to the process that owns the cache, and that process
+applies and saves it.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from array import array
+from pathlib import Path
+from typing import Optional
+
+def DefaultCacheDir() -> Path:
+    """Return the cache directory, honoring XDG_CACHE_HOME."""
+    Base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(Base) / "mydiff"
+
+class DiffCache:
+    """An LRU, size-capped store of diff opcodes and line offsets."""
+
+    Version = 2
+    DefaultMaxBytes = 512 * 1024 * 1024
+    Tags = ("equal", "replace", "delete", "insert")
+    TagCodes = {Tag: Code for Code, Tag in enumerate(Tags)}
+
+    def __init__(self, CacheDir: Optional[str] = None, MaxBytes: Optional[int] = None, LoadIndex: bool = True):
+        """Initialize the cache.
+
+        Args:
+            CacheDir: Cache directory (default: DefaultCacheDir())
+            MaxBytes: Size cap for the stored blobs
+            LoadIndex: Read cache.json. Workers that only look up and store blobs,
+                and return their journal, can skip it.
+        """
+        self.CacheDir = Path(CacheDir) if CacheDir else DefaultCacheDir()
+        self.BlobDir = self.CacheDir / "blobs"
+        self.IndexPath = self.CacheDir / "cache.json"
+        self.MaxBytes = MaxBytes or self.DefaultMaxBytes
+        self.Entries = {}   # Blob name -> [size, last used, digests]
+        self.Files = {}     # Absolute path -> [size, mtime_ns, digest]
+        self.Journal = []
+        self.Lock = threading.RLock()
+        self.BlobDir.mkdir(parents=True, exist_ok=True)
+        if LoadIndex:
+            self.LoadIndex()
+
+    #
+    # Index
+    #
+
+    def LoadIndex(self) -> None:
+        """Read cache.json and reconcile it with the blobs on disk."""
+        try:
+            with open(self.IndexPath, 'r') as f:
+                Index = json.load(f)
+        except (OSError, ValueError):
+            Index = {}
+        if Index.get("version") == self.Version:
+            self.Entries = Index.get("entries", {})
+            self.Files = Index.get("files", {})
+
+        # Blobs written by a process that never saved the index are adopted, so
+        # they are still evicted in time; entries whose blob is gone are dropped
+        OnDisk = {}
+        with os.scandir(self.BlobDir) as Entries:
+            for Entry in Entries:
+                if not Entry.name.startswith("."):
+                    Stat = Entry.stat()
+                    OnDisk[Entry.name] = (Stat.st_size, Stat.st_mtime)
+        self.Entries = {Name: Value for Name, Value in self.Entries.items() if Name in OnDisk}
+        for Name, (Size, Modified) in OnDisk.items():
+            if Name not in self.Entries:
+                Digests = [Name[len("lines-"):]] if Name.startswith("lines-") else []
+                self.Entries[Name] = [Size, Modified, Digests]
+
+    def Save(self) -> None:
+        """Evict down to the size cap and write cache.json."""
+        with self.Lock:
+            self.Evict()
+            Temporary = self.IndexPath.with_name(f".cache.json.{os.getpid()}.{threading.get_ident()}")
+            with open(Temporary, 'w') as f:
+                f.write(json.dumps({"version": self.Version, "entries": self.Entries, "files": self.Files},
+                                   separators=(",", ":")))
+            os.replace(Temporary, self.IndexPath)
+            self.Journal = []
+
+    def Apply(self, Journal: list) -> None:
+        """Replay a journal returned by a worker."""
+        for Event in Journal:
+            if Event[0] == "file":
+                self.RememberFile(*Event[1:])
+            elif Event[0] == "use":
+                self.Touch(Event[1])
+            elif Event[0] == "add":
+                self.AddEntry(*Event[1:])
+
+    def TotalBytes(self) -> int:
+        """Size of all stored blobs."""
+        return sum(Entry[0] for Entry in self.Entries.values())
+
+    def Evict(self) -> None:
+        """Remove the least recently used entries until the blobs fit the size cap."""
+        with self.Lock:
+            Total = self.TotalBytes()
+            for Name in sorted(self.Entries, key=lambda Name: self.Entries[Name][1]):
+                if Total <= self.MaxBytes:
+                    break
+                Total -= self.Entries[Name][0]
+                self.RemoveEntry(Name)
+
+    def RemoveEntry(self, Name: str) -> None:
+        """Forget an entry and delete its blob."""
+        with self.Lock:
+            self.Entries.pop(Name, None)
+            try:
+                os.remove(self.BlobDir / Name)
+            except FileNotFoundError:
+                pass
+
+    def Touch(self, Name: str) -> None:
+        """Mark an entry as just used."""
+        with self.Lock:
+            self.Journal.append(("use", Name))
+            if Name in self.Entries:
+                self.Entries[Name][1] = time.time()
+
+    def AddEntry(self, Name: str, Size: int, Digests: list) -> None:
+        """Record a newly written blob."""
+        with self.Lock:
+            self.Journal.append(("add", Name, Size, Digests))
+            self.Entries[Name] = [Size, time.time(), list(Digests)]
+
+    #
+    # Files
+    #
+
+    def FileDigest(self, FilePath: str) -> Optional[str]:
+        """Return the remembered digest of a file, if it has not changed since."""
+        Known = self.Files.get(os.path.abspath(FilePath))
+        if Known is None:
+            return None
+        try:
+            Stat = os.stat(FilePath)
+        except OSError:
+            return None
+        return Known[2] if [Stat.st_size, Stat.st_mtime_ns] == Known[:2] else None
+
+    def RecordFile(self, FilePath: str, Digest: str) -> None:
+        """Remember the digest of a file as it is now."""
+        Stat = os.stat(FilePath)
+        self.RememberFile(os.path.abspath(FilePath), Stat.st_size, Stat.st_mtime_ns, Digest)
+
+    def RememberFile(self, AbsolutePath: str, Size: int, Modified: int, Digest: str) -> None:
+        """Remember a file's digest; entries for its previous content are dropped."""
+        with self.Lock:
+            self.Journal.append(("file", AbsolutePath, Size, Modified, Digest))
+            Previous = self.Files.get(AbsolutePath)
+            self.Files[AbsolutePath] = [Size, Modified, Digest]
+            if Previous is not None and Previous[2] != Digest:
+                self.Invalidate(Previous[2])
+
+    def Invalidate(self, Digest: str) -> None:
+        """Drop the entries that involve some content, unless a known file still has it."""
+        with self.Lock:
+            if any(Known[2] == Digest for Known in self.Files.values()):
+                return
+            for Name in [Name for Name, Entry in self.Entries.items() if Digest in Entry[2]]:
+                self.RemoveEntry(Name)
+
+    #
+    # Blobs
+    #
+
+    def DiffName(self, LeftDigest: str, RightDigest: str, Options: dict) -> str:
+        """Blob name of the result for a pair of files and the options that shaped it.
+
+        The cache version is part of the key, so opcodes from a version that
+        hashed lines differently are never reused.
+        """
+        Key = hashlib.blake2b(digest_size=20)
+        Key.update(json.dumps([self.Version, LeftDigest, RightDigest, Options], sort_keys=True).encode('utf-8'))
+        return f"diff-{Key.hexdigest()}"
+
+    def ReadBlob(self, Name: str) -> Optional[array]:
+        """Read a blob of 64-bit integers, or None if it is not stored."""
+        Values = array('q')
+        try:
+            with open(self.BlobDir / Name, 'rb') as f:
+                Values.frombytes(f.read())
+        except (OSError, ValueError):
+            return None
+        return Values
+
+    def WriteBlob(self, Name: str, Values: array, Digests: list) -> None:
+        """Write a blob of 64-bit integers and record it."""
+        Temporary = self.BlobDir / f".{Name}.{os.getpid()}.{threading.get_ident()}"
+        with open(Temporary, 'wb') as f:
+            Values.tofile(f)
+        os.replace(Temporary, self.BlobDir / Name)
+        self.AddEntry(Name, len(Values) * Values.itemsize, Digests)
+
+    def LoadDiff(self, LeftDigest: str, RightDigest: str, Options: dict) -> Optional[tuple]:
+        """Return (opcodes, left line offsets, right line offsets) for a pair, or None."""
+        Names = [self.DiffName(LeftDigest, RightDigest, Options), f"lines-{LeftDigest}", f"lines-{RightDigest}"]
+        Blobs = [self.ReadBlob(Name) for Name in Names]
+        if any(Blob is None for Blob in Blobs):
+            return None
+        for Name in Names:
+            self.Touch(Name)
+
+        Packed, LeftOffsets, RightOffsets = Blobs
+        Tags = self.Tags
+        Opcodes = [(Tags[Packed[i]], Packed[i + 1], Packed[i + 2], Packed[i + 3], Packed[i + 4])
+                   for i in range(0, len(Packed), 5)]
+        return Opcodes, LeftOffsets, RightOffsets
+
+    def StoreDiff(self, LeftDigest: str, RightDigest: str, Options: dict, Opcodes: list,
+                  LeftOffsets: array, RightOffsets: array) -> None:
+        """Store the result for a pair, and the line offsets of both files."""
+        for Digest, Offsets in ((LeftDigest, LeftOffsets), (RightDigest, RightOffsets)):
+            if not (self.BlobDir / f"lines-{Digest}").exists():
+                self.WriteBlob(f"lines-{Digest}", Offsets, [Digest])
+
+        Packed = array('q')
+        TagCodes = self.TagCodes
+        for Tag, I1, I2, J1, J2 in Opcodes:
+            Packed.extend((TagCodes[Tag], I1, I2, J1, J2))
+        self.WriteBlob(self.DiffName(LeftDigest, RightDigest, Options), Packed, [LeftDigest, RightDigest])
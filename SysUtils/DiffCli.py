@@ -0,0 +1,512 @@
+# File: DiffCli.py
+# Path: SysUtils/DiffCli.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: Headless file and directory diff for MyDiff
+
+"""
+Diff CLI
+
+This module is the headless counterpart of MyDiff. It uses the same diff engine
+and memory-mapped loader but does not need PySide6, so it runs in CI and on
+servers. It diffs two files, or two directory trees paired by relative path.
+
+In directory mode, files of equal size are hashed before anything else. Pairs
+with identical content are skipped without diffing. The remaining pairs are
+diffed in parallel on a process pool, and results are written in path order as
+they arrive. Output is a unified diff, a JSON document of hunks, or an HTML
+report. A summary of files, changed lines and time spent goes to stderr.
+
+Lines can be compared ignoring trailing whitespace or indentation, and CRLF
+versus LF endings are ignored unless --exact-eol is given. A missing newline at the
+end of a file is always a difference, marked in hunks as diff(1) does. With --structure, YAML
+and JSON pairs are compared key by key (see DiffStructure), and the hunks show
+the flattened key paths rather than the file text.
+
+With --cache, results are kept in the MyDiff diff cache. Files whose size and
+modification time are unchanged since the last run are compared by their
+remembered digests without reading them, and changed pairs whose content was
+diffed before are rendered from the cached opcodes and line offsets.
+
+Exit status is 0 when nothing differs, 1 when something does and 2 on errors,
+as with diff(1).
+"""
+
+import os
+import sys
+import json
+import html
+import time
+import fnmatch
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from DiffEngine import DiffEngine
+from DiffLoader import MappedFile, HashFile
+from DiffCache import DiffCache
+from DiffStructure import StructuredFile
+
+NO_NEWLINE = "\\ No newline at end of file"
+
+def IsBinary(FilePath: str) -> bool:
+    """Treat a file as binary if its first 8 KiB contain a NUL byte."""
+    with open(FilePath, 'rb') as f:
+        return b"\0" in f.read(8192)
+
+def LoadSide(FilePath: Optional[str], Normalize=("eol",)):
+    """Return (lines, line hashes) for a file, or empty ones for a missing side."""
+    if FilePath is None:
+        return [], array('q')
+    Mapped = MappedFile(FilePath, Normalize=Normalize)
+    return Mapped, Mapped.Hashes
+
+def LoadStructured(LeftPath: Optional[str], RightPath: Optional[str]):
+    """Return (left, right) as StructuredFile, or None to compare them as lines."""
+    Paths = [Path for Path in (LeftPath, RightPath) if Path is not None]
+    if not all(StructuredFile.Supports(Path) for Path in Paths):
+        return None
+    try:
+        return tuple(StructuredFile(Path) if Path is not None else [] for Path in (LeftPath, RightPath))
+    except ValueError:
+        return None
+
+def LoadCached(Cache: DiffCache, LeftPath: str, RightPath: str, Digests: list, Options: dict):
+    """Return (left lines, right lines, opcodes) from the diff cache, or None."""
+    Cached = Cache.LoadDiff(*Digests, Options)
+    if Cached is None:
+        return None
+    Opcodes, LeftOffsets, RightOffsets = Cached
+    try:
+        return (MappedFile(LeftPath, Offsets=LeftOffsets, Digest=Digests[0]),
+                MappedFile(RightPath, Offsets=RightOffsets, Digest=Digests[1]), Opcodes)
+    except ValueError:
+        return None  # Changed since it was stat'ed
+
+def HunkLines(Prefix: str, Lines, Start: int, End: int) -> list:
+    """Prefix a range of lines, followed by NO_NEWLINE if it ends with a last line that has none."""
+    Result = [Prefix + Lines[i] for i in range(Start, End)]
+    if Start < End == len(Lines) and getattr(Lines, "MissingNewline", False):
+        Result.append(NO_NEWLINE)
+    return Result
+
+def DiffPair(Task: tuple) -> dict:
+    """Compare one pair of files; runs in a pool worker.
+
+    Args:
+        Task: (relative path, left path or None, right path or None, whether
+            the sizes are equal, remembered left and right digests or None,
+            settings). Settings has algorithm, context, normalize, structural
+            and cache_dir (None for no cache).
+
+    Returns:
+        Result dict with path, status, added, removed, hunks and seconds, and
+        the cache journal when a cache directory is given
+    """
+    RelativePath, LeftPath, RightPath, SameSize, LeftDigest, RightDigest, Settings = Task
+    Start = time.perf_counter()
+    Result = {"path": RelativePath, "status": "changed", "added": 0, "removed": 0, "hunks": []}
+    Cache = DiffCache(Settings["cache_dir"], LoadIndex=False) if Settings["cache_dir"] else None
+    Normalize = Settings["normalize"]
+    Options = {"algorithm": Settings["algorithm"], "normalize": sorted(Normalize)}
+
+    try:
+        if SameSize:
+            if LeftDigest is None:
+                LeftDigest = HashFile(LeftPath)
+                if Cache:
+                    Cache.RecordFile(LeftPath, LeftDigest)
+            if RightDigest is None:
+                RightDigest = HashFile(RightPath)
+                if Cache:
+                    Cache.RecordFile(RightPath, RightDigest)
+
+        if SameSize and LeftDigest == RightDigest:
+            Result["status"] = "identical"
+        elif any(Path is not None and IsBinary(Path) for Path in (LeftPath, RightPath)):
+            Result["status"] = "binary"
+        else:
+            Engine = DiffEngine(Settings["algorithm"])
+            Structured = LoadStructured(LeftPath, RightPath) if Settings["structural"] else None
+            Cached = None
+            if Structured is None and Cache and LeftDigest and RightDigest:
+                Cached = LoadCached(Cache, LeftPath, RightPath, [LeftDigest, RightDigest], Options)
+            if Structured is not None:
+                LeftLines, RightLines = Structured
+                Opcodes = Engine.CompareIds(getattr(LeftLines, "Hashes", array('q')),
+                                            getattr(RightLines, "Hashes", array('q')))
+            elif Cached is not None:
+                LeftLines, RightLines, Opcodes = Cached
+            else:
+                LeftLines, LeftHashes = LoadSide(LeftPath, Normalize)
+                RightLines, RightHashes = LoadSide(RightPath, Normalize)
+                Opcodes = Engine.CompareIds(LeftHashes, RightHashes)
+                if Cache and LeftPath is not None and RightPath is not None:
+                    Cache.RecordFile(LeftPath, LeftLines.Digest)
+                    Cache.RecordFile(RightPath, RightLines.Digest)
+                    Cache.StoreDiff(LeftLines.Digest, RightLines.Digest, Options, Opcodes,
+                                    LeftLines.Offsets, RightLines.Offsets)
+
+            for Group in Engine.GroupOpcodes(Opcodes, Settings["context"]):
+                Lines = []
+                for Tag, I1, I2, J1, J2 in Group:
+                    if Tag == 'equal':
+                        Lines.extend(HunkLines(" ", LeftLines, I1, I2))
+                        continue
+                    Lines.extend(HunkLines("-", LeftLines, I1, I2))
+                    Lines.extend(HunkLines("+", RightLines, J1, J2))
+                    Result["removed"] += I2 - I1
+                    Result["added"] += J2 - J1
+                Result["hunks"].append({
+                    "old_start": Group[0][1] + 1,
+                    "old_lines": Group[-1][2] - Group[0][1],
+                    "new_start": Group[0][3] + 1,
+                    "new_lines": Group[-1][4] - Group[0][3],
+                    "lines": Lines
+                })
+            if not Result["hunks"]:
+                Result["status"] = "identical"  # Differs only in what was normalized away, never a final newline
+
+    except OSError as Ex:
+        Result["status"] = "error"
+        Result["error"] = str(Ex)
+
+    Result["seconds"] = time.perf_counter() - Start
+    if Cache:
+        Result["journal"] = Cache.Journal
+    return Result
+
+class DirectoryPairer:
+    """Pairs the files of two directory trees by relative path."""
+
+    def __init__(self, LeftDir: str, RightDir: str, Excludes: list = None):
+        """Initialize the pairer.
+
+        Args:
+            LeftDir: Original tree
+            RightDir: New tree
+            Excludes: fnmatch patterns for file and directory names to skip
+        """
+        self.LeftDir = LeftDir
+        self.RightDir = RightDir
+        self.Excludes = Excludes or []
+
+    def IsExcluded(self, Name: str) -> bool:
+        """Check a file or directory name against the exclude patterns."""
+        return any(fnmatch.fnmatch(Name, Pattern) for Pattern in self.Excludes)
+
+    def Scan(self, RootDir: str) -> dict:
+        """Return {relative path: size} for every regular file below a directory."""
+        Files = {}
+        Stack = [""]
+        while Stack:
+            RelativeDir = Stack.pop()
+            with os.scandir(os.path.join(RootDir, RelativeDir)) as Entries:
+                for Entry in Entries:
+                    if self.IsExcluded(Entry.name):
+                        continue
+                    RelativePath = os.path.join(RelativeDir, Entry.name)
+                    if Entry.is_dir(follow_symlinks=False):
+                        Stack.append(RelativePath)
+                    elif Entry.is_file():
+                        Files[RelativePath] = Entry.stat().st_size
+        return Files
+
+    def Pairs(self) -> list:
+        """Return sorted (relative path, left size or None, right size or None)."""
+        Left = self.Scan(self.LeftDir)
+        Right = self.Scan(self.RightDir)
+        return [(Path, Left.get(Path), Right.get(Path)) for Path in sorted(set(Left) | set(Right))]
+
+#
+# Output
+#
+
+class UnifiedWriter:
+    """Writes results as a unified diff."""
+
+    def __init__(self, Output, LeftLabel: str, RightLabel: str):
+        self.Output = Output
+        self.LeftLabel = LeftLabel
+        self.RightLabel = RightLabel
+
+    def Begin(self) -> None:
+        pass
+
+    def FormatRange(self, Start: int, Length: int) -> str:
+        """Format a hunk range the way diff -u does."""
+        if Length == 1:
+            return f"{Start}"
+        if not Length:
+            Start -= 1  # An empty range starts before its position
+        return f"{Start},{Length}"
+
+    def WriteFile(self, Result: dict) -> None:
+        Path = Result["path"]
+        Status = Result["status"]
+        if Status == "identical":
+            return
+        if Status == "binary":
+            self.Output.write(f"Binary files {self.LeftLabel}{Path} and {self.RightLabel}{Path} differ\n")
+            return
+        if Status == "error":
+            self.Output.write(f"Error comparing {Path}: {Result['error']}\n")
+            return
+        if Status == "added":
+            self.Output.write(f"Only in {self.RightLabel}: {Path}\n")
+            return
+        if Status == "removed":
+            self.Output.write(f"Only in {self.LeftLabel}: {Path}\n")
+            return
+
+        self.Output.write(f"--- {self.LeftLabel}{Path}\n+++ {self.RightLabel}{Path}\n")
+        for Hunk in Result["hunks"]:
+            self.Output.write(f"@@ -{self.FormatRange(Hunk['old_start'], Hunk['old_lines'])} "
+                              f"+{self.FormatRange(Hunk['new_start'], Hunk['new_lines'])} @@\n")
+            self.Output.write("\n".join(Hunk["lines"]))
+            self.Output.write("\n")
+
+    def End(self, Summary: dict) -> None:
+        pass
+
+class JsonWriter:
+    """Writes results as one JSON document, streaming one file entry at a time."""
+
+    def __init__(self, Output, LeftLabel: str, RightLabel: str):
+        self.Output = Output
+        self.LeftLabel = LeftLabel
+        self.RightLabel = RightLabel
+        self.First = True
+
+    def Begin(self) -> None:
+        self.Output.write('{"left": %s, "right": %s, "files": [' % (json.dumps(self.LeftLabel), json.dumps(self.RightLabel)))
+
+    def WriteFile(self, Result: dict) -> None:
+        if Result["status"] == "identical":
+            return
+        Entry = {Key: Value for Key, Value in Result.items() if Key not in ("seconds", "journal")}
+        self.Output.write(("\n" if self.First else ",\n") + json.dumps(Entry, ensure_ascii=False))
+        self.First = False
+
+    def End(self, Summary: dict) -> None:
+        self.Output.write('\n], "summary": %s}\n' % json.dumps(Summary))
+
+class HtmlWriter:
+    """Writes results as a standalone HTML report."""
+
+    LineClasses = {" ": "same", "-": "removed", "+": "added", "\\": "hunk"}
+
+    def __init__(self, Output, LeftLabel: str, RightLabel: str):
+        self.Output = Output
+        self.LeftLabel = LeftLabel
+        self.RightLabel = RightLabel
+
+    def Begin(self) -> None:
+        Title = html.escape(f"{self.LeftLabel} vs {self.RightLabel}")
+        self.Output.write(f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{Title}</title>
+<style>
+body {{ font-family: sans-serif; background: #1e1e1e; color: #ddd; }}
+pre {{ margin: 0 0 1em 0; }}
+.hunk {{ color: darkgray; }} .same {{ color: white; }} .removed {{ color: red; }} .added {{ color: green; }}
+</style></head><body>
+<h1>{Title}</h1>
+""")
+
+    def WriteFile(self, Result: dict) -> None:
+        if Result["status"] == "identical":
+            return
+        Path = html.escape(Result["path"])
+        if Result["status"] != "changed":
+            Note = html.escape(Result.get("error", Result["status"]))
+            self.Output.write(f"<h2>{Path}</h2>\n<p>{Note}</p>\n")
+            return
+
+        self.Output.write(f"<h2>{Path} <small>+{Result['added']} -{Result['removed']}</small></h2>\n<pre>")
+        for Hunk in Result["hunks"]:
+            self.Output.write(f"<span class='hunk'>@@ -{Hunk['old_start']},{Hunk['old_lines']} +{Hunk['new_start']},{Hunk['new_lines']} @@</span>\n")
+            for Line in Hunk["lines"]:
+                self.Output.write(f"<span class='{self.LineClasses[Line[0]]}'>{html.escape(Line)}</span>\n")
+        self.Output.write("</pre>\n")
+
+    def End(self, Summary: dict) -> None:
+        Rows = "".join(f"<tr><td>{html.escape(str(Key))}</td><td>{html.escape(str(Value))}</td></tr>" for Key, Value in Summary.items())
+        self.Output.write(f"<h2>Summary</h2>\n<table>{Rows}</table>\n</body></html>\n")
+
+WRITERS = {"unified": UnifiedWriter, "json": JsonWriter, "html": HtmlWriter}
+
+#
+# Runner
+#
+
+class DiffRunner:
+    """Diffs two files or two directory trees and writes the results."""
+
+    def __init__(self, Algorithm: str = "myers", Context: int = 3, Jobs: Optional[int] = None,
+                 NewFile: bool = False, Excludes: list = None, Cache: Optional[DiffCache] = None,
+                 Normalize=("eol",), Structural: bool = False):
+        """Initialize the runner.
+
+        Args:
+            Algorithm: Diff algorithm (see DiffEngine.Algorithms)
+            Context: Lines of context around each change
+            Jobs: Worker processes for directory diffs (default: CPU count)
+            NewFile: Diff files present on one side only against an empty file
+            Excludes: fnmatch patterns for names to skip in directory diffs
+            Cache: Diff cache to look up and store results in
+            Normalize: Normalization modes for line hashes (see DiffLoader.NORMALIZE_MODES)
+            Structural: Compare YAML and JSON pairs key by key
+        """
+        self.Algorithm = Algorithm
+        self.Context = Context
+        self.Jobs = Jobs or os.cpu_count() or 1
+        self.NewFile = NewFile
+        self.Excludes = Excludes or []
+        self.Cache = Cache
+        self.Settings = {
+            "algorithm": Algorithm,
+            "context": Context,
+            "normalize": tuple(Normalize),
+            "structural": Structural,
+            "cache_dir": str(Cache.CacheDir) if Cache else None
+        }
+        self.Counts = {"identical": 0, "changed": 0, "added": 0, "removed": 0, "binary": 0, "error": 0}
+        self.LinesAdded = 0
+        self.LinesRemoved = 0
+        self.WorkerSeconds = 0.0
+
+    def Record(self, Result: dict) -> dict:
+        """Add a result to the running totals and apply its cache journal."""
+        if self.Cache:
+            self.Cache.Apply(Result.pop("journal", []))
+        self.Counts[Result["status"]] += 1
+        self.LinesAdded += Result.get("added", 0)
+        self.LinesRemoved += Result.get("removed", 0)
+        self.WorkerSeconds += Result.get("seconds", 0.0)
+        return Result
+
+    def Tasks(self, LeftDir: str, RightDir: str):
+        """Yield (result, None) for settled entries and (None, task) for pairs to diff."""
+        for RelativePath, LeftSize, RightSize in DirectoryPairer(LeftDir, RightDir, self.Excludes).Pairs():
+            LeftPath = os.path.join(LeftDir, RelativePath) if LeftSize is not None else None
+            RightPath = os.path.join(RightDir, RelativePath) if RightSize is not None else None
+
+            if (LeftPath is None or RightPath is None) and not self.NewFile:
+                yield {"path": RelativePath, "status": "removed" if RightPath is None else "added"}, None
+            else:
+                yield None, self.Task(RelativePath, LeftPath, RightPath, LeftSize == RightSize)
+
+    def Task(self, RelativePath: str, LeftPath: Optional[str], RightPath: Optional[str], SameSize: bool) -> tuple:
+        """Build the DiffPair task for a pair, with digests the cache still knows."""
+        if self.Cache is None:
+            return (RelativePath, LeftPath, RightPath, SameSize, None, None, self.Settings)
+        LeftDigest = self.Cache.FileDigest(LeftPath) if LeftPath else None
+        RightDigest = self.Cache.FileDigest(RightPath) if RightPath else None
+        return (RelativePath, LeftPath, RightPath, SameSize, LeftDigest, RightDigest, self.Settings)
+
+    def Run(self, Left: str, Right: str, Writer) -> dict:
+        """Diff Left against Right, write every result and return the summary."""
+        Start = time.perf_counter()
+        Writer.Begin()
+
+        if os.path.isdir(Left) and os.path.isdir(Right):
+            Entries = list(self.Tasks(Left, Right))
+            Tasks = [Task for _, Task in Entries if Task is not None]
+
+            with ProcessPoolExecutor(max_workers=min(self.Jobs, max(1, len(Tasks)))) as Pool:
+                Results = Pool.map(DiffPair, Tasks, chunksize=max(1, len(Tasks) // (self.Jobs * 8)))
+                for Settled, Task in Entries:
+                    Writer.WriteFile(self.Record(Settled if Task is None else next(Results)))
+        else:
+            Task = self.Task("", Left, Right, os.path.getsize(Left) == os.path.getsize(Right))
+            Writer.WriteFile(self.Record(DiffPair(Task)))
+
+        if self.Cache:
+            try:
+                self.Cache.Save()
+            except OSError as Ex:
+                print(f"Warning: could not save the diff cache: {Ex}", file=sys.stderr)
+
+        Summary = dict(self.Counts)
+        Summary["files"] = sum(self.Counts.values())
+        Summary["lines_added"] = self.LinesAdded
+        Summary["lines_removed"] = self.LinesRemoved
+        Summary["seconds"] = round(time.perf_counter() - Start, 3)
+        Summary["worker_seconds"] = round(self.WorkerSeconds, 3)
+        Writer.End(Summary)
+        return Summary
+
+    def Differs(self) -> bool:
+        """Check whether anything differed in the last run."""
+        return any(self.Counts[Status] for Status in ("changed", "added", "removed", "binary"))
+
+def Main():
+    """Main entry point for the headless diff."""
+    Parser = argparse.ArgumentParser(description="Diff two files or two directory trees without the GUI")
+    Parser.add_argument("Left", help="Original file or directory")
+    Parser.add_argument("Right", help="New file or directory")
+    Parser.add_argument("--algorithm", dest="Algorithm", choices=DiffEngine.Algorithms, default="myers",
+                        help="Diff algorithm (default: myers)")
+    Parser.add_argument("--format", dest="Format", choices=sorted(WRITERS), default="unified",
+                        help="Output format (default: unified)")
+    Parser.add_argument("-U", "--context", dest="Context", type=int, default=3,
+                        help="Lines of context (default: 3)")
+    Parser.add_argument("-j", "--jobs", dest="Jobs", type=int, default=None,
+                        help="Worker processes for directory diffs (default: CPU count)")
+    Parser.add_argument("-N", "--new-file", dest="NewFile", action="store_true",
+                        help="Diff files present on one side only against an empty file")
+    Parser.add_argument("--exclude", dest="Excludes", action="append", default=[],
+                        help="Skip files and directories whose name matches this pattern (repeatable)")
+    Parser.add_argument("--exact-eol", dest="ExactEol", action="store_true",
+                        help="Count CRLF and LF line endings as different")
+    Parser.add_argument("-Z", "--ignore-trailing-space", dest="IgnoreTrailing", action="store_true",
+                        help="Ignore whitespace at the end of lines")
+    Parser.add_argument("--ignore-indent", dest="IgnoreIndent", action="store_true",
+                        help="Ignore whitespace at the start of lines")
+    Parser.add_argument("--structure", dest="Structural", action="store_true",
+                        help="Compare YAML and JSON files key by key")
+    Parser.add_argument("--cache", dest="Cache", action="store_true",
+                        help="Reuse and store results in the diff cache")
+    Parser.add_argument("--cache-dir", dest="CacheDir", default=None,
+                        help="Diff cache directory (implies --cache; default: ~/.cache/mydiff)")
+    Parser.add_argument("-o", "--output", dest="Output", help="Write the diff to this file instead of stdout")
+    Args = Parser.parse_args()
+
+    for Path in (Args.Left, Args.Right):
+        if not os.path.exists(Path):
+            print(f"Error: {Path} does not exist.", file=sys.stderr)
+            sys.exit(2)
+    if os.path.isdir(Args.Left) != os.path.isdir(Args.Right):
+        print("Error: compare two files or two directories.", file=sys.stderr)
+        sys.exit(2)
+
+    # Result paths are relative to the directories, or empty for a file pair
+    IsDirectory = os.path.isdir(Args.Left)
+    LeftLabel = os.path.join(Args.Left, "") if IsDirectory else Args.Left
+    RightLabel = os.path.join(Args.Right, "") if IsDirectory else Args.Right
+
+    Cache = DiffCache(Args.CacheDir) if Args.Cache or Args.CacheDir else None
+    Normalize = [Mode for Mode, Enabled in (("eol", not Args.ExactEol), ("trailing", Args.IgnoreTrailing),
+                                            ("indent", Args.IgnoreIndent)) if Enabled]
+    Runner = DiffRunner(Args.Algorithm, Args.Context, Args.Jobs, Args.NewFile, Args.Excludes, Cache,
+                        Normalize, Args.Structural)
+    Output = open(Args.Output, 'w', encoding='utf-8') if Args.Output else sys.stdout
+    try:
+        Summary = Runner.Run(Args.Left, Args.Right, WRITERS[Args.Format](Output, LeftLabel, RightLabel))
+    finally:
+        if Args.Output:
+            Output.close()
+
+    print(f"{Summary['files']} files: {Summary['changed']} changed, {Summary['added']} added, "
+          f"{Summary['removed']} removed, {Summary['identical']} identical, {Summary['binary']} binary, "
+          f"{Summary['error']} errors; +{Summary['lines_added']} -{Summary['lines_removed']} lines "
+          f"in {Summary['seconds']:.2f}s ({Summary['worker_seconds']:.2f}s in workers)", file=sys.stderr)
+
+    if Summary["error"]:
+        sys.exit(2)
+    sys.exit(1 if Runner.Differs() else 0)
+
+if __name__ == '__main__':
+    Main()
@@ -0,0 +1,489 @@
+# File: DiffEngine.py
+# Path: SysUtils/DiffEngine.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  06:40PM
+# Description: Pluggable line diff algorithms for MyDiff
+
+"""
+Diff Engine
+
+This module computes line diffs for MyDiff. Lines are interned to integer IDs
+first, so the algorithms compare ints instead of strings and each distinct line
+is hashed once. CompareIds also accepts any integer sequences directly, such as
+the line hash arrays of a DiffLoader.MappedFile. Four algorithms are available:
+
+    myers       Myers O(ND) with linear-space middle snakes (the default)
+    patience    Anchors on lines unique to both sides, Myers between anchors
+    histogram   Anchors on the rarest common lines, Myers for crowded regions
+    difflib     difflib.SequenceMatcher, kept as a fallback
+
+Every algorithm produces matching blocks, which are turned into difflib-style
+opcodes (tag, i1, i2, j1, j2). Common prefixes and suffixes are trimmed before
+any algorithm runs. Myers also drops lines that do not occur on the other side
+at all, and caps the edit cost it searches for, so large unrelated regions
+degrade to a plain replacement instead of a quadratic search.
+
+Cancel() may be called from another thread; a running comparison then stops at
+its next step and raises DiffCancelled.
+"""
+
+import math
+import difflib
+import threading
+from bisect import bisect_left
+from itertools import compress, count, islice
+from operator import sub
+from typing import List, Optional, Sequence, Tuple
+
+Opcode = Tuple[str, int, int, int, int]
+Block = Tuple[int, int, int]
+
+class DiffCancelled(Exception):
+    """Raised by a comparison that was cancelled."""
+
+class DiffEngine:
+    """Computes line diffs with a selectable algorithm."""
+
+    Algorithms = ("myers", "patience", "histogram", "difflib")
+
+    def __init__(self, Algorithm: str = "myers", MaxChain: int = 64):
+        """Initialize the diff engine.
+
+        Args:
+            Algorithm: One of DiffEngine.Algorithms
+            MaxChain: Histogram only; lines occurring more often than this
+                are not used as anchors
+        """
+        if Algorithm not in self.Algorithms:
+            raise ValueError(f"Unknown diff algorithm: {Algorithm} (choose from {', '.join(self.Algorithms)})")
+        self.Algorithm = Algorithm
+        self.MaxChain = MaxChain
+        self.Table = {}
+        self.CancelEvent = threading.Event()
+
+    def Cancel(self) -> None:
+        """Ask a running comparison to stop."""
+        self.CancelEvent.set()
+
+    def CheckCancelled(self) -> None:
+        """Raise DiffCancelled if Cancel() was called."""
+        if self.CancelEvent.is_set():
+            raise DiffCancelled()
+
+    #
+    # Interning
+    #
+
+    def Intern(self, Lines: Sequence) -> List[int]:
+        """Map lines to integer IDs shared by every sequence interned by this engine."""
+        Table = self.Table
+        return [Table.setdefault(Line, len(Table)) for Line in Lines]
+
+    def Compare(self, LeftLines: Sequence, RightLines: Sequence) -> List[Opcode]:
+        """Diff two sequences of lines and return opcodes."""
+        return self.CompareIds(self.Intern(LeftLines), self.Intern(RightLines))
+
+    def CompareIds(self, Left: Sequence[int], Right: Sequence[int]) -> List[Opcode]:
+        """Diff two sequences of line IDs and return opcodes."""
+        return self.BlocksToOpcodes(self.MatchingBlocks(Left, Right), len(Left), len(Right))
+
+    #
+    # Matching Blocks
+    #
+
+    def MatchingBlocks(self, Left: Sequence[int], Right: Sequence[int]) -> List[Block]:
+        """Return sorted (i, j, length) blocks of matching lines."""
+        if self.Algorithm == "difflib":
+            return [Block for Block in difflib.SequenceMatcher(None, Left, Right).get_matching_blocks() if Block[2]]
+
+        # Trim the common prefix and suffix, comparing whole slices first
+        Start = 0
+        End = min(len(Left), len(Right))
+        Step = 4096
+        while Start + Step <= End and Left[Start:Start + Step] == Right[Start:Start + Step]:
+            Start += Step
+        while Start < End and Left[Start] == Right[Start]:
+            Start += 1
+        Suffix = 0
+        while Suffix + Step <= End - Start and Left[len(Left) - Suffix - Step:len(Left) - Suffix] == Right[len(Right) - Suffix - Step:len(Right) - Suffix]:
+            Suffix += Step
+        while Suffix < End - Start and Left[-1 - Suffix] == Right[-1 - Suffix]:
+            Suffix += 1
+
+        Blocks = []
+        if Start:
+            Blocks.append((0, 0, Start))
+
+        a1, b1 = len(Left) - Suffix, len(Right) - Suffix
+        if self.Algorithm == "myers":
+            Blocks.extend(self.MyersBlocks(Left, Start, a1, Right, Start, b1))
+        elif self.Algorithm == "patience":
+            Blocks.extend(self.PatienceBlocks(Left, Start, a1, Right, Start, b1))
+        else:
+            Blocks.extend(self.HistogramBlocks(Left, Start, a1, Right, Start, b1))
+
+        if Suffix:
+            Blocks.append((a1, b1, Suffix))
+        return self.MergeBlocks(Blocks)
+
+    def MergeBlocks(self, Blocks: List[Block]) -> List[Block]:
+        """Sort blocks and join the ones that touch."""
+        Merged = []
+        for i, j, n in sorted(Blocks):
+            if not n:
+                continue
+            if Merged and Merged[-1][0] + Merged[-1][2] == i and Merged[-1][1] + Merged[-1][2] == j:
+                Merged[-1] = (Merged[-1][0], Merged[-1][1], Merged[-1][2] + n)
+            else:
+                Merged.append((i, j, n))
+        return Merged
+
+    def BlocksToOpcodes(self, Blocks: List[Block], LeftLength: int, RightLength: int) -> List[Opcode]:
+        """Convert matching blocks to difflib-style opcodes."""
+        Opcodes = []
+        i = j = 0
+        for BlockI, BlockJ, Length in list(Blocks) + [(LeftLength, RightLength, 0)]:
+            if i < BlockI and j < BlockJ:
+                Opcodes.append(("replace", i, BlockI, j, BlockJ))
+            elif i < BlockI:
+                Opcodes.append(("delete", i, BlockI, j, j))
+            elif j < BlockJ:
+                Opcodes.append(("insert", i, i, j, BlockJ))
+            if Length:
+                Opcodes.append(("equal", BlockI, BlockI + Length, BlockJ, BlockJ + Length))
+            i, j = BlockI + Length, BlockJ + Length
+        return Opcodes
+
+    def GroupOpcodes(self, Opcodes: List[Opcode], Context: int = 3) -> List[List[Opcode]]:
+        """Split opcodes into hunks with up to Context lines of context around changes.
+
+        Same grouping as difflib.SequenceMatcher.get_grouped_opcodes.
+        """
+        if not Opcodes:
+            return []
+        Codes = list(Opcodes)
+
+        # Trim the leading and trailing context
+        if Codes[0][0] == 'equal':
+            Tag, I1, I2, J1, J2 = Codes[0]
+            Codes[0] = (Tag, max(I1, I2 - Context), I2, max(J1, J2 - Context), J2)
+        if Codes[-1][0] == 'equal':
+            Tag, I1, I2, J1, J2 = Codes[-1]
+            Codes[-1] = (Tag, I1, min(I2, I1 + Context), J1, min(J2, J1 + Context))
+
+        Groups = []
+        Group = []
+        for Tag, I1, I2, J1, J2 in Codes:
+            # Split at long runs of unchanged lines
+            if Tag == 'equal' and I2 - I1 > Context * 2:
+                Group.append((Tag, I1, min(I2, I1 + Context), J1, min(J2, J1 + Context)))
+                Groups.append(Group)
+                Group = []
+                I1, J1 = max(I1, I2 - Context), max(J1, J2 - Context)
+            Group.append((Tag, I1, I2, J1, J2))
+        if Group and not (len(Group) == 1 and Group[0][0] == 'equal'):
+            Groups.append(Group)
+        return [Group for Group in Groups if any(Code[0] != 'equal' for Code in Group)]
+
+    #
+    # Myers
+    #
+
+    def MyersBlocks(self, Left: Sequence[int], a0: int, a1: int, Right: Sequence[int], b0: int, b1: int) -> List[Block]:
+        """Myers diff of Left[a0:a1] against Right[b0:b1]."""
+        if a0 >= a1 or b0 >= b1:
+            return []
+
+        # Lines that never occur on the other side cannot match; diff the rest
+        LeftSlice = Left[a0:a1]
+        RightSlice = Right[b0:b1]
+        LeftKeep = self.MembershipMask(LeftSlice, RightSlice)
+        RightKeep = self.MembershipMask(RightSlice, LeftSlice)
+        A = list(compress(LeftSlice, LeftKeep))
+        B = list(compress(RightSlice, RightKeep))
+        if not A or not B:
+            return []
+        LeftMap = list(compress(range(a0, a1), LeftKeep))
+        RightMap = list(compress(range(b0, b1), RightKeep))
+        MaxCost = max(256, int(math.sqrt(len(A) + len(B))))
+
+        # Positions after which a map skips dropped lines; blocks must split there
+        LeftBreaks = list(compress(count(), map((1).__ne__, map(sub, islice(LeftMap, 1, None), LeftMap))))
+        RightBreaks = list(compress(count(), map((1).__ne__, map(sub, islice(RightMap, 1, None), RightMap))))
+
+        # Map blocks back to the original positions
+        Blocks = []
+        for i, j, n in self.MyersCompressed(A, B, MaxCost):
+            Offsets = {Break - i for Break in LeftBreaks[bisect_left(LeftBreaks, i):bisect_left(LeftBreaks, i + n - 1)]}
+            Offsets.update(Break - j for Break in RightBreaks[bisect_left(RightBreaks, j):bisect_left(RightBreaks, j + n - 1)])
+            Start = 0
+            for Offset in sorted(Offsets) + [n - 1]:
+                Blocks.append((LeftMap[i + Start], RightMap[j + Start], Offset + 1 - Start))
+                Start = Offset + 1
+        return self.MergeBlocks(Blocks)
+
+    def MembershipMask(self, Values: Sequence[int], Other: Sequence[int]) -> List[bool]:
+        """Return, for each value, whether it occurs in Other.
+
+        Works in slices so no single call holds the GIL for long, which keeps a
+        GUI thread responsive while a worker thread diffs large files.
+        """
+        Step = 65536
+        OtherSet = set()
+        for Start in range(0, len(Other), Step):
+            OtherSet.update(Other[Start:Start + Step])
+        Mask = []
+        for Start in range(0, len(Values), Step):
+            Mask.extend(map(OtherSet.__contains__, Values[Start:Start + Step]))
+        return Mask
+
+    def MyersCompressed(self, A: List[int], B: List[int], MaxCost: int) -> List[Block]:
+        """Divide and conquer over middle snakes; returns blocks in A/B coordinates."""
+        Blocks = []
+        Stack = [(0, len(A), 0, len(B))]
+        while Stack:
+            self.CheckCancelled()
+            Left, Right, Top, Bottom = Stack.pop()
+
+            # Shrink the box past matching lines at either end
+            Head = 0
+            while Left + Head < Right and Top + Head < Bottom and A[Left + Head] == B[Top + Head]:
+                Head += 1
+            Blocks.append((Left, Top, Head))
+            Left += Head
+            Top += Head
+            Tail = 0
+            while Left < Right - Tail and Top < Bottom - Tail and A[Right - 1 - Tail] == B[Bottom - 1 - Tail]:
+                Tail += 1
+            Right -= Tail
+            Bottom -= Tail
+            Blocks.append((Right, Bottom, Tail))
+            if Left >= Right or Top >= Bottom:
+                continue
+
+            Snake = self.MiddleSnake(A, B, Left, Right, Top, Bottom, MaxCost)
+            if Snake is None:
+                continue  # Nothing worth matching; the box is a replacement
+
+            StartX, StartY, EndX, EndY, Match = Snake
+            if Match:
+                Blocks.append(Match)
+            Stack.append((EndX, Right, EndY, Bottom))
+            Stack.append((Left, StartX, Top, StartY))
+        return self.MergeBlocks(Blocks)
+
+    def MiddleSnake(self, A: List[int], B: List[int], Left: int, Right: int, Top: int, Bottom: int, MaxCost: int) -> Optional[tuple]:
+        """Find the middle snake of a box.
+
+        Returns (start x, start y, end x, end y, block or None). The snake runs from
+        the start point through at most one edit and a diagonal to the end point, so
+        the boxes before and after it are both strictly smaller than this one.
+        """
+        Width = Right - Left
+        Height = Bottom - Top
+        Delta = Width - Height
+        Odd = Delta & 1
+        Limit = (Width + Height + 1) // 2
+        Forward = [0] * (2 * Limit + 2)
+        Backward = [0] * (2 * Limit + 2)
+        Forward[1] = Left
+        Backward[1] = Bottom
+
+        for d in range(Limit + 1):
+            for k in range(d, -d - 1, -2):
+                c = k - Delta
+                if k == -d or (k != d and Forward[k - 1] < Forward[k + 1]):
+                    PreviousX = x = Forward[k + 1]
+                else:
+                    PreviousX = Forward[k - 1]
+                    x = PreviousX + 1
+                y = Top + (x - Left) - k
+                PreviousY = y if d == 0 or x != PreviousX else y - 1
+
+                SlideX, SlideY = x, y
+                while x < Right and y < Bottom and A[x] == B[y]:
+                    x += 1
+                    y += 1
+                Forward[k] = x
+
+                if Odd and -(d - 1) <= c <= d - 1 and y >= Backward[c]:
+                    Match = (SlideX, SlideY, x - SlideX) if x > SlideX else None
+                    return (PreviousX, PreviousY, x, y, Match)
+
+            for c in range(d, -d - 1, -2):
+                k = c + Delta
+                if c == -d or (c != d and Backward[c - 1] > Backward[c + 1]):
+                    PreviousY = y = Backward[c + 1]
+                else:
+                    PreviousY = Backward[c - 1]
+                    y = PreviousY - 1
+                x = Left + (y - Top) + k
+                PreviousX = x if d == 0 or y != PreviousY else x + 1
+
+                SlideX, SlideY = x, y
+                while x > Left and y > Top and A[x - 1] == B[y - 1]:
+                    x -= 1
+                    y -= 1
+                Backward[c] = y
+
+                if not Odd and -d <= k <= d and x <= Forward[k]:
+                    Match = (x, y, SlideX - x) if SlideX > x else None
+                    return (x, y, PreviousX, PreviousY, Match)
+
+            if d >= MaxCost:
+                return self.CostLimitSplit(Forward, d, Left, Right, Top, Bottom, Delta)
+
+        return None
+
+    def CostLimitSplit(self, Forward: List[int], d: int, Left: int, Right: int, Top: int, Bottom: int, Delta: int) -> Optional[tuple]:
+        """Split an expensive box at the furthest forward point instead of searching on."""
+        Best = None
+        for k in range(d, -d - 1, -2):
+            x = Forward[k]
+            y = Top + (x - Left) - k
+            if Left <= x <= Right and Top <= y <= Bottom and (Best is None or x + y > Best[0] + Best[1]):
+                Best = (x, y)
+
+        if Best is None or Best in ((Left, Top), (Right, Bottom)):
+            return None
+        return (Best[0], Best[1], Best[0], Best[1], None)
+
+    #
+    # Patience
+    #
+
+    def PatienceBlocks(self, Left: Sequence[int], a0: int, a1: int, Right: Sequence[int], b0: int, b1: int) -> List[Block]:
+        """Patience diff of Left[a0:a1] against Right[b0:b1]."""
+        Blocks = []
+        Stack = [(a0, a1, b0, b1)]
+        while Stack:
+            self.CheckCancelled()
+            a0, a1, b0, b1 = Stack.pop()
+            Head = 0
+            while a0 + Head < a1 and b0 + Head < b1 and Left[a0 + Head] == Right[b0 + Head]:
+                Head += 1
+            Blocks.append((a0, b0, Head))
+            a0 += Head
+            b0 += Head
+            Tail = 0
+            while a0 < a1 - Tail and b0 < b1 - Tail and Left[a1 - 1 - Tail] == Right[b1 - 1 - Tail]:
+                Tail += 1
+            a1 -= Tail
+            b1 -= Tail
+            Blocks.append((a1, b1, Tail))
+            if a0 >= a1 or b0 >= b1:
+                continue
+
+            Anchors = self.UniqueAnchors(Left, a0, a1, Right, b0, b1)
+            if not Anchors:
+                Blocks.extend(self.MyersBlocks(Left, a0, a1, Right, b0, b1))
+                continue
+
+            # Recurse into the gaps between anchors
+            PreviousI, PreviousJ = a0, b0
+            for i, j in Anchors:
+                Blocks.append((i, j, 1))
+                Stack.append((PreviousI, i, PreviousJ, j))
+                PreviousI, PreviousJ = i + 1, j + 1
+            Stack.append((PreviousI, a1, PreviousJ, b1))
+        return self.MergeBlocks(Blocks)
+
+    def UniqueAnchors(self, Left: Sequence[int], a0: int, a1: int, Right: Sequence[int], b0: int, b1: int) -> List[Tuple[int, int]]:
+        """Longest increasing run of lines that occur exactly once on both sides."""
+        Counts = {}
+        for i in range(a0, a1):
+            Entry = Counts.get(Left[i])
+            Counts[Left[i]] = [i, None, 1, 0] if Entry is None else [Entry[0], None, Entry[2] + 1, 0]
+        for j in range(b0, b1):
+            Entry = Counts.get(Right[j])
+            if Entry is not None:
+                Entry[1] = j
+                Entry[3] += 1
+
+        Pairs = sorted((Entry[0], Entry[1]) for Entry in Counts.values() if Entry[2] == 1 and Entry[3] == 1)
+        if not Pairs:
+            return []
+
+        # Patience sorting on the right-hand positions
+        Tails = []
+        TailIndex = []
+        Parents = [None] * len(Pairs)
+        for Index, (_, j) in enumerate(Pairs):
+            Pile = bisect_left(Tails, j)
+            if Pile == len(Tails):
+                Tails.append(j)
+                TailIndex.append(Index)
+            else:
+                Tails[Pile] = j
+                TailIndex[Pile] = Index
+            Parents[Index] = TailIndex[Pile - 1] if Pile else None
+
+        Anchors = []
+        Index = TailIndex[-1]
+        while Index is not None:
+            Anchors.append(Pairs[Index])
+            Index = Parents[Index]
+        Anchors.reverse()
+        return Anchors
+
+    #
+    # Histogram
+    #
+
+    def HistogramBlocks(self, Left: Sequence[int], a0: int, a1: int, Right: Sequence[int], b0: int, b1: int) -> List[Block]:
+        """Histogram diff of Left[a0:a1] against Right[b0:b1]."""
+        Blocks = []
+        Stack = [(a0, a1, b0, b1)]
+        while Stack:
+            self.CheckCancelled()
+            a0, a1, b0, b1 = Stack.pop()
+            if a0 >= a1 or b0 >= b1:
+                continue
+
+            Occurrences = {}
+            for i in range(a0, a1):
+                Occurrences.setdefault(Left[i], []).append(i)
+
+            Best = None
+            BestCount = self.MaxChain + 1
+            HasCommon = False
+            j = b0
+            while j < b1:
+                Positions = Occurrences.get(Right[j])
+                if Positions is None:
+                    j += 1
+                    continue
+                HasCommon = True
+                if len(Positions) > BestCount:
+                    j += 1
+                    continue
+
+                NextJ = j + 1
+                for i in Positions:
+                    StartI, StartJ = i, j
+                    while StartI > a0 and StartJ > b0 and Left[StartI - 1] == Right[StartJ - 1]:
+                        StartI -= 1
+                        StartJ -= 1
+                    EndI, EndJ = i + 1, j + 1
+                    while EndI < a1 and EndJ < b1 and Left[EndI] == Right[EndJ]:
+                        EndI += 1
+                        EndJ += 1
+
+                    Count = len(Positions)
+                    if Best is None or Count < BestCount or (Count == BestCount and EndI - StartI > Best[2]):
+                        Best = (StartI, StartJ, EndI - StartI)
+                        BestCount = Count
+                    NextJ = max(NextJ, EndJ)
+                j = NextJ
+
+            if Best is None:
+                if HasCommon:
+                    Blocks.extend(self.MyersBlocks(Left, a0, a1, Right, b0, b1))
+                continue
+
+            i, j, n = Best
+            Blocks.append(Best)
+            Stack.append((i + n, a1, j + n, b1))
+            Stack.append((a0, i, b0, j))
+        return self.MergeBlocks(Blocks)
@@ -0,0 +1,173 @@
+# File: DiffLoader.py
+# Path: SysUtils/DiffLoader.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:59PM
+# Description: Memory-mapped file loading with a line index for MyDiff
+
+"""
+Diff Loader
+
+This module opens files for MyDiff without reading them into Python strings.
+MappedFile memory-maps a file and makes one pass over it in large blocks,
+recording the offset where each line starts and a 64-bit hash of each line.
+Both live in compact arrays (16 bytes per line), and the hashes are what the
+diff engine compares. Line text is only decoded when something asks for a
+particular line, such as a view showing the rows on screen.
+
+Line hashes are taken on a normalized form of each line. By default only a
+trailing carriage return is ignored ("eol"), so CRLF and LF files compare the way
+they did when MyDiff read files in text mode. Trailing whitespace ("trailing") and
+indentation ("indent") can be ignored as well. Normalizing is done with bytes
+methods mapped over each block, and never changes the text that is shown. A last
+line without a newline is hashed with one appended, which no other line can
+contain, so a missing final newline is always a difference. The hashes use
+Python's hash() and are only comparable within one process. A mapped file must not be truncated
+while it is open.
+
+The same pass computes a BLAKE2b digest of the whole file, which is what the diff
+cache is keyed on. A file can also be mapped with line offsets from the cache, in
+which case it is not read at all and has no line hashes.
+"""
+
+import os
+import mmap
+import hashlib
+from array import array
+from itertools import accumulate, islice
+from operator import methodcaller, sub
+from typing import Callable, Optional
+
+StripCarriageReturn = methodcaller("removesuffix", b"\r")
+
+NORMALIZE_MODES = ("eol", "trailing", "indent")
+
+def LineNormalizers(Normalize) -> list:
+    """Return the bytes functions to apply to each line, in order, for a set of modes."""
+    Trailing = "trailing" in Normalize
+    Indent = "indent" in Normalize
+    if Trailing and Indent:
+        return [bytes.strip]
+    if Trailing:
+        return [bytes.rstrip]
+    if Indent:
+        return [bytes.lstrip, StripCarriageReturn] if "eol" in Normalize else [bytes.lstrip]
+    return [StripCarriageReturn] if "eol" in Normalize else []
+
+DIGEST_SIZE = 20
+
+def HashFile(FilePath: str) -> str:
+    """Return the BLAKE2b digest of a file, as MappedFile.Digest computes it."""
+    Digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(FilePath, 'rb') as f:
+        for Chunk in iter(lambda: f.read(1024 * 1024), b""):
+            Digest.update(Chunk)
+    return Digest.hexdigest()
+
+class MappedFile:
+    """A read-only memory-mapped file with line offset and line hash indexes."""
+
+    BlockSize = 8 * 1024 * 1024
+
+    def __init__(self, FilePath: str, Progress: Optional[Callable[[int, int], None]] = None,
+                 Offsets: Optional[array] = None, Digest: Optional[str] = None, Normalize=("eol",)):
+        """Map a file and index its lines.
+
+        Args:
+            FilePath: File to open
+            Progress: Called with (bytes indexed, total bytes) after each block;
+                it may raise to abort loading
+            Offsets: Line offsets from an earlier index of the same content. The
+                file is then not scanned, and Hashes is left empty.
+            Digest: Content digest that goes with Offsets
+            Normalize: Modes from NORMALIZE_MODES to apply before hashing lines
+
+        Raises:
+            ValueError: Offsets do not end at the size of the file
+        """
+        self.FilePath = FilePath
+        self.Normalizers = LineNormalizers(Normalize)
+        self.File = open(FilePath, 'rb')
+        try:
+            self.Size = os.fstat(self.File.fileno()).st_size
+            self.Map = mmap.mmap(self.File.fileno(), 0, access=mmap.ACCESS_READ) if self.Size else b""
+            self.Hashes = array('q')
+            if Offsets is not None:
+                if not Offsets or Offsets[0] != 0 or Offsets[-1] != self.Size:
+                    raise ValueError(f"Line offsets do not match {FilePath}")
+                self.Offsets = Offsets
+                self.Digest = Digest
+            else:
+                self.Offsets = array('q', [0])
+                self.BuildIndex(Progress)
+        except BaseException:
+            self.Close()
+            raise
+
+    def BuildIndex(self, Progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Record line start offsets, line hashes and the content digest in a single pass."""
+        Digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        Position = 0
+        Carry = b""
+        while Position < self.Size:
+            Chunk = self.Map[Position:Position + self.BlockSize]
+            Position += len(Chunk)
+            Digest.update(Chunk)
+
+            # Everything after the last newline is carried into the next block
+            Block = Carry + Chunk
+            Lines = Block.split(b"\n")
+            Carry = Lines.pop()
+
+            Ends = accumulate(map((1).__add__, map(len, Lines)), initial=self.Offsets[-1])
+            self.Offsets.extend(islice(Ends, 1, None))
+            self.Hashes.extend(map(hash, self.NormalizeLines(Lines, b"\r" in Block)))
+
+            if Progress:
+                Progress(Position, self.Size)
+
+        # The last line has no newline; hash it with one so it differs from the terminated line
+        if Carry:
+            self.Offsets.append(self.Size)
+            self.Hashes.extend(hash(Line + b"\n") for Line in self.NormalizeLines([Carry], b"\r" in Carry))
+        self.Digest = Digest.hexdigest()
+
+    def NormalizeLines(self, Lines: list, HasCarriageReturn: bool):
+        """Lazily apply the normalizers to a list of lines."""
+        if self.Normalizers == [StripCarriageReturn] and not HasCarriageReturn:
+            return Lines  # Nothing to strip in this block
+        for Normalizer in self.Normalizers:
+            Lines = map(Normalizer, Lines)
+        return Lines
+
+    def __len__(self) -> int:
+        return len(self.Offsets) - 1
+
+    def __getitem__(self, Index: int) -> str:
+        """Return the text of a line without its line ending."""
+        return self.LineBytes(Index).decode('utf-8', errors='replace')
+
+    def LineBytes(self, Index: int) -> bytes:
+        """Return the bytes of a line without its line ending."""
+        if Index < 0:
+            Index += len(self)
+        Line = self.Map[self.Offsets[Index]:self.Offsets[Index + 1]]
+        return StripCarriageReturn(Line.removesuffix(b"\n"))
+
+    @property
+    def MissingNewline(self) -> bool:
+        """Whether the last line of the file has no line ending."""
+        return self.Size > 0 and self.Map[self.Size - 1] != ord("\n")
+
+    def MaxLineLength(self) -> int:
+        """Length in bytes of the longest line, including its line ending."""
+        if not len(self):
+            return 0
+        return max(map(sub, islice(self.Offsets, 1, None), self.Offsets))
+
+    def Close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self.Map, mmap.mmap):
+            self.Map.close()
+        self.Map = b""
+        self.File.close()
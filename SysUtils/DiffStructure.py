@@ -0,0 +1,103 @@
+# File: DiffStructure.py
+# Path: SysUtils/DiffStructure.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  07:50PM
+# Description: Structural YAML and JSON comparison for MyDiff
+
+"""
+Diff Structure
+
+This module lets MyDiff compare YAML and JSON files by their parsed content
+rather than their text. A file is parsed and flattened to one line per scalar
+value, written as a jq-style key path and the value in JSON:
+
+    .site.title: "AIDEV-WEB"
+    .nav[0].url: "/docs/"
+    .exclude: []
+
+Mapping keys are sorted, so reordered keys, reindentation, quoting style and
+flow versus block style all compare equal. Line hashes leave out list indexes,
+so an item inserted into a list shows up as added lines rather than shifting
+every item after it. StructuredFile has the same interface as MappedFile for the
+diff panes and DiffCli.
+"""
+
+import re
+import json
+from array import array
+from pathlib import Path
+
+import yaml
+
+class StructuredFile:
+    """A YAML or JSON file flattened to one line per scalar value."""
+
+    Formats = {".json": "json", ".yaml": "yaml", ".yml": "yaml"}
+    PlainKey = re.compile(r'[\w-]+')
+
+    @classmethod
+    def Supports(cls, FilePath: str) -> bool:
+        """Check whether a file has a YAML or JSON extension."""
+        return Path(FilePath).suffix.lower() in cls.Formats
+
+    def __init__(self, FilePath: str):
+        """Parse and flatten a file.
+
+        Args:
+            FilePath: YAML or JSON file
+
+        Raises:
+            ValueError: The file cannot be decoded or parsed
+        """
+        self.FilePath = FilePath
+        self.Lines = []
+        self.Keys = []
+        with open(FilePath, 'r', encoding='utf-8') as f:
+            Text = f.read()
+
+        if self.Formats.get(Path(FilePath).suffix.lower()) == "json":
+            Root = json.loads(Text)
+        else:
+            try:
+                Documents = list(yaml.safe_load_all(Text))
+            except yaml.YAMLError as Ex:
+                raise ValueError(f"Cannot parse {FilePath}: {Ex}") from Ex
+            Root = Documents[0] if len(Documents) == 1 else Documents
+
+        self.Flatten(Root, ".", ".")
+        self.Hashes = array('q', map(hash, self.Keys))
+        del self.Keys
+
+    def FormatKey(self, Key) -> str:
+        """Write a mapping key as a path component, quoting it unless it is plain."""
+        Key = str(Key)
+        return Key if self.PlainKey.fullmatch(Key) else json.dumps(Key, ensure_ascii=False)
+
+    def Flatten(self, Value, Path: str, StablePath: str) -> None:
+        """Append the lines for a value; StablePath is Path without list indexes."""
+        Separator = "" if Path == "." else "."
+        if isinstance(Value, dict) and Value:
+            for Key in sorted(Value, key=str):
+                Name = self.FormatKey(Key)
+                self.Flatten(Value[Key], f"{Path}{Separator}{Name}", f"{StablePath}{Separator}{Name}")
+        elif isinstance(Value, list) and Value:
+            for Index, Item in enumerate(Value):
+                self.Flatten(Item, f"{Path}[{Index}]", f"{StablePath}[]")
+        else:
+            Text = json.dumps(Value, ensure_ascii=False, default=str)
+            self.Lines.append(f"{Path}: {Text}")
+            self.Keys.append(f"{StablePath}: {Text}")
+
+    def __len__(self) -> int:
+        return len(self.Lines)
+
+    def __getitem__(self, Index: int) -> str:
+        return self.Lines[Index]
+
+    def MaxLineLength(self) -> int:
+        """Length of the longest line, in characters."""
+        return max(map(len, self.Lines), default=0)
+
+    def Close(self) -> None:
+        """Nothing to release; present for MappedFile compatibility."""
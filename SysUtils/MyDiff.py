@@ -2,15 +2,339 @@
 # Path: SysUtils/MyDiff.py
 # Standard: AIDEV-PascalCase-1.6
 # Created: 2025-03-20
-# Last Modified: 2025-03-20  10:30AM
+# Last Modified: 2026-10-17  11:59PM
 # Description: File diff generation tool with GUI interface
 
 import sys
-from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QFileDialog, QLabel
-from PySide6.QtGui import QColor, QFont, QFontDatabase
-from PySide6.QtCore import Qt
+import argparse
+from array import array
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView, QHeaderView, QAbstractItemView, QFileDialog, QLabel, QProgressBar, QStyledItemDelegate, QStyle, QCheckBox
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QFontMetrics
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, QAbstractListModel, QModelIndex, QSize
 
-import difflib
+from DiffEngine import DiffEngine, DiffCancelled
+from DiffLoader import MappedFile
+from DiffCache import DiffCache
+from DiffStructure import StructuredFile
+
+# Diff record operations
+OP_EQUAL = 0
+OP_DELETE = 1
+OP_INSERT = 2
+
+# Pane text colors, as in the original HTML rendering
+PANE_COLORS = {"Original": QColor("green"), "New": QColor("red")}
+OP_COLORS = {OP_EQUAL: QColor("white"), OP_DELETE: QColor("red"), OP_INSERT: QColor("green")}
+OP_PREFIXES = {OP_EQUAL: "  ", OP_DELETE: "1: ", OP_INSERT: "2: "}
+NO_NEWLINE_SUFFIX = "  \\ No newline at end of file"
+MESSAGE_COLOR = QColor("darkgray")
+BACKGROUND_COLOR = QColor("#1e1e1e")
+
+class DiffRecords:
+    """A diff as parallel compact arrays of (op, left line index, right line index)."""
+
+    def __init__(self):
+        """Initialize an empty record list."""
+        self.Ops = array('b')
+        self.Left = array('i')
+        self.Right = array('i')
+
+    def __len__(self):
+        return len(self.Ops)
+
+    def AddOpcode(self, Tag, I1, I2, J1, J2):
+        """Append the records for one difflib-style opcode."""
+        if Tag == 'equal':
+            self.Ops.extend(array('b', [OP_EQUAL]) * (I2 - I1))
+            self.Left.extend(range(I1, I2))
+            self.Right.extend(range(J1, J2))
+            return
+        self.Ops.extend(array('b', [OP_DELETE]) * (I2 - I1))
+        self.Left.extend(range(I1, I2))
+        self.Right.extend(array('i', [-1]) * (I2 - I1))
+        self.Ops.extend(array('b', [OP_INSERT]) * (J2 - J1))
+        self.Left.extend(array('i', [-1]) * (J2 - J1))
+        self.Right.extend(range(J1, J2))
+
+    def Extend(self, Other):
+        """Append another record list."""
+        self.Ops.extend(Other.Ops)
+        self.Left.extend(Other.Left)
+        self.Right.extend(Other.Right)
+
+class DiffListModel(QAbstractListModel):
+    """
+    List model for one pane.
+
+    Rows are produced on demand from the mapped files and the diff records, so
+    the view only ever decodes and formats the rows it is showing.
+    """
+
+    def __init__(self, Pane, Parent=None):
+        """Initialize the model for the "Original", "New" or "Diff" pane."""
+        super().__init__(Parent)
+        self.Pane = Pane
+        self.LeftLines = []
+        self.RightLines = []
+        self.Records = DiffRecords()
+        self.Message = None
+        self.MaxChars = 0
+
+    def Clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self.LeftLines = []
+        self.RightLines = []
+        self.Records = DiffRecords()
+        self.Message = None
+        self.MaxChars = 0
+        self.endResetModel()
+
+    def SetLines(self, LeftLines, RightLines, MaxChars):
+        """Set the lines of both files."""
+        self.beginResetModel()
+        self.LeftLines = LeftLines
+        self.RightLines = RightLines
+        self.MaxChars = MaxChars + (3 + len(NO_NEWLINE_SUFFIX) if self.Pane == "Diff" else 0)
+        self.endResetModel()
+
+    def SetMessage(self, Message):
+        """Show a single message row instead of the pane content."""
+        self.beginResetModel()
+        self.Message = Message
+        self.MaxChars = len(Message)
+        self.endResetModel()
+
+    def AppendRecords(self, Records):
+        """Append a batch of diff records."""
+        if not len(Records):
+            return
+        First = len(self.Records)
+        self.beginInsertRows(QModelIndex(), First, First + len(Records) - 1)
+        self.Records.Extend(Records)
+        self.endInsertRows()
+
+    def rowCount(self, Parent=QModelIndex()):
+        if Parent.isValid():
+            return 0
+        if self.Message is not None:
+            return 1
+        if self.Pane == "Original":
+            return len(self.LeftLines)
+        if self.Pane == "New":
+            return len(self.RightLines)
+        return len(self.Records)
+
+    def LineText(self, Lines, Index):
+        """Text of a diff row's line, marking a last line that has no newline."""
+        if Index == len(Lines) - 1 and getattr(Lines, "MissingNewline", False):
+            return Lines[Index] + NO_NEWLINE_SUFFIX
+        return Lines[Index]
+
+    def data(self, Index, Role=Qt.DisplayRole):
+        if not Index.isValid():
+            return None
+        Row = Index.row()
+
+        if Role == Qt.DisplayRole:
+            if self.Message is not None:
+                return self.Message
+            if self.Pane == "Original":
+                return self.LeftLines[Row]
+            if self.Pane == "New":
+                return self.RightLines[Row]
+            Op = self.Records.Ops[Row]
+            if Op == OP_INSERT:
+                return OP_PREFIXES[Op] + self.LineText(self.RightLines, self.Records.Right[Row])
+            return OP_PREFIXES[Op] + self.LineText(self.LeftLines, self.Records.Left[Row])
+
+        if Role == Qt.ForegroundRole:
+            if self.Message is not None:
+                return MESSAGE_COLOR
+            if self.Pane in PANE_COLORS:
+                return PANE_COLORS[self.Pane]
+            return OP_COLORS[self.Records.Ops[Row]]
+
+        return None
+
+class DiffLineDelegate(QStyledItemDelegate):
+    """Paints one pane row as a single line of colored monospace text."""
+
+    def __init__(self, Font, Parent=None):
+        """Initialize the delegate with the pane font."""
+        super().__init__(Parent)
+        self.Font = Font
+        self.Metrics = QFontMetrics(Font)
+
+    def paint(self, Painter, Option, Index):
+        Painter.save()
+        if Option.state & QStyle.State_Selected:
+            Painter.fillRect(Option.rect, Option.palette.highlight())
+        else:
+            Painter.fillRect(Option.rect, BACKGROUND_COLOR)
+        Painter.setFont(self.Font)
+        Painter.setPen(Index.data(Qt.ForegroundRole))
+        Painter.drawText(Option.rect.adjusted(4, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, Index.data(Qt.DisplayRole))
+        Painter.restore()
+
+    def LineWidth(self, MaxChars):
+        """Pixel width of a row holding MaxChars characters."""
+        return self.Metrics.horizontalAdvance("M") * MaxChars + 8
+
+    def sizeHint(self, Option, Index):
+        # All rows share one size, wide enough for the longest line
+        return QSize(self.LineWidth(Index.model().MaxChars), self.Metrics.height())
+
+class DiffSignals(QObject):
+    """Signals emitted by a DiffWorker; connected slots run on the GUI thread."""
+
+    Progress = Signal(int, str)             # Percent (-1 while busy), stage
+    Loaded = Signal(object, object, int)    # Original and new MappedFile, longest line length
+    Records = Signal(object)                # DiffRecords batch
+    Finished = Signal(int)                  # Number of diff records
+    Failed = Signal(str, bool)              # Message, whether it applies to every pane
+    Cancelled = Signal()
+
+class DiffWorker(QRunnable):
+    """
+    Reads and diffs two files on a thread pool thread.
+
+    Both files are memory-mapped and indexed rather than read into strings. The
+    file panes are filled as soon as both are indexed, and the diff is sent to
+    the GUI in batches of records while the worker keeps going. A pair that is
+    in the diff cache is mapped with its cached line offsets and not read.
+
+    Lines are hashed after the Normalize modes are applied (see DiffLoader). In
+    structural mode, a pair of YAML or JSON files is compared as flattened parse
+    trees (see DiffStructure); other pairs, and files that do not parse, fall
+    back to comparing lines.
+    """
+
+    BatchRecords = 65536
+
+    def __init__(self, File1Path, File2Path, Algorithm="myers", Cache=None, Normalize=("eol",), Structural=False):
+        """Initialize the worker; call QThreadPool.start() to run it."""
+        super().__init__()
+        self.File1Path = File1Path
+        self.File2Path = File2Path
+        self.Engine = DiffEngine(Algorithm)
+        self.Cache = Cache
+        self.Normalize = tuple(Normalize)
+        self.Structural = Structural
+        self.Options = {"algorithm": Algorithm, "normalize": sorted(self.Normalize)}
+        self.Signals = DiffSignals()
+
+    def Cancel(self):
+        """Ask the worker to stop at its next step."""
+        self.Engine.Cancel()
+
+    def LoadFile(self, FilePath, ProgressStart, ProgressEnd, Stage):
+        """Map and index a file, reporting progress."""
+        def Progress(Done, Size):
+            self.Engine.CheckCancelled()
+            self.Signals.Progress.emit(ProgressStart + (ProgressEnd - ProgressStart) * Done // max(1, Size), Stage)
+
+        return MappedFile(FilePath, Progress, Normalize=self.Normalize)
+
+    def LoadStructured(self):
+        """Return both files as StructuredFile, or None to compare them as lines."""
+        if not (StructuredFile.Supports(self.File1Path) and StructuredFile.Supports(self.File2Path)):
+            return None
+        self.Signals.Progress.emit(-1, "Parsing")
+        try:
+            return StructuredFile(self.File1Path), StructuredFile(self.File2Path)
+        except ValueError:
+            return None
+
+    def LoadCached(self):
+        """Return (original file, new file, opcodes) from the diff cache, or None."""
+        if self.Cache is None:
+            return None
+        Digests = [self.Cache.FileDigest(self.File1Path), self.Cache.FileDigest(self.File2Path)]
+        if None in Digests:
+            return None
+        Cached = self.Cache.LoadDiff(*Digests, self.Options)
+        if Cached is None:
+            return None
+
+        Opcodes, Offsets1, Offsets2 = Cached
+        try:
+            File1 = MappedFile(self.File1Path, Offsets=Offsets1, Digest=Digests[0])
+        except ValueError:
+            return None  # Changed since it was stat'ed
+        try:
+            File2 = MappedFile(self.File2Path, Offsets=Offsets2, Digest=Digests[1])
+        except ValueError:
+            File1.Close()
+            return None
+        try:
+            self.Cache.Save()  # Keep the entries' last use for eviction
+        except OSError:
+            pass
+        return File1, File2, Opcodes
+
+    def StoreCached(self, File1, File2, Opcodes):
+        """Add a result to the diff cache; a cache that cannot be written is skipped."""
+        if self.Cache is None:
+            return
+        try:
+            self.Cache.RecordFile(self.File1Path, File1.Digest)
+            self.Cache.RecordFile(self.File2Path, File2.Digest)
+            self.Cache.StoreDiff(File1.Digest, File2.Digest, self.Options, Opcodes, File1.Offsets, File2.Offsets)
+            self.Cache.Save()
+        except OSError:
+            pass
+
+    def EmitRecords(self, Opcodes):
+        """Convert opcodes to records and send them in batches; return the record count."""
+        Batch = DiffRecords()
+        Count = 0
+        for Index, Opcode in enumerate(Opcodes):
+            Batch.AddOpcode(*Opcode)
+            if len(Batch) >= self.BatchRecords:
+                self.Engine.CheckCancelled()
+                self.Signals.Progress.emit(60 + 40 * Index // len(Opcodes), "Building diff")
+                self.Signals.Records.emit(Batch)
+                Count += len(Batch)
+                Batch = DiffRecords()
+        self.Signals.Records.emit(Batch)
+        return Count + len(Batch)
+
+    def run(self):
+        """Index both files, fill the file panes, diff them and fill the diff pane."""
+        try:
+            Structured = self.LoadStructured() if self.Structural else None
+            Cached = self.LoadCached() if Structured is None else None
+            if Structured is not None:
+                File1, File2 = Structured
+                self.Signals.Loaded.emit(File1, File2, max(File1.MaxLineLength(), File2.MaxLineLength()))
+                self.Signals.Progress.emit(-1, "Comparing")
+                Opcodes = self.Engine.CompareIds(File1.Hashes, File2.Hashes)
+            elif Cached is not None:
+                File1, File2, Opcodes = Cached
+                MaxChars = max(File1.MaxLineLength(), File2.MaxLineLength())
+                self.Signals.Loaded.emit(File1, File2, MaxChars)
+            else:
+                File1 = self.LoadFile(self.File1Path, 0, 20, "Indexing original file")
+                File2 = self.LoadFile(self.File2Path, 20, 40, "Indexing new file")
+
+                MaxChars = max(File1.MaxLineLength(), File2.MaxLineLength())
+                self.Signals.Loaded.emit(File1, File2, MaxChars)
+
+                self.Signals.Progress.emit(-1, "Comparing")
+                Opcodes = self.Engine.CompareIds(File1.Hashes, File2.Hashes)
+                self.StoreCached(File1, File2, Opcodes)
+
+            Count = self.EmitRecords(Opcodes)
+            self.Signals.Progress.emit(100, "Done")
+            self.Signals.Finished.emit(Count)
+
+        except DiffCancelled:
+            self.Signals.Cancelled.emit()
+        except FileNotFoundError:
+            self.Signals.Failed.emit("Error: One or both files not found.", True)
+        except Exception as e:
+            self.Signals.Failed.emit(f"Error: {str(e)}", False)
 
 class DiffWindow(QWidget):
     """
@@ -20,13 +344,27 @@ class DiffWindow(QWidget):
     generating a diff between them, and visualizing the differences.
     """
     
-    def __init__(self):
-        """Initialize the diff window with UI components."""
+    def __init__(self, Algorithm="myers", UseCache=True, Normalize=("eol",), Structural=False):
+        """Initialize the diff window with UI components.
+
+        Args:
+            Algorithm: Diff algorithm to use (see DiffEngine.Algorithms)
+            UseCache: Keep diff results in the on-disk diff cache
+            Normalize: Initial normalization modes (see DiffLoader.NORMALIZE_MODES)
+            Structural: Initially compare YAML and JSON files by structure
+        """
         super().__init__()
         self.setWindowTitle("File Diff Generator")
 
         self.File1Path = ""
         self.File2Path = ""
+        self.Algorithm = Algorithm
+        self.Cache = None
+        if UseCache:
+            try:
+                self.Cache = DiffCache()
+            except OSError:
+                pass  # Diff without a cache if its directory cannot be created
 
         # Widgets
         self.File1Button = QPushButton("Select Original File")
@@ -35,13 +373,31 @@ class DiffWindow(QWidget):
         self.File2Label = QLabel("New File: Not selected")
         self.GenerateButton = QPushButton("Generate Diff")
         self.GenerateButton.setEnabled(False)  # Disable initially
+        self.CancelButton = QPushButton("Cancel")
+        self.CancelButton.setEnabled(False)
+        self.ProgressBar = QProgressBar()
+        self.ProgressBar.setRange(0, 100)
+        self.ProgressBar.setValue(0)
+        self.ProgressBar.setFormat("Idle")
+        self.EolCheck = QCheckBox("Ignore line endings")
+        self.EolCheck.setChecked("eol" in Normalize)
+        self.TrailingCheck = QCheckBox("Ignore trailing whitespace")
+        self.TrailingCheck.setChecked("trailing" in Normalize)
+        self.IndentCheck = QCheckBox("Ignore indentation")
+        self.IndentCheck.setChecked("indent" in Normalize)
+        self.StructureCheck = QCheckBox("Compare YAML/JSON structure")
+        self.StructureCheck.setChecked(Structural)
+
+        self.ThreadPool = QThreadPool.globalInstance()
+        self.Worker = None
 
-        self.OriginalText = QTextEdit()
-        self.OriginalText.setReadOnly(True)
-        self.NewText = QTextEdit()
-        self.NewText.setReadOnly(True)
-        self.DiffText = QTextEdit()
-        self.DiffText.setReadOnly(True)
+        Font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        self.OriginalModel = DiffListModel("Original", self)
+        self.NewModel = DiffListModel("New", self)
+        self.DiffModel = DiffListModel("Diff", self)
+        self.OriginalText = self.CreatePane(self.OriginalModel, Font)
+        self.NewText = self.CreatePane(self.NewModel, Font)
+        self.DiffText = self.CreatePane(self.DiffModel, Font)
 
         self.OriginalHideButton = QPushButton("Hide Original")
         self.NewHideButton = QPushButton("Hide New")
@@ -58,6 +414,17 @@ class DiffWindow(QWidget):
         FileLayout.addWidget(self.File2Button)
         FileLayout.addWidget(self.File2Label)
 
+        RunLayout = QHBoxLayout()
+        RunLayout.addWidget(self.GenerateButton)
+        RunLayout.addWidget(self.CancelButton)
+        RunLayout.addWidget(self.ProgressBar)
+
+        OptionLayout = QHBoxLayout()
+        OptionLayout.addWidget(self.EolCheck)
+        OptionLayout.addWidget(self.TrailingCheck)
+        OptionLayout.addWidget(self.IndentCheck)
+        OptionLayout.addWidget(self.StructureCheck)
+
         HideLayout = QHBoxLayout()
         HideLayout.addWidget(self.OriginalHideButton)
         HideLayout.addWidget(self.NewHideButton)
@@ -75,7 +442,8 @@ class DiffWindow(QWidget):
 
         MainLayout = QVBoxLayout()
         MainLayout.addLayout(FileLayout)
-        MainLayout.addWidget(self.GenerateButton)
+        MainLayout.addLayout(RunLayout)
+        MainLayout.addLayout(OptionLayout)
         MainLayout.addLayout(HideLayout)
         MainLayout.addLayout(self.TextLabelLayout)
         MainLayout.addLayout(self.DisplayLayout)
@@ -86,6 +454,7 @@ class DiffWindow(QWidget):
         self.File1Button.clicked.connect(self.SelectFile1)
         self.File2Button.clicked.connect(self.SelectFile2)
         self.GenerateButton.clicked.connect(self.GenerateDiff)
+        self.CancelButton.clicked.connect(self.CancelDiff)
 
         self.OriginalHideButton.clicked.connect(self.ToggleOriginal)
         self.NewHideButton.clicked.connect(self.ToggleNew)
@@ -114,43 +483,118 @@ class DiffWindow(QWidget):
         else:
             self.GenerateButton.setEnabled(False)
 
+    def CreatePane(self, Model, Font):
+        """Create a view that shows one pane model.
+
+        A single-column QTableView with fixed row heights never measures or lays
+        out rows one by one, so even millions of rows load instantly.
+        """
+        View = QTableView()
+        View.setModel(Model)
+        Delegate = DiffLineDelegate(Font, View)
+        View.setItemDelegate(Delegate)
+        View.horizontalHeader().hide()
+        View.horizontalHeader().setStretchLastSection(True)
+        View.verticalHeader().hide()
+        View.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        View.verticalHeader().setDefaultSectionSize(Delegate.Metrics.height())
+        View.setShowGrid(False)
+        View.setWordWrap(False)
+        View.setSelectionBehavior(QAbstractItemView.SelectRows)
+        View.setStyleSheet(f"QTableView {{ background: {BACKGROUND_COLOR.name()}; }}")
+        return View
+
     def GenerateDiff(self):
-        """Generate and display the diff between the two selected files."""
-        try:
-            with open(self.File1Path, 'r') as F1:
-                File1Lines = F1.readlines()
-            with open(self.File2Path, 'r') as F2:
-                File2Lines = F2.readlines()
-
-            # Display original and new files with specified colors
-            self.OriginalText.setHtml(f"<pre><span style='color: green;'>{''.join(File1Lines)}</span></pre>")
-            self.NewText.setHtml(f"<pre><span style='color: red;'>{''.join(File2Lines)}</span></pre>")
-
-            Diff = difflib.Differ().compare(File1Lines, File2Lines)
-            DiffText = ""
-            for Line in Diff:
-                if Line.startswith('  '):
-                    DiffText += f"<span style='color: white;'>  {Line[2:]}</span>"  # Common lines
-                elif Line.startswith('- '):
-                    DiffText += f"<span style='color: red;'>1: {Line[2:]}</span>"  # File 1 lines
-                elif Line.startswith('+ '):
-                    DiffText += f"<span style='color: green;'>2: {Line[2:]}</span>"  # File 2 lines
-                elif Line.startswith('? '):
-                    DiffText += f"<span style='color: yellow;'>? {Line[2:]}</span>"  # Questionable lines
-                else:
-                    DiffText += f"<span style='color: darkgray;'>{Line}</span>"  # Other lines (e.g. ---, +++)
-
-            if not DiffText:
-                self.DiffText.setText("No differences found.")
-            else:
-                self.DiffText.setHtml(f"<pre>{DiffText}</pre>")
+        """Start diffing the two selected files on a background thread."""
+        self.CancelDiff()
 
-        except FileNotFoundError:
-            self.OriginalText.setText("Error: One or both files not found.")
-            self.NewText.setText("Error: One or both files not found.")
-            self.DiffText.setText("Error: One or both files not found.")
-        except Exception as e:
-            self.DiffText.setText(f"Error: {str(e)}")
+        for Model in (self.OriginalModel, self.NewModel, self.DiffModel):
+            Model.Clear()
+
+        Normalize = [Mode for Mode, Check in (("eol", self.EolCheck), ("trailing", self.TrailingCheck),
+                                              ("indent", self.IndentCheck)) if Check.isChecked()]
+        self.Worker = DiffWorker(self.File1Path, self.File2Path, self.Algorithm, self.Cache,
+                                 Normalize, self.StructureCheck.isChecked())
+        self.Worker.Signals.Progress.connect(self.OnProgress)
+        self.Worker.Signals.Loaded.connect(self.OnLoaded)
+        self.Worker.Signals.Records.connect(self.OnRecords)
+        self.Worker.Signals.Finished.connect(self.OnFinished)
+        self.Worker.Signals.Failed.connect(self.OnFailed)
+        self.Worker.Signals.Cancelled.connect(self.OnCancelled)
+
+        self.CancelButton.setEnabled(True)
+        self.ThreadPool.start(self.Worker)
+
+    def CancelDiff(self):
+        """Cancel the running diff, if any."""
+        if self.Worker is not None:
+            self.Worker.Cancel()
+            self.Worker = None
+        self.CancelButton.setEnabled(False)
+
+    def IsCurrentWorker(self):
+        """Check whether a signal came from the worker of the latest diff."""
+        return self.Worker is not None and self.sender() is self.Worker.Signals
+
+    def OnProgress(self, Percent, Stage):
+        """Update the progress bar; a negative percent shows a busy indicator."""
+        if not self.IsCurrentWorker():
+            return
+        if Percent < 0:
+            self.ProgressBar.setRange(0, 0)
+        else:
+            self.ProgressBar.setRange(0, 100)
+            self.ProgressBar.setValue(Percent)
+        self.ProgressBar.setFormat(f"{Stage} %p%")
+
+    def OnLoaded(self, File1, File2, MaxChars):
+        """Show both files as soon as they are indexed."""
+        if not self.IsCurrentWorker():
+            return
+        for Model, View in ((self.OriginalModel, self.OriginalText), (self.NewModel, self.NewText), (self.DiffModel, self.DiffText)):
+            Model.SetLines(File1, File2, MaxChars)
+            View.setColumnWidth(0, View.itemDelegate().LineWidth(Model.MaxChars))
+
+    def OnRecords(self, Records):
+        """Append a batch of diff records to the diff pane."""
+        if not self.IsCurrentWorker():
+            return
+        self.DiffModel.AppendRecords(Records)
+
+    def OnFinished(self, Count):
+        """Show the final state of a completed diff."""
+        if not self.IsCurrentWorker():
+            return
+        if not Count:
+            self.DiffModel.SetMessage("No differences found.")
+        self.Worker = None
+        self.CancelButton.setEnabled(False)
+        self.ProgressBar.setFormat("Done")
+
+    def OnFailed(self, Message, AllPanes):
+        """Show an error from the worker."""
+        if not self.IsCurrentWorker():
+            return
+        Models = (self.OriginalModel, self.NewModel, self.DiffModel) if AllPanes else (self.DiffModel,)
+        for Model in Models:
+            Model.SetMessage(Message)
+        self.Worker = None
+        self.CancelButton.setEnabled(False)
+        self.ProgressBar.setRange(0, 100)
+        self.ProgressBar.setFormat("Failed")
+
+    def OnCancelled(self):
+        """Reset the progress bar after a cancelled diff."""
+        if self.Worker is None:
+            self.ProgressBar.setRange(0, 100)
+            self.ProgressBar.setValue(0)
+            self.ProgressBar.setFormat("Cancelled")
+
+    def closeEvent(self, Event):
+        """Stop any running diff before the window closes."""
+        self.CancelDiff()
+        self.ThreadPool.waitForDone()
+        super().closeEvent(Event)
 
     def ToggleOriginal(self):
         """Toggle visibility of the original file pane."""
@@ -188,8 +632,25 @@ class DiffWindow(QWidget):
 
 def Main():
     """Main entry point for the application."""
-    App = QApplication(sys.argv)
-    Window = DiffWindow()
+    Parser = argparse.ArgumentParser(description="File diff generation tool")
+    Parser.add_argument("--algorithm", dest="Algorithm", choices=DiffEngine.Algorithms, default="myers",
+                        help="Diff algorithm (default: myers)")
+    Parser.add_argument("--no-cache", dest="UseCache", action="store_false",
+                        help="Do not read or write the on-disk diff cache")
+    Parser.add_argument("--exact-eol", dest="ExactEol", action="store_true",
+                        help="Count CRLF and LF line endings as different")
+    Parser.add_argument("-Z", "--ignore-trailing-space", dest="IgnoreTrailing", action="store_true",
+                        help="Ignore whitespace at the end of lines")
+    Parser.add_argument("--ignore-indent", dest="IgnoreIndent", action="store_true",
+                        help="Ignore whitespace at the start of lines")
+    Parser.add_argument("--structure", dest="Structural", action="store_true",
+                        help="Compare YAML and JSON files key by key")
+    Args, QtArgs = Parser.parse_known_args()
+
+    Normalize = [Mode for Mode, Enabled in (("eol", not Args.ExactEol), ("trailing", Args.IgnoreTrailing),
+                                            ("indent", Args.IgnoreIndent)) if Enabled]
+    App = QApplication(sys.argv[:1] + QtArgs)
+    Window = DiffWindow(Args.Algorithm, Args.UseCache, Normalize, Args.Structural)
     Window.show()
     sys.exit(App.exec())
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# File: test_site_builder.py
+# Path: tests/test_site_builder.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  11:58PM
+# Description: Tests for the site builder's watch mode and search stage
+
+"""
+Site Builder Tests
+
+These tests drive SiteBuilder.Watch with a scripted watcher in place of
+SiteWatcher, so each rebuild happens synchronously and the test decides which
+files change between them.
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from contextlib import redirect_stdout
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Scripts"))
+
+import site_builder
+from site_builder import SiteBuilder
+
+class ScriptedWatcher:
+    """Stands in for SiteWatcher, running one edit before each reported change."""
+
+    Backend = "scripted"
+    Edits = []
+
+    def __init__(self, RootDir, IgnoreDirs=None):
+        self.RootDir = Path(RootDir)
+
+    def Watch(self, Callback) -> None:
+        for Edit in self.Edits:
+            Callback({str(Edit())})
+        raise KeyboardInterrupt
+
+    def Close(self) -> None:
+        pass
+
+class WatchTests(unittest.TestCase):
+    """SiteBuilder.Watch keeps running across failed rebuilds."""
+
+    def setUp(self):
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.SourceDir = Path(self.TempDir.name) / "docs"
+        (self.SourceDir / "_docs").mkdir(parents=True)
+        (self.SourceDir / "_config.yml").write_text("title: Test\ncollections:\n  docs:\n    output: true\n")
+        self.PagePath = self.SourceDir / "_docs" / "page.md"
+        self.PagePath.write_text("---\ntitle: Page\n---\nfirst\n")
+        self.OriginalWatcher = site_builder.SiteWatcher
+        site_builder.SiteWatcher = ScriptedWatcher
+
+    def tearDown(self):
+        site_builder.SiteWatcher = self.OriginalWatcher
+        self.TempDir.cleanup()
+
+    def WritePage(self, Body: str):
+        """Return an edit that rewrites the page with Body."""
+        def Edit():
+            self.PagePath.write_text(f"---\ntitle: Page\n---\n{Body}\n")
+            return self.PagePath
+        return Edit
+
+    def testWatchSurvivesTemplateError(self):
+        Builder = SiteBuilder(str(self.SourceDir))
+        Builder.Build()
+        ScriptedWatcher.Edits = [self.WritePage("{% if x %}unclosed"), self.WritePage("second")]
+
+        Output = io.StringIO()
+        with redirect_stdout(Output):
+            Builder.Watch()
+
+        self.assertIn("Rebuild failed (page.md)", Output.getvalue())
+        self.assertIn("missing {% endif %}", Output.getvalue())
+        self.assertIn("Stopped watching", Output.getvalue())
+        self.assertIn("second", (Builder.DestinationDir / "docs" / "page.html").read_text())
+
+class SearchIndexTests(unittest.TestCase):
+    """The search stage writes what the default layout loads."""
+
+    def testEmptySearchWritesClientAndManifest(self):
+        with tempfile.TemporaryDirectory() as TempDir:
+            SourceDir = Path(TempDir) / "docs"
+            SourceDir.mkdir()
+            (SourceDir / "_config.yml").write_text("title: Test\nsearch_enabled: true\n")
+            (SourceDir / "index.md").write_text("---\nlayout: default\ntitle: Home\n---\nhello\n")
+
+            Builder = SiteBuilder(str(SourceDir))
+            with redirect_stdout(io.StringIO()):
+                Builder.Build()
+                Builder.Build()
+
+            self.assertIn("search-index.js", (Builder.DestinationDir / "index.html").read_text())
+            self.assertTrue((Builder.DestinationDir / "assets" / "js" / "search-index.js").exists())
+            Manifest = (Builder.DestinationDir / "assets" / "js" / "search" / "manifest.json").read_text()
+            self.assertIn('"sections":0', Manifest)
+
+if __name__ == "__main__":
+    unittest.main()